@@ -1,18 +1,24 @@
 #!/usr/bin/env python3
 """Generate coverage report for `cardano-cli` sub-commands and options."""
 import argparse
+import collections
+import concurrent.futures
 import copy
 import json
 import logging
+import os
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
+from typing import Counter
+from typing import Dict
 from typing import Iterable
 from typing import List
+from typing import Optional
 from typing import Tuple
 
-from cardano_clusterlib import clusterlib
-
+from cardano_node_tests.utils import cli_coverage
 from cardano_node_tests.utils import helpers
 
 LOGGER = logging.getLogger(__name__)
@@ -37,6 +43,14 @@ SKIPPED = (
     "--version",
 )
 
+# max number of `cardano-cli` processes running in parallel
+HELP_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+# read coverage files in parallel when there's at least this many of them
+PARALLEL_MERGE_MIN_FILES = 32
+
+CACHE_DIR = Path(tempfile.gettempdir()) / "cardano-node-tests" / "cli_coverage_cache"
+
 
 def get_args() -> argparse.Namespace:
     """Get script command line arguments."""
@@ -77,33 +91,14 @@ def get_args() -> argparse.Namespace:
         action="store_true",
         help="Include all commands and arguments, ignore list of items to skip",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't use cached list of available commands and arguments",
+    )
     return parser.parse_args()
 
 
-def merge_coverage(dict_a: dict, dict_b: dict) -> dict:
-    """Merge dict_b into dict_a."""
-    if not (isinstance(dict_a, dict) and isinstance(dict_b, dict)):
-        return dict_a
-
-    mergeable = (list, set, tuple)
-    addable = (int, float)
-    for key, value in dict_b.items():
-        if key in dict_a and isinstance(value, mergeable) and isinstance(dict_a[key], mergeable):
-            new_list = set(dict_a[key]).union(value)
-            dict_a[key] = sorted(new_list)
-        elif key in dict_a and isinstance(value, addable) and isinstance(dict_a[key], addable):
-            dict_a[key] += value
-        # skipped arguments and commands are not in the available commands dict
-        elif key not in dict_a:
-            continue
-        elif not isinstance(value, dict):
-            dict_a[key] = value
-        else:
-            merge_coverage(dict_a[key], value)
-
-    return dict_a
-
-
 def cli(cli_args: Iterable[str]) -> str:
     """Run the `cardano-cli` command."""
     assert not isinstance(cli_args, str), "`cli_args` must be sequence of strings"
@@ -138,50 +133,121 @@ def parse_cmd_output(output: str) -> List[str]:
     return cli_args
 
 
-def get_available_commands(cli_args: Iterable[str], ignore_skips: bool = False) -> dict:
-    """Get all available cardano-cli sub-commands and options."""
-    cli_out = cli(cli_args)
-    new_cli_args = parse_cmd_output(cli_out)
+def _get_cmd_items(cli_args: Tuple[str, ...]) -> List[str]:
+    return parse_cmd_output(cli(cli_args))
+
+
+def discover_help_tree(cli_args: Iterable[str]) -> Dict[str, List[str]]:
+    """Get sub-commands and options of all `cardano-cli` commands.
+
+    The help of the commands is discovered in parallel. Return dict of command (as space separated
+    string) and its sub-commands and options names.
+    """
+    help_tree: Dict[str, List[str]] = {}
+    root_args = tuple(cli_args)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=HELP_WORKERS) as executor:
+        futures = {executor.submit(_get_cmd_items, root_args): root_args}
+        while futures:
+            done, __ = concurrent.futures.wait(
+                futures, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for fut in done:
+                cmd_args = futures.pop(fut)
+                items = fut.result()
+                help_tree[" ".join(cmd_args)] = items
+                for item in items:
+                    if item.startswith("-"):
+                        continue
+                    sub_args = (*cmd_args, item)
+                    futures[executor.submit(_get_cmd_items, sub_args)] = sub_args
+
+    return help_tree
+
+
+def get_cached_help_tree(cli_args: Iterable[str]) -> Dict[str, List[str]]:
+    """Get help tree of `cardano-cli` commands, cached on disk.
+
+    The cache is keyed by checksum of the `cardano-cli` binary.
+    """
+    cli_args = list(cli_args)
+    cli_checksum = helpers.checksum(helpers.get_cmd_path(cli_args[0]))
+    cache_file = CACHE_DIR / f"help_tree_{cli_checksum[:32]}.json"
+
+    if cache_file.exists():
+        with open(cache_file, encoding="utf-8") as in_json:
+            help_tree: Dict[str, List[str]] = json.load(in_json)
+        LOGGER.info(f"Using cached help tree from '{cache_file}'.")
+        return help_tree
+
+    help_tree = discover_help_tree(cli_args)
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    helpers.write_json(tmp_file, help_tree)
+    tmp_file.replace(cache_file)
+    return help_tree
+
+
+def _build_commands_dict(
+    help_tree: Dict[str, List[str]], cli_args: Tuple[str, ...], ignore_skips: bool
+) -> dict:
     command_dict: dict = {"_count": 0}
-    for arg in new_cli_args:
+    for arg in help_tree.get(" ".join(cli_args)) or ():
         if not ignore_skips and arg in SKIPPED:
             continue
         if arg.startswith("-"):
             command_dict[arg] = {"_count": 0}
             continue
-        command_dict[arg] = get_available_commands([*cli_args, arg], ignore_skips=ignore_skips)
+        command_dict[arg] = _build_commands_dict(
+            help_tree=help_tree, cli_args=(*cli_args, arg), ignore_skips=ignore_skips
+        )
 
     return command_dict
 
 
-def get_log_coverage(log_file: Path) -> dict:
-    """Get coverage info from log file containing CLI commands."""
-    coverage_dict: dict = {}
-    with open(log_file, encoding="utf-8") as infile:
-        for line in infile:
-            if not line.startswith("cardano-cli"):
-                continue
-            clusterlib.record_cli_coverage(cli_args=line.split(), coverage_dict=coverage_dict)
+def get_available_commands(
+    cli_args: Iterable[str], ignore_skips: bool = False, use_cache: bool = True
+) -> dict:
+    """Get all available cardano-cli sub-commands and options."""
+    cli_args = tuple(cli_args)
+    help_tree = get_cached_help_tree(cli_args) if use_cache else discover_help_tree(cli_args)
+    return _build_commands_dict(help_tree=help_tree, cli_args=cli_args, ignore_skips=ignore_skips)
 
-    return coverage_dict
+
+def _read_coverage(in_file: Path) -> Counter[cli_coverage.CoveragePath]:
+    counts = cli_coverage.read_any_coverage(in_file)
+    if ("cardano-cli",) not in counts:
+        raise AttributeError(f"Data in '{in_file}' doesn't seem to be in proper coverage format.")
+    return counts
+
+
+def count_coverage(coverage_files: List[Path]) -> Counter[cli_coverage.CoveragePath]:
+    """Sum counts of command paths from all coverage files.
+
+    Large sets of coverage files are read in parallel.
+    """
+    counts: Counter[cli_coverage.CoveragePath] = collections.Counter()
+    if len(coverage_files) < PARALLEL_MERGE_MIN_FILES:
+        for in_coverage in coverage_files:
+            counts.update(_read_coverage(in_coverage))
+        return counts
+
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        for file_counts in executor.map(_read_coverage, coverage_files, chunksize=8):
+            counts.update(file_counts)
+    return counts
 
 
 def get_coverage(coverage_files: List[Path], available_commands: dict) -> dict:
     """Get coverage info by merging available data."""
     coverage_dict = copy.deepcopy(available_commands)
-    for in_coverage in coverage_files:
-        if in_coverage.suffix == ".json":
-            with open(in_coverage, encoding="utf-8") as infile:
-                coverage = json.load(infile)
-        else:
-            coverage = get_log_coverage(in_coverage)
-
-        if coverage.get("cardano-cli", {}).get("_count") is None:
-            raise AttributeError(
-                f"Data in '{in_coverage}' doesn't seem to be in proper coverage format."
-            )
-
-        coverage_dict = merge_coverage(coverage_dict, coverage)
+    for path, count in count_coverage(coverage_files).items():
+        record: Optional[dict] = coverage_dict
+        for arg in path:
+            # skipped arguments and commands are not in the available commands dict
+            record = record.get(arg) if record else None
+        if record:
+            record["_count"] += count
 
     return coverage_dict
 
@@ -250,7 +316,9 @@ def main() -> int:
         return 1
 
     available_commands = {
-        "cardano-cli": get_available_commands(["cardano-cli"], ignore_skips=args.ignore_skips)
+        "cardano-cli": get_available_commands(
+            ["cardano-cli"], ignore_skips=args.ignore_skips, use_cache=not args.no_cache
+        )
     }
     try:
         coverage = get_coverage(
@@ -2,6 +2,7 @@
 # pylint: disable=abstract-class-instantiated
 import contextlib
 import dataclasses
+import json
 import logging
 import os
 import random
@@ -11,7 +12,11 @@ from pathlib import Path
 from typing import Callable
 from typing import Dict
 from typing import Iterable
+from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Set
+from typing import Tuple
 
 import pytest
 from _pytest.config import Config
@@ -19,8 +24,12 @@ from _pytest.tmpdir import TempPathFactory
 from cardano_clusterlib import clusterlib
 
 from cardano_node_tests.cluster_management import common
+from cardano_node_tests.cluster_management import coordinator
 from cardano_node_tests.cluster_management import resources
 from cardano_node_tests.cluster_management import resources_management
+from cardano_node_tests.cluster_management import standby
+from cardano_node_tests.cluster_management import status_store
+from cardano_node_tests.cluster_management import wakeup
 from cardano_node_tests.utils import artifacts
 from cardano_node_tests.utils import cluster_nodes
 from cardano_node_tests.utils import configuration
@@ -56,6 +65,14 @@ def _kill_supervisor(instance_num: int) -> None:
         return
 
 
+class _InstanceStatus(NamedTuple):
+    unusable: bool
+    needs_respin: bool
+    resources_locked: List[str]
+    resources_used: List[str]
+    started_tests_sfiles: List[str]
+
+
 @dataclasses.dataclass
 class _ClusterGetStatus:
     """Intermediate status while trying to `get` suitable cluster instance."""
@@ -75,34 +92,125 @@ class _ClusterGetStatus:
     cluster_needs_respin: bool = False
     prio_here: bool = False
     tried_all_instances: bool = False
+    woken_up: bool = False
     instance_dir: Path = Path("/nonexistent")
+    # instance that was swapped with a standby instance and needs to be respun in background
+    standby_respin_instance: int = -1
+    # resources that prevented the test from starting so far
+    blocking_resources: Set[str] = dataclasses.field(default_factory=set)
     final_lock_resources: Iterable[str] = ()
     final_use_resources: Iterable[str] = ()
-    # status files
-    started_tests_sfiles: Iterable[Path] = ()
-    marked_ready_sfiles: Iterable[Path] = ()
-    marked_running_my_anywhere: Iterable[Path] = ()
+    # status records
+    started_tests_sfiles: Iterable[str] = ()
+    marked_ready_sfiles: Iterable[str] = ()
+    marked_running_my_anywhere: Iterable[Tuple[int, str]] = ()
 
 
-class ClusterGetter:
-    """Internal class that encapsulate functionality for getting a cluster instance."""
+def release_test(
+    store: status_store.StatusStore, instance_num: int, worker_id: str
+) -> Tuple[bool, List[str]]:
+    """Remove status records of a test that finished on the worker.
+
+    Must be called under the global cluster lock.
+
+    Return a tuple of a boolean indicating if the cluster instance is scheduled for respin, and
+    a list of names of tests that keep running on the cluster instance.
+    """
+    respin_needed = bool(
+        store.glob(instance_num=instance_num, pattern=f"{common.RESPIN_NEEDED_GLOB}_*")
+    )
+
+    # remove resource locking records created by the worker, ignore resources with mark
+    store.unlink_glob(
+        instance_num=instance_num, pattern=f"{common.RESOURCE_LOCKED_GLOB}_@@*@@_{worker_id}"
+    )
+
+    # remove "resource in use" records created by the worker, ignore resources with mark
+    store.unlink_glob(
+        instance_num=instance_num, pattern=f"{common.RESOURCE_IN_USE_GLOB}_@@*@@_{worker_id}"
+    )
+
+    # remove record that indicates that a test is running on the worker
+    store.unlink_glob(instance_num=instance_num, pattern=f"{common.TEST_RUNNING_GLOB}*_{worker_id}")
+
+    # names of tests that keep running on the cluster instance
+    tnames = [
+        store.read_text(instance_num=instance_num, name=tf).strip()
+        for tf in store.glob(instance_num=instance_num, pattern=f"{common.TEST_RUNNING_GLOB}*")
+    ]
+
+    return respin_needed, tnames
+
+
+def _get_resources_wait_file(pytest_tmp_dir: Path, worker_id: str) -> Path:
+    return pytest_tmp_dir / f"{common.RESOURCES_WAIT_GLOB}_{worker_id}.json"
+
+
+def save_resources_wait(
+    pytest_tmp_dir: Path, worker_id: str, resources: Iterable[str], wait_sec: float
+) -> None:
+    """Add time the test spent waiting for unavailable resources to the worker statistics.
+
+    The whole wait of the test is attributed to every resource that prevented the test from
+    starting at some point.
+    """
+    stats_file = _get_resources_wait_file(pytest_tmp_dir=pytest_tmp_dir, worker_id=worker_id)
+    stats: Dict[str, Dict[str, float]] = {}
+    if stats_file.exists():
+        with open(stats_file, encoding="utf-8") as in_json:
+            stats = json.load(in_json)
+
+    for r in resources:
+        rstats = stats.setdefault(r, {"waits": 0, "wait_sec": 0.0, "max_wait_sec": 0.0})
+        rstats["waits"] += 1
+        rstats["wait_sec"] = round(rstats["wait_sec"] + wait_sec, 3)
+        rstats["max_wait_sec"] = round(max(rstats["max_wait_sec"], wait_sec), 3)
+
+    # the file is written only by this worker, no lock is needed
+    with open(stats_file, "w", encoding="utf-8") as out_json:
+        json.dump(stats, out_json)
+
+
+def get_resources_wait_stats(pytest_tmp_dir: Path) -> Dict[str, Dict[str, float]]:
+    """Return statistics of time that tests spent waiting for each resource, from all workers.
+
+    The resources are sorted by total wait time, so the bottleneck resources come first.
+    """
+    stats: Dict[str, Dict[str, float]] = {}
+    for stats_file in pytest_tmp_dir.glob(f"{common.RESOURCES_WAIT_GLOB}_*.json"):
+        with open(stats_file, encoding="utf-8") as in_json:
+            worker_stats: Dict[str, Dict[str, float]] = json.load(in_json)
+        for r, wstats in worker_stats.items():
+            rstats = stats.setdefault(r, {"waits": 0, "wait_sec": 0.0, "max_wait_sec": 0.0})
+            rstats["waits"] += wstats["waits"]
+            rstats["wait_sec"] = round(rstats["wait_sec"] + wstats["wait_sec"], 3)
+            rstats["max_wait_sec"] = max(rstats["max_wait_sec"], wstats["max_wait_sec"])
+
+    return dict(sorted(stats.items(), key=lambda i: i[1]["wait_sec"], reverse=True))
+
+
+class ClusterScheduler:
+    """Internal class that encapsulate scheduling decisions made under the global cluster lock.
+
+    The scheduling decisions are made either by the worker itself, or by the scheduling
+    coordinator on behalf of the worker.
+    """
 
     def __init__(
         self,
-        tmp_path_factory: TempPathFactory,
+        pytest_tmp_dir: Path,
         worker_id: str,
-        pytest_config: Config,
         num_of_instances: int,
         log_func: Callable,
+        store: Optional[status_store.StatusStore] = None,
     ) -> None:
-        self.pytest_config = pytest_config
+        self.pytest_tmp_dir = pytest_tmp_dir
         self.worker_id = worker_id
-        self.tmp_path_factory = tmp_path_factory
         self.num_of_instances = num_of_instances
         self.log = log_func
 
-        self.pytest_tmp_dir = temptools.get_pytest_root_tmp(self.tmp_path_factory)
         self.cluster_lock = f"{self.pytest_tmp_dir}/{common.CLUSTER_LOCK}"
+        self.store = store or coordinator.get_store(self.pytest_tmp_dir)
 
         self._cluster_instance_num = -1
 
@@ -119,6 +227,13 @@ class ClusterGetter:
         )
         return _instance_dir
 
+    def _create_addrs_data_dir(self) -> Path:
+        """Create dir for faucet addresses data of the cluster instance."""
+        raise NotImplementedError()
+
+    def _save_start_script_coverage(self, log_file: Path) -> None:
+        """Save info about CLI commands executed by cluster start script."""
+
     def _create_startup_files_dir(self, instance_num: int) -> Path:
         _instance_dir = self.pytest_tmp_dir / f"{common.CLUSTER_DIR_TEMPLATE}{instance_num}"
         rand_str = clusterlib.get_rand_str(8)
@@ -132,19 +247,23 @@ class ClusterGetter:
         Not called under global lock!
         """
         # pylint: disable=too-many-branches,too-many-statements
-        cluster_running_file = self.instance_dir / common.CLUSTER_RUNNING_FILE
+        cluster_running = self.store.exists(
+            instance_num=self.cluster_instance_num, name=common.CLUSTER_RUNNING_FILE
+        )
 
         # don't respin cluster if it was started outside of test framework
         if configuration.DEV_CLUSTER_RUNNING:
             self.log(f"c{self.cluster_instance_num}: ignoring respin, dev cluster is running")
-            if cluster_running_file.exists():
+            if cluster_running:
                 LOGGER.warning("Ignoring requested cluster respin as 'DEV_CLUSTER_RUNNING' is set.")
             else:
-                cluster_running_file.touch()
+                self.store.touch(
+                    instance_num=self.cluster_instance_num, name=common.CLUSTER_RUNNING_FILE
+                )
             return True
 
         # fail if cluster respin is forbidden and the cluster was already started
-        if configuration.FORBID_RESTART and cluster_running_file.exists():
+        if configuration.FORBID_RESTART and cluster_running:
             raise RuntimeError("Cannot respin cluster when 'FORBID_RESTART' is set.")
 
         self.log(
@@ -188,15 +307,7 @@ class ClusterGetter:
             except Exception as err:
                 self.log(f"c{self.cluster_instance_num}: failed to stop cluster:\n{err}")
 
-            # save artifacts only when produced during this test run
-            if cluster_running_file.exists():
-                artifacts.save_start_script_coverage(
-                    log_file=state_dir / common.CLUSTER_START_CMDS_LOG,
-                    pytest_config=self.pytest_config,
-                )
-                artifacts.save_cluster_artifacts(save_dir=self.pytest_tmp_dir, state_dir=state_dir)
-
-            shutil.rmtree(state_dir, ignore_errors=True)
+            self._archive_state_dir(state_dir=state_dir, cluster_running=cluster_running)
 
             with contextlib.suppress(Exception):
                 _kill_supervisor(self.cluster_instance_num)
@@ -222,7 +333,8 @@ class ClusterGetter:
             )
             if not configuration.IS_XDIST:
                 pytest.exit(msg=f"Failed to start cluster, exception: {excp}", returncode=1)
-            (self.instance_dir / common.CLUSTER_DEAD_FILE).touch()
+            self.store.touch(instance_num=self.cluster_instance_num, name=common.CLUSTER_DEAD_FILE)
+            self._notify_waiters(instance_num=self.cluster_instance_num)
             return False
 
         # generate ID for the new cluster instance so it is possible to match log entries with
@@ -234,10 +346,8 @@ class ClusterGetter:
             fp_out.write(cluster_instance_id)
         self.log(f"c{self.cluster_instance_num}: started cluster instance '{cluster_instance_id}'")
 
-        # Create temp dir for faucet addresses data.
-        # Pytest's mktemp adds number to the end of the dir name, so keep the trailing '_'
-        # as separator. Resulting dir name is e.g. 'addrs_data_ci3_0'.
-        tmp_path = Path(self.tmp_path_factory.mktemp(f"addrs_data_ci{self.cluster_instance_num}_"))
+        # create temp dir for faucet addresses data
+        tmp_path = self._create_addrs_data_dir()
 
         # setup faucet addresses
         try:
@@ -249,37 +359,54 @@ class ClusterGetter:
             )
             if not configuration.IS_XDIST:
                 pytest.exit(msg=f"Failed to setup test addresses, exception: {err}", returncode=1)
-            (self.instance_dir / common.CLUSTER_DEAD_FILE).touch()
+            self.store.touch(instance_num=self.cluster_instance_num, name=common.CLUSTER_DEAD_FILE)
+            self._notify_waiters(instance_num=self.cluster_instance_num)
             return False
 
-        # create file that indicates that the cluster is running
-        if not cluster_running_file.exists():
-            cluster_running_file.touch()
+        # create record that indicates that the cluster is running
+        if not cluster_running:
+            self.store.touch(
+                instance_num=self.cluster_instance_num, name=common.CLUSTER_RUNNING_FILE
+            )
 
         return True
 
-    def _is_dev_cluster_ready(self) -> bool:
-        """Check if development cluster instance is ready to be used."""
-        state_dir = cluster_nodes.get_cluster_env().state_dir
-        if (state_dir / cluster_nodes.ADDRS_DATA).exists():
-            return True
-        return False
+    def _archive_state_dir(self, state_dir: Path, cluster_running: bool) -> None:
+        """Save artifacts of the stopped cluster instance and remove its state dir in background.
 
-    def _setup_dev_cluster(self) -> None:
-        """Set up cluster instance that was already started outside of test framework."""
-        cluster_env = cluster_nodes.get_cluster_env()
-        if (cluster_env.state_dir / cluster_nodes.ADDRS_DATA).exists():
+        The state dir is renamed aside first, so the new cluster instance can be started right away.
+        """
+        if not state_dir.exists():
             return
 
-        self.log(f"c{cluster_env.instance_num}: setting up dev cluster")
+        old_state_dir = state_dir.with_name(f".{state_dir.name}_{clusterlib.get_rand_str(8)}")
+        state_dir.rename(old_state_dir)
 
-        # Create "addrs_data" directly in the cluster state dir, so it can be reused
-        # (in normal non-`DEV_CLUSTER_RUNNING` setup we want "addrs_data" stored among
-        # tests artifacts, so it can be used during cleanup etc.).
-        tmp_path = cluster_env.state_dir / "addrs_data"
-        tmp_path.mkdir(exist_ok=True, parents=True)
-        cluster_obj = cluster_nodes.get_cluster_type().get_cluster_obj()
-        cluster_nodes.setup_test_addrs(cluster_obj=cluster_obj, destination_dir=tmp_path)
+        def _archive() -> None:
+            try:
+                # save artifacts only when produced during this test run
+                if cluster_running:
+                    self._save_start_script_coverage(
+                        log_file=old_state_dir / common.CLUSTER_START_CMDS_LOG
+                    )
+                    artifacts.save_cluster_artifacts(
+                        save_dir=self.pytest_tmp_dir,
+                        state_dir=old_state_dir,
+                        hardlink=True,
+                        dir_name=state_dir.name,
+                    )
+            except Exception:
+                LOGGER.exception(f"Failed to save artifacts from '{old_state_dir}'.")
+            finally:
+                shutil.rmtree(old_state_dir, ignore_errors=True)
+
+        artifacts.run_in_background(func=_archive, name=f"archive_{old_state_dir.name}")
+
+    def _notify_waiters(self, instance_num: int = wakeup.ANY_INSTANCE) -> None:
+        """Wake up workers that are waiting for the cluster instance."""
+        if not configuration.IS_XDIST:
+            return
+        wakeup.notify_waiters(pytest_tmp_dir=self.pytest_tmp_dir, instance_num=instance_num)
 
     def _is_healthy(self, instance_num: int) -> bool:
         """Check health of cluster services."""
@@ -294,13 +421,12 @@ class ClusterGetter:
 
     def _cluster_needs_respin(self, instance_num: int) -> bool:
         """Check if it is necessary to respin cluster."""
-        instance_dir = self.pytest_tmp_dir / f"{common.CLUSTER_DIR_TEMPLATE}{instance_num}"
         # if cluster instance is not started yet
-        if not (instance_dir / common.CLUSTER_RUNNING_FILE).exists():
+        if not self.store.exists(instance_num=instance_num, name=common.CLUSTER_RUNNING_FILE):
             return True
 
         # if it was indicated that the cluster instance needs to be respun
-        if list(instance_dir.glob(f"{common.RESPIN_NEEDED_GLOB}_*")):
+        if self.store.glob(instance_num=instance_num, pattern=f"{common.RESPIN_NEEDED_GLOB}_*"):
             return True
 
         # If a service failed on cluster instance.
@@ -328,32 +454,33 @@ class ClusterGetter:
     def _on_marked_test_stop(self, instance_num: int, mark: str) -> None:
         """Perform actions after all marked tests are finished."""
         self.log(f"c{instance_num}: in `_on_marked_test_stop`")
-        instance_dir = self.pytest_tmp_dir / f"{common.CLUSTER_DIR_TEMPLATE}{instance_num}"
 
         # set cluster instance to be respun if needed
-        respin_after_mark_files = list(
-            instance_dir.glob(f"{common.RESPIN_AFTER_MARK_GLOB}_@@{mark}@@_*")
+        respin_after_mark_files = self.store.unlink_glob(
+            instance_num=instance_num, pattern=f"{common.RESPIN_AFTER_MARK_GLOB}_@@{mark}@@_*"
         )
         if respin_after_mark_files:
-            for f in respin_after_mark_files:
-                f.unlink()
             self.log(f"c{instance_num}: in `_on_marked_test_stop`, creating 'respin needed' file")
-            (instance_dir / f"{common.RESPIN_NEEDED_GLOB}_{self.worker_id}").touch()
+            self.store.touch(
+                instance_num=instance_num, name=f"{common.RESPIN_NEEDED_GLOB}_{self.worker_id}"
+            )
+
+        # remove records that indicates that the mark is ready
+        self.store.unlink_glob(
+            instance_num=instance_num, pattern=f"{common.TEST_CURR_MARK_GLOB}_@@{mark}@@_*"
+        )
 
-        # remove files that indicates that the mark is ready
-        marked_ready_sfiles = instance_dir.glob(f"{common.TEST_CURR_MARK_GLOB}_@@{mark}@@_*")
-        for f in marked_ready_sfiles:
-            f.unlink()
+        # remove records that indicates resources that are locked by the marked tests
+        self.store.unlink_glob(
+            instance_num=instance_num, pattern=f"{common.RESOURCE_LOCKED_GLOB}_*_%%{mark}%%_*"
+        )
 
-        # remove file that indicates resources that are locked by the marked tests
-        marked_lock_files = instance_dir.glob(f"{common.RESOURCE_LOCKED_GLOB}_*_%%{mark}%%_*")
-        for f in marked_lock_files:
-            f.unlink()
+        # remove records that indicates resources that are in-use by the marked tests
+        self.store.unlink_glob(
+            instance_num=instance_num, pattern=f"{common.RESOURCE_IN_USE_GLOB}_*_%%{mark}%%_*"
+        )
 
-        # remove file that indicates resources that are in-use by the marked tests
-        marked_use_files = instance_dir.glob(f"{common.RESOURCE_IN_USE_GLOB}_*_%%{mark}%%_*")
-        for f in marked_use_files:
-            f.unlink()
+        self._notify_waiters(instance_num=instance_num)
 
     def _get_marked_tests_status(
         self, marked_tests_cache: Dict[int, Dict[str, int]], instance_num: int
@@ -378,12 +505,14 @@ class ClusterGetter:
         test was running for some time.
         """
         # no need to continue if there are no marked tests
-        if not list(cget_status.instance_dir.glob(f"{common.TEST_CURR_MARK_GLOB}_*")):
+        if not self.store.glob(
+            instance_num=cget_status.instance_num, pattern=f"{common.TEST_CURR_MARK_GLOB}_*"
+        ):
             return
 
         # marked tests don't need to be running yet if the cluster is being respun
-        respin_in_progress = list(
-            cget_status.instance_dir.glob(f"{common.RESPIN_IN_PROGRESS_GLOB}_*")
+        respin_in_progress = self.store.glob(
+            instance_num=cget_status.instance_num, pattern=f"{common.RESPIN_IN_PROGRESS_GLOB}_*"
         )
         if respin_in_progress:
             return
@@ -396,15 +525,20 @@ class ClusterGetter:
         # update marked tests status
         instance_num = cget_status.instance_num
         marks_in_progress = [
-            f.name.split("@@")[1]
-            for f in cget_status.instance_dir.glob(f"{common.TEST_RUNNING_GLOB}_@@*")
+            f.split("@@")[1]
+            for f in self.store.glob(
+                instance_num=instance_num, pattern=f"{common.TEST_RUNNING_GLOB}_@@*"
+            )
         ]
 
         for m in marks_in_progress:
             marked_tests_status[m] = 0
 
         for m in marked_tests_status:
-            marked_tests_status[m] += 1
+            # Count only regular checks. Wakeups by other workers can come in quick succession
+            # and the mark would be cleared too early.
+            if not cget_status.woken_up:
+                marked_tests_status[m] += 1
 
             # clean the stale status files if we are waiting too long for the next marked test
             if marked_tests_status[m] >= 20:
@@ -414,18 +548,107 @@ class ClusterGetter:
                 )
                 self._on_marked_test_stop(instance_num=instance_num, mark=m)
 
+    def _get_resources_status(self, instance_num: int) -> Tuple[List[str], List[str]]:
+        """Return resources that are locked and resources that are in use on cluster instance."""
+        resources_locked = common._get_resources_from_names(
+            names=self.store.glob(
+                instance_num=instance_num, pattern=f"{common.RESOURCE_LOCKED_GLOB}_*"
+            )
+        )
+        resources_used = common._get_resources_from_names(
+            names=self.store.glob(
+                instance_num=instance_num, pattern=f"{common.RESOURCE_IN_USE_GLOB}_*"
+            )
+        )
+        return resources_locked, resources_used
+
+    def _get_blocking_resources(
+        self,
+        cget_status: _ClusterGetStatus,
+        resources_locked: List[str],
+        resources_used: List[str],
+    ) -> List[str]:
+        """Return resources that prevent the test from starting on cluster instance."""
+        blocking = set()
+        if cget_status.lock_resources:
+            blocking.update(
+                resources_management.get_unavailable(
+                    resources=cget_status.lock_resources,
+                    unavailable={*resources_locked, *resources_used},
+                )
+            )
+        if cget_status.use_resources:
+            blocking.update(
+                resources_management.get_unavailable(
+                    resources=cget_status.use_resources, unavailable=resources_locked
+                )
+            )
+        return sorted(blocking)
+
+    def _get_instance_status(self, instance_num: int) -> _InstanceStatus:
+        """Get status of cluster instance that is needed for ranking the instances."""
+        resources_locked, resources_used = self._get_resources_status(instance_num)
+        return _InstanceStatus(
+            unusable=(
+                self.store.exists(instance_num=instance_num, name=common.CLUSTER_DEAD_FILE)
+                or self.store.exists(instance_num=instance_num, name=common.CLUSTER_STANDBY_FILE)
+                or bool(
+                    self.store.glob(
+                        instance_num=instance_num, pattern=f"{common.RESPIN_IN_PROGRESS_GLOB}_*"
+                    )
+                )
+            ),
+            needs_respin=(
+                not self.store.exists(instance_num=instance_num, name=common.CLUSTER_RUNNING_FILE)
+                or bool(
+                    self.store.glob(
+                        instance_num=instance_num, pattern=f"{common.RESPIN_NEEDED_GLOB}_*"
+                    )
+                )
+            ),
+            resources_locked=resources_locked,
+            resources_used=resources_used,
+            started_tests_sfiles=self.store.glob(
+                instance_num=instance_num, pattern=f"{common.TEST_RUNNING_GLOB}_*"
+            ),
+        )
+
+    def _get_instances_order(
+        self, cget_status: _ClusterGetStatus, instances_status: Dict[int, _InstanceStatus]
+    ) -> List[int]:
+        """Return cluster instances ordered by how soon they can satisfy the test.
+
+        Instances where the required resources are available right now come first, less loaded
+        instances are preferred. Instances that are being respun, or that need respin, come last.
+        The order of instances that are otherwise equal is random, so the load is spread.
+        """
+
+        def _get_key(instance_num: int) -> Tuple[bool, bool, int, int, float]:
+            status = instances_status[instance_num]
+            num_blocking = len(
+                self._get_blocking_resources(
+                    cget_status=cget_status,
+                    resources_locked=status.resources_locked,
+                    resources_used=status.resources_used,
+                )
+            )
+            return (
+                status.unusable,
+                status.needs_respin,
+                num_blocking,
+                len(status.started_tests_sfiles),
+                random.random(),
+            )
+
+        return sorted(instances_status, key=_get_key)
+
     def _resolve_resources_availability(self, cget_status: _ClusterGetStatus) -> bool:
         """Resolve availability of required "use" and "lock" resources."""
-        resources_locked = common._get_resources_from_paths(
-            paths=cget_status.instance_dir.glob(f"{common.RESOURCE_LOCKED_GLOB}_*")
-        )
+        resources_locked, resources_used = self._get_resources_status(cget_status.instance_num)
 
         # this test wants to lock some resources, check if these are not in use
         res_lockable = []
         if cget_status.lock_resources:
-            resources_used = common._get_resources_from_paths(
-                paths=cget_status.instance_dir.glob(f"{common.RESOURCE_IN_USE_GLOB}_*")
-            )
             unlockable_resources = {*resources_locked, *resources_used}
             res_lockable = resources_management.get_resources(
                 resources=cget_status.lock_resources,
@@ -436,6 +659,11 @@ class ClusterGetter:
                     f"c{cget_status.instance_num}: want to lock '{cget_status.lock_resources}' and "
                     f"'{unlockable_resources}' are unavailable, cannot start"
                 )
+                cget_status.blocking_resources.update(
+                    resources_management.get_unavailable(
+                        resources=cget_status.lock_resources, unavailable=unlockable_resources
+                    )
+                )
                 return False
 
         # this test wants to use some resources, check if these are not locked
@@ -450,6 +678,11 @@ class ClusterGetter:
                     f"c{cget_status.instance_num}: want to use '{cget_status.use_resources}' and "
                     f"'{resources_locked}' are locked, cannot start"
                 )
+                cget_status.blocking_resources.update(
+                    resources_management.get_unavailable(
+                        resources=cget_status.use_resources, unavailable=resources_locked
+                    )
+                )
                 return False
 
         # resources that are locked are also in use
@@ -467,15 +700,13 @@ class ClusterGetter:
 
     def _is_already_running(self) -> bool:
         """Check if the test is already setup and running."""
-        test_on_worker = list(
-            self.pytest_tmp_dir.glob(
-                f"{common.CLUSTER_DIR_TEMPLATE}*/{common.TEST_RUNNING_GLOB}*_{self.worker_id}"
-            )
+        test_on_worker = self.store.glob_all(
+            pattern=f"{common.TEST_RUNNING_GLOB}*_{self.worker_id}"
         )
 
         # test is already running, nothing to set up
         if test_on_worker and self._cluster_instance_num != -1:
-            self.log(f"{test_on_worker[0]} already exists")
+            self.log(f"c{test_on_worker[0][0]}: {test_on_worker[0][1]} already exists")
             return True
 
         return False
@@ -489,7 +720,9 @@ class ClusterGetter:
             cget_status.prio_here
             or cget_status.selected_instance != -1
             or cget_status.marked_running_my_anywhere
-        ) and list(self.pytest_tmp_dir.glob(f"{common.PRIO_IN_PROGRESS_GLOB}_*")):
+        ) and self.store.glob(
+            instance_num=status_store.ROOT, pattern=f"{common.PRIO_IN_PROGRESS_GLOB}_*"
+        ):
             self.log("'prio' test setup in progress, cannot continue")
             return True
 
@@ -500,9 +733,9 @@ class ClusterGetter:
         if not cget_status.prio:
             return
 
-        prio_status_file = self.pytest_tmp_dir / f"{common.PRIO_IN_PROGRESS_GLOB}_{self.worker_id}"
-        if not prio_status_file.exists():
-            prio_status_file.touch()
+        self.store.touch(
+            instance_num=status_store.ROOT, name=f"{common.PRIO_IN_PROGRESS_GLOB}_{self.worker_id}"
+        )
         cget_status.prio_here = True
         self.log(f"setting 'prio' for '{cget_status.current_test}'")
 
@@ -511,8 +744,8 @@ class ClusterGetter:
         if cget_status.respin_here:
             return False
 
-        respin_in_progress = list(
-            cget_status.instance_dir.glob(f"{common.RESPIN_IN_PROGRESS_GLOB}_*")
+        respin_in_progress = self.store.glob(
+            instance_num=cget_status.instance_num, pattern=f"{common.RESPIN_IN_PROGRESS_GLOB}_*"
         )
         if respin_in_progress:
             # no log message here, it would be too many of them
@@ -542,9 +775,7 @@ class ClusterGetter:
 
     def _fail_on_all_dead(self) -> None:
         """Fail if all cluster instances are dead."""
-        dead_clusters = list(
-            self.pytest_tmp_dir.glob(f"{common.CLUSTER_DIR_TEMPLATE}*/{common.CLUSTER_DEAD_FILE}")
-        )
+        dead_clusters = self.store.glob_all(pattern=common.CLUSTER_DEAD_FILE)
         if len(dead_clusters) == self.num_of_instances:
             raise RuntimeError("All clusters are dead, cannot run.")
 
@@ -555,9 +786,11 @@ class ClusterGetter:
         cget_status.respin_here = False
         cget_status.respin_ready = False
 
-        # remove status files that are checked by other workers
-        for sf in cget_status.instance_dir.glob(f"{common.TEST_CURR_MARK_GLOB}_*"):
-            sf.unlink()
+        # remove status records that are checked by other workers
+        self.store.unlink_glob(
+            instance_num=cget_status.instance_num, pattern=f"{common.TEST_CURR_MARK_GLOB}_*"
+        )
+        self._notify_waiters(instance_num=cget_status.instance_num)
 
     def _init_respin(self, cget_status: _ClusterGetStatus) -> bool:
         """Initialize respin of this cluster instance on this worker."""
@@ -573,6 +806,10 @@ class ClusterGetter:
             self.log(f"c{cget_status.instance_num}: tests are running, cannot respin")
             return False
 
+        # respin in background and continue on a standby instance if possible
+        if self._swap_with_standby(cget_status):
+            return False
+
         self.log(f"c{cget_status.instance_num}: setting 'respin in progress'")
 
         # Cluster respin will be performed by this worker.
@@ -582,16 +819,52 @@ class ClusterGetter:
         cget_status.respin_here = True
         cget_status.selected_instance = cget_status.instance_num
 
-        respin_in_progress_file = (
-            cget_status.instance_dir / f"{common.RESPIN_IN_PROGRESS_GLOB}_{self.worker_id}"
+        self.store.touch(
+            instance_num=cget_status.instance_num,
+            name=f"{common.RESPIN_IN_PROGRESS_GLOB}_{self.worker_id}",
+        )
+
+        # remove mark status records as these will not be valid after respin
+        self.store.unlink_glob(
+            instance_num=cget_status.instance_num, pattern=f"{common.TEST_CURR_MARK_GLOB}_*"
+        )
+
+        return True
+
+    def _swap_with_standby(self, cget_status: _ClusterGetStatus) -> bool:
+        """Replace cluster instance that needs respin with a ready standby instance."""
+        # custom start command is specific for the test, the test needs to wait for the respin
+        if cget_status.start_cmd or not cget_status.cluster_needs_respin:
+            return False
+
+        standby_instances = self.store.glob_all(pattern=common.CLUSTER_STANDBY_FILE)
+        if not standby_instances:
+            return False
+
+        instance_num = cget_status.instance_num
+        standby_num = standby_instances[0][0]
+        self.log(
+            f"c{instance_num}: swapping with standby instance c{standby_num}, "
+            "setting 'respin in progress' in background"
+        )
+
+        # the standby instance is now available for running tests
+        self.store.unlink(instance_num=standby_num, name=common.CLUSTER_STANDBY_FILE)
+
+        self.store.touch(
+            instance_num=instance_num,
+            name=f"{common.RESPIN_IN_PROGRESS_GLOB}_{common.STANDBY_WORKER_ID}",
         )
-        if not respin_in_progress_file.exists():
-            respin_in_progress_file.touch()
+        # remove status records that will not be valid after respin
+        self.store.unlink_glob(instance_num=instance_num, pattern=f"{common.TEST_CURR_MARK_GLOB}_*")
+        self.store.unlink_glob(instance_num=instance_num, pattern=f"{common.RESPIN_NEEDED_GLOB}_*")
 
-        # remove mark status files as these will not be valid after respin
-        for f in cget_status.instance_dir.glob(f"{common.TEST_CURR_MARK_GLOB}_*"):
-            f.unlink()
+        # the background respin is started outside of global lock
+        cget_status.standby_respin_instance = instance_num
+        # move on to other cluster instance
+        cget_status.selected_instance = -1
 
+        self._notify_waiters(instance_num=standby_num)
         return True
 
     def _finish_respin(self, cget_status: _ClusterGetStatus) -> bool:
@@ -605,11 +878,16 @@ class ClusterGetter:
             cget_status.respin_ready = False
             cget_status.respin_here = False
 
-            # remove status files that are no longer valid after respin
-            for f in cget_status.instance_dir.glob(f"{common.RESPIN_IN_PROGRESS_GLOB}_*"):
-                f.unlink()
-            for f in cget_status.instance_dir.glob(f"{common.RESPIN_NEEDED_GLOB}_*"):
-                f.unlink()
+            # remove status records that are no longer valid after respin
+            self.store.unlink_glob(
+                instance_num=cget_status.instance_num,
+                pattern=f"{common.RESPIN_IN_PROGRESS_GLOB}_*",
+            )
+            self.store.unlink_glob(
+                instance_num=cget_status.instance_num, pattern=f"{common.RESPIN_NEEDED_GLOB}_*"
+            )
+            # other workers can start their tests on the respun cluster instance
+            self._notify_waiters(instance_num=cget_status.instance_num)
             return True
 
         # NOTE: when `_respin` is called, the env variables needed for cluster start scripts need
@@ -626,51 +904,55 @@ class ClusterGetter:
             return
 
         self.log(f"c{cget_status.instance_num}: starting '{cget_status.mark}' test")
-        (
-            self.instance_dir
-            / f"{common.TEST_CURR_MARK_GLOB}_@@{cget_status.mark}@@_{self.worker_id}"
-        ).touch()
+        self.store.touch(
+            instance_num=self.cluster_instance_num,
+            name=f"{common.TEST_CURR_MARK_GLOB}_@@{cget_status.mark}@@_{self.worker_id}",
+        )
 
     def _create_test_status_files(self, cget_status: _ClusterGetStatus) -> None:
-        """Create status files for test that is about to start on this cluster instance."""
+        """Create status records for test that is about to start on this cluster instance."""
+        instance_num = self.cluster_instance_num
         mark_res_str = f"_%%{cget_status.mark}%%" if cget_status.mark else ""
 
-        # create status file for each in-use resource
+        # create status record for each in-use resource
         for r in cget_status.final_use_resources:
-            (
-                self.instance_dir
-                / f"{common.RESOURCE_IN_USE_GLOB}_@@{r}@@{mark_res_str}_{self.worker_id}"
-            ).touch()
+            self.store.touch(
+                instance_num=instance_num,
+                name=f"{common.RESOURCE_IN_USE_GLOB}_@@{r}@@{mark_res_str}_{self.worker_id}",
+            )
 
-        # create status file for each locked resource
+        # create status record for each locked resource
         for r in cget_status.final_lock_resources:
-            (
-                self.instance_dir
-                / f"{common.RESOURCE_LOCKED_GLOB}_@@{r}@@{mark_res_str}_{self.worker_id}"
-            ).touch()
+            self.store.touch(
+                instance_num=instance_num,
+                name=f"{common.RESOURCE_LOCKED_GLOB}_@@{r}@@{mark_res_str}_{self.worker_id}",
+            )
 
         # cleanup = cluster respin after test (group of tests) is finished
         if cget_status.cleanup:
             # cleanup after group of test that are marked with a marker
             if cget_status.mark:
                 self.log(f"c{cget_status.instance_num}: cleanup and mark")
-                (
-                    self.instance_dir
-                    / f"{common.RESPIN_AFTER_MARK_GLOB}_@@{cget_status.mark}@@_{self.worker_id}"
-                ).touch()
+                self.store.touch(
+                    instance_num=instance_num,
+                    name=f"{common.RESPIN_AFTER_MARK_GLOB}_@@{cget_status.mark}@@_{self.worker_id}",
+                )
             # cleanup after single test (e.g. singleton)
             else:
                 self.log(f"c{cget_status.instance_num}: cleanup and not mark")
-                (self.instance_dir / f"{common.RESPIN_NEEDED_GLOB}_{self.worker_id}").touch()
+                self.store.touch(
+                    instance_num=instance_num, name=f"{common.RESPIN_NEEDED_GLOB}_{self.worker_id}"
+                )
 
-        self.log(f"c{self.cluster_instance_num}: creating 'test running' status file")
+        self.log(f"c{instance_num}: creating 'test running' status record")
         mark_run_str = f"_@@{cget_status.mark}@@" if cget_status.mark else ""
-        test_running_file = (
-            self.instance_dir / f"{common.TEST_RUNNING_GLOB}{mark_run_str}_{self.worker_id}"
-        )
         # write the name of the test that is starting on this cluster instance, leave out the
         # '(setup)' part
-        test_running_file.write_text(cget_status.current_test.split(" ")[0])
+        self.store.touch(
+            instance_num=instance_num,
+            name=f"{common.TEST_RUNNING_GLOB}{mark_run_str}_{self.worker_id}",
+            content=cget_status.current_test.split(" ")[0],
+        )
 
     def _init_use_resources(
         self,
@@ -693,7 +975,273 @@ class ClusterGetter:
 
         return use_resources
 
-    def get_cluster_instance(  # noqa: C901
+    def _get_step(  # noqa: C901
+        self,
+        cget_status: _ClusterGetStatus,
+        marked_tests_cache: Dict[int, Dict[str, int]],
+        available_instances: List[int],
+    ) -> bool:
+        """Check current conditions once, return True when it is possible to start the test.
+
+        Must be called under the global cluster lock. Nothing time consuming can go here,
+        as all other workers will need to wait.
+        """
+        # pylint: disable=too-many-statements,too-many-branches,too-many-return-statements
+        mark = cget_status.mark
+
+        if self._is_already_running():
+            return True
+
+        # fail if all cluster instances are dead
+        self._fail_on_all_dead()
+
+        if mark:
+            # check if tests with my mark are already locked to any cluster instance
+            cget_status.marked_running_my_anywhere = self.store.glob_all(
+                pattern=f"{common.TEST_CURR_MARK_GLOB}_@@{mark}@@_*"
+            )
+
+        # A "prio" test has priority in obtaining cluster instance. Check if it is needed
+        # to wait until earlier "prio" test obtains a cluster instance.
+        if self._wait_for_prio(cget_status):
+            cget_status.sleep_delay = 5
+            return False
+
+        # set "prio" for this test if indicated
+        self._init_prio(cget_status)
+
+        self._cluster_instance_num = -1
+
+        # if instance to run the test on was already decided, skip all other instances
+        candidate_instances = (
+            [cget_status.selected_instance]
+            if cget_status.selected_instance != -1
+            else available_instances
+        )
+        # status of instances is collected once per scheduling step
+        instances_status = {i: self._get_instance_status(i) for i in candidate_instances}
+
+        # try cluster instances, starting with those that can run the test soonest
+        for instance_num in self._get_instances_order(
+            cget_status=cget_status, instances_status=instances_status
+        ):
+            cget_status.instance_num = instance_num
+            cget_status.instance_dir = (
+                self.pytest_tmp_dir / f"{common.CLUSTER_DIR_TEMPLATE}{instance_num}"
+            )
+            cget_status.instance_dir.mkdir(exist_ok=True)
+
+            # cleanup cluster instance where attempt to start cluster failed repeatedly
+            if self.store.exists(instance_num=instance_num, name=common.CLUSTER_DEAD_FILE):
+                self._cleanup_dead_clusters(cget_status)
+                continue
+
+            # no tests can start on standby instance
+            if self.store.exists(instance_num=instance_num, name=common.CLUSTER_STANDBY_FILE):
+                continue
+
+            # cluster respin planned or in progress, so no new tests can start
+            if self._respun_by_other_worker(cget_status):
+                cget_status.sleep_delay = 5
+                continue
+
+            # are there tests already running on this cluster instance?
+            cget_status.started_tests_sfiles = instances_status[instance_num].started_tests_sfiles
+
+            # Does the cluster instance needs respin to continue?
+            # Cache the result as the check itself can be expensive.
+            cget_status.cluster_needs_respin = self._cluster_needs_respin(instance_num)
+
+            # "marked tests" = group of tests marked with my mark
+            cget_status.marked_ready_sfiles = self.store.glob(
+                instance_num=instance_num, pattern=f"{common.TEST_CURR_MARK_GLOB}_@@{mark}@@_*"
+            )
+
+            # if marked tests are already running, update their status
+            self._update_marked_tests(
+                marked_tests_cache=marked_tests_cache, cget_status=cget_status
+            )
+
+            # select this instance for running marked tests if possible
+            if mark and not self._marked_select_instance(cget_status):
+                cget_status.sleep_delay = 2
+                continue
+
+            # Try next cluster instance when the current one needs respin.
+            # Respin only if:
+            # * we are already locked on this instance
+            # * respin is needed by the current test anyway
+            # * we already tried all cluster instances and there's no other option
+            if (
+                cget_status.cluster_needs_respin
+                and cget_status.selected_instance != instance_num
+                and not self._test_needs_respin(cget_status)
+                and not cget_status.tried_all_instances
+            ):
+                continue
+
+            # We don't need to resolve resources availability if there was already a test
+            # with this mark before (the first test already resolved the resources
+            # availability).
+            # It is responsibility of tests to make sure that the same resources are
+            # requested for all the tests with the same mark (e.g. specific pool and
+            # not "any pool").
+            need_resolve_resources = not cget_status.marked_ready_sfiles
+
+            # check availability of the required resources
+            if need_resolve_resources and not self._resolve_resources_availability(cget_status):
+                cget_status.sleep_delay = 5
+                continue
+
+            # if respin is needed, indicate that the cluster will be re-spun
+            # (after all currently running tests are finished)
+            if not self._init_respin(cget_status):
+                continue
+
+            # we've found suitable cluster instance
+            cget_status.selected_instance = instance_num
+            self._cluster_instance_num = instance_num
+            self.log(f"c{instance_num}: can run test '{cget_status.current_test}'")
+            # set environment variables that are needed when respinning the cluster
+            # and running tests
+            cluster_nodes.set_cluster_env(instance_num)
+
+            # remove "prio" status record, other tests don't need to wait anymore
+            if cget_status.prio:
+                self.store.unlink(
+                    instance_num=status_store.ROOT,
+                    name=f"{common.PRIO_IN_PROGRESS_GLOB}_{self.worker_id}",
+                )
+                self._notify_waiters()
+
+            # Create status record for marked tests.
+            # This must be done before the cluster is re-spun, so that other marked tests
+            # don't try to prepare another cluster instance.
+            self._init_marked_test(cget_status)
+
+            # if needed, finish respin related actions
+            if not self._finish_respin(cget_status):
+                return False
+
+            # from this point on, all conditions needed to start the test are met
+            break
+        else:
+            # if the test cannot start on any instance, return to top-level loop
+            cget_status.tried_all_instances = True
+            return False
+
+        self._create_test_status_files(cget_status)
+
+        # cluster instance is ready, we can start the test
+        return True
+
+
+class ClusterGetter(ClusterScheduler):
+    """Internal class that encapsulate functionality for getting a cluster instance."""
+
+    def __init__(
+        self,
+        tmp_path_factory: TempPathFactory,
+        worker_id: str,
+        pytest_config: Config,
+        num_of_instances: int,
+        log_func: Callable,
+    ) -> None:
+        super().__init__(
+            pytest_tmp_dir=temptools.get_pytest_root_tmp(tmp_path_factory),
+            worker_id=worker_id,
+            num_of_instances=num_of_instances,
+            log_func=log_func,
+        )
+        self.pytest_config = pytest_config
+        self.tmp_path_factory = tmp_path_factory
+
+    def _create_addrs_data_dir(self) -> Path:
+        # Pytest's mktemp adds number to the end of the dir name, so keep the trailing '_'
+        # as separator. Resulting dir name is e.g. 'addrs_data_ci3_0'.
+        return Path(self.tmp_path_factory.mktemp(f"addrs_data_ci{self.cluster_instance_num}_"))
+
+    def _save_start_script_coverage(self, log_file: Path) -> None:
+        artifacts.save_start_script_coverage(log_file=log_file, pytest_config=self.pytest_config)
+
+    def _wait(self, cget_status: _ClusterGetStatus, waiter: Optional[wakeup.Waiter]) -> None:
+        """Wait before the next check, wake up early when notified by other worker."""
+        timeout = random.uniform(0.6, 1.2) * cget_status.sleep_delay
+        if waiter is None or not timeout:
+            _xdist_sleep(timeout)
+            cget_status.woken_up = False
+            return
+
+        cget_status.woken_up = waiter.wait(
+            timeout=timeout, instance_num=cget_status.selected_instance
+        )
+
+    def _is_dev_cluster_ready(self) -> bool:
+        """Check if development cluster instance is ready to be used."""
+        state_dir = cluster_nodes.get_cluster_env().state_dir
+        if (state_dir / cluster_nodes.ADDRS_DATA).exists():
+            return True
+        return False
+
+    def _setup_dev_cluster(self) -> None:
+        """Set up cluster instance that was already started outside of test framework."""
+        cluster_env = cluster_nodes.get_cluster_env()
+        if (cluster_env.state_dir / cluster_nodes.ADDRS_DATA).exists():
+            return
+
+        self.log(f"c{cluster_env.instance_num}: setting up dev cluster")
+
+        # Create "addrs_data" directly in the cluster state dir, so it can be reused
+        # (in normal non-`DEV_CLUSTER_RUNNING` setup we want "addrs_data" stored among
+        # tests artifacts, so it can be used during cleanup etc.).
+        tmp_path = cluster_env.state_dir / "addrs_data"
+        tmp_path.mkdir(exist_ok=True, parents=True)
+        cluster_obj = cluster_nodes.get_cluster_type().get_cluster_obj()
+        cluster_nodes.setup_test_addrs(cluster_obj=cluster_obj, destination_dir=tmp_path)
+
+    def _schedule_step(
+        self,
+        cget_status: _ClusterGetStatus,
+        marked_tests_cache: Dict[int, Dict[str, int]],
+        available_instances: List[int],
+    ) -> bool:
+        """Check current conditions once, return True when it is possible to start the test.
+
+        The check is done by the scheduling coordinator when it is enabled, otherwise it is done
+        by this worker under the global cluster lock. The coordinator replies only once the test
+        can start, or once the worker needs to respin the cluster instance.
+        """
+        if coordinator.is_enabled():
+            found, new_status, new_cache, instance_num = coordinator.get_client(
+                self.pytest_tmp_dir
+            ).call(
+                "schedule",
+                worker_id=self.worker_id,
+                cget_status=cget_status,
+                marked_tests_cache=marked_tests_cache,
+                available_instances=available_instances,
+                cluster_instance_num=self._cluster_instance_num,
+            )
+            # the coordinator works on a copy of the status, update the original
+            for field in dataclasses.fields(cget_status):
+                setattr(cget_status, field.name, getattr(new_status, field.name))
+            marked_tests_cache.clear()
+            marked_tests_cache.update(new_cache)
+            self._cluster_instance_num = instance_num
+            # the environment variables were set in the coordinator process
+            if instance_num != -1:
+                cluster_nodes.set_cluster_env(instance_num)
+            return bool(found)
+
+        # nothing time consuming can go under this lock as all other workers will need to wait
+        with locking.FileLockIfXdist(self.cluster_lock):
+            return self._get_step(
+                cget_status=cget_status,
+                marked_tests_cache=marked_tests_cache,
+                available_instances=available_instances,
+            )
+
+    def get_cluster_instance(
         self,
         mark: str = "",
         lock_resources: resources_management.ResourcesType = (),
@@ -724,7 +1272,6 @@ class ClusterGetter:
                 ("singleton" tests).
             start_cmd: Custom command to start the cluster.
         """
-        # pylint: disable=too-many-statements,too-many-branches
         assert not isinstance(lock_resources, str), "`lock_resources` can't be single string"
         assert not isinstance(use_resources, str), "`use_resources` can't be single string"
 
@@ -771,161 +1318,66 @@ class ClusterGetter:
 
         self.log(f"want to run test '{cget_status.current_test}'")
 
+        # no need to wait when the coordinator replies only once the worker can proceed
+        waiter = (
+            wakeup.Waiter(pytest_tmp_dir=self.pytest_tmp_dir, worker_id=self.worker_id)
+            if configuration.IS_XDIST and not coordinator.is_enabled()
+            else None
+        )
+        start_time = time.time()
+        try:
+            instance_num = self._get_cluster_instance_loop(
+                cget_status=cget_status,
+                marked_tests_cache=marked_tests_cache,
+                available_instances=available_instances,
+                waiter=waiter,
+            )
+            if cget_status.blocking_resources:
+                save_resources_wait(
+                    pytest_tmp_dir=self.pytest_tmp_dir,
+                    worker_id=self.worker_id,
+                    resources=cget_status.blocking_resources,
+                    wait_sec=time.time() - start_time,
+                )
+            return instance_num
+        finally:
+            if waiter:
+                waiter.close()
+
+    def _get_cluster_instance_loop(
+        self,
+        cget_status: _ClusterGetStatus,
+        marked_tests_cache: Dict[int, Dict[str, int]],
+        available_instances: List[int],
+        waiter: Optional[wakeup.Waiter],
+    ) -> int:
+        """Check current conditions until it is possible to start the test."""
         # iterate until it is possible to start the test
         while True:
             if cget_status.respin_ready:
-                self._respin(start_cmd=start_cmd)
+                self._respin(start_cmd=cget_status.start_cmd)
 
-            # sleep for a while to avoid too many checks in a short time
-            _xdist_sleep(random.uniform(0.6, 1.2) * cget_status.sleep_delay)
+            # wait for a while to avoid too many checks in a short time
+            if not coordinator.is_enabled():
+                self._wait(cget_status=cget_status, waiter=waiter)
             # pylint: disable=consider-using-max-builtin
             if cget_status.sleep_delay < 1:
                 cget_status.sleep_delay = 1
 
-            # nothing time consuming can go under this lock as all other workers will need to wait
-            with locking.FileLockIfXdist(self.cluster_lock):
-                if self._is_already_running():
-                    return self.cluster_instance_num
-
-                # fail if all cluster instances are dead
-                self._fail_on_all_dead()
-
-                if mark:
-                    # check if tests with my mark are already locked to any cluster instance
-                    cget_status.marked_running_my_anywhere = list(
-                        self.pytest_tmp_dir.glob(
-                            f"{common.CLUSTER_DIR_TEMPLATE}*/"
-                            f"{common.TEST_CURR_MARK_GLOB}_@@{mark}@@_*"
-                        )
-                    )
-
-                # A "prio" test has priority in obtaining cluster instance. Check if it is needed
-                # to wait until earlier "prio" test obtains a cluster instance.
-                if self._wait_for_prio(cget_status):
-                    cget_status.sleep_delay = 5
-                    continue
-
-                # set "prio" for this test if indicated
-                self._init_prio(cget_status)
-
-                self._cluster_instance_num = -1
-
-                # try all existing cluster instances; randomize the order
-                for instance_num in random.sample(available_instances, k=self.num_of_instances):
-                    # if instance to run the test on was already decided, skip all other instances
-                    # pylint: disable=consider-using-in
-                    if (
-                        cget_status.selected_instance != -1
-                        and instance_num != cget_status.selected_instance
-                    ):
-                        continue
-
-                    cget_status.instance_num = instance_num
-                    cget_status.instance_dir = (
-                        self.pytest_tmp_dir / f"{common.CLUSTER_DIR_TEMPLATE}{instance_num}"
-                    )
-                    cget_status.instance_dir.mkdir(exist_ok=True)
-
-                    # cleanup cluster instance where attempt to start cluster failed repeatedly
-                    if (cget_status.instance_dir / common.CLUSTER_DEAD_FILE).exists():
-                        self._cleanup_dead_clusters(cget_status)
-                        continue
-
-                    # cluster respin planned or in progress, so no new tests can start
-                    if self._respun_by_other_worker(cget_status):
-                        cget_status.sleep_delay = 5
-                        continue
-
-                    # are there tests already running on this cluster instance?
-                    cget_status.started_tests_sfiles = list(
-                        cget_status.instance_dir.glob(f"{common.TEST_RUNNING_GLOB}_*")
-                    )
-
-                    # Does the cluster instance needs respin to continue?
-                    # Cache the result as the check itself can be expensive.
-                    cget_status.cluster_needs_respin = self._cluster_needs_respin(instance_num)
-
-                    # "marked tests" = group of tests marked with my mark
-                    cget_status.marked_ready_sfiles = list(
-                        cget_status.instance_dir.glob(f"{common.TEST_CURR_MARK_GLOB}_@@{mark}@@_*")
-                    )
-
-                    # if marked tests are already running, update their status
-                    self._update_marked_tests(
-                        marked_tests_cache=marked_tests_cache, cget_status=cget_status
-                    )
+            found = self._schedule_step(
+                cget_status=cget_status,
+                marked_tests_cache=marked_tests_cache,
+                available_instances=available_instances,
+            )
 
-                    # select this instance for running marked tests if possible
-                    if mark and not self._marked_select_instance(cget_status):
-                        cget_status.sleep_delay = 2
-                        continue
-
-                    # Try next cluster instance when the current one needs respin.
-                    # Respin only if:
-                    # * we are already locked on this instance
-                    # * respin is needed by the current test anyway
-                    # * we already tried all cluster instances and there's no other option
-                    if (
-                        cget_status.cluster_needs_respin
-                        and cget_status.selected_instance != instance_num
-                        and not self._test_needs_respin(cget_status)
-                        and not cget_status.tried_all_instances
-                    ):
-                        continue
-
-                    # We don't need to resolve resources availability if there was already a test
-                    # with this mark before (the first test already resolved the resources
-                    # availability).
-                    # It is responsibility of tests to make sure that the same resources are
-                    # requested for all the tests with the same mark (e.g. specific pool and
-                    # not "any pool").
-                    need_resolve_resources = not cget_status.marked_ready_sfiles
-
-                    # check availability of the required resources
-                    if need_resolve_resources and not self._resolve_resources_availability(
-                        cget_status
-                    ):
-                        cget_status.sleep_delay = 5
-                        continue
-
-                    # if respin is needed, indicate that the cluster will be re-spun
-                    # (after all currently running tests are finished)
-                    if not self._init_respin(cget_status):
-                        continue
-
-                    # we've found suitable cluster instance
-                    cget_status.selected_instance = instance_num
-                    self._cluster_instance_num = instance_num
-                    self.log(f"c{instance_num}: can run test '{cget_status.current_test}'")
-                    # set environment variables that are needed when respinning the cluster
-                    # and running tests
-                    cluster_nodes.set_cluster_env(instance_num)
-
-                    # remove "prio" status file
-                    if prio:
-                        (
-                            self.pytest_tmp_dir / f"{common.PRIO_IN_PROGRESS_GLOB}_{self.worker_id}"
-                        ).unlink(missing_ok=True)
-
-                    # Create status file for marked tests.
-                    # This must be done before the cluster is re-spun, so that other marked tests
-                    # don't try to prepare another cluster instance.
-                    self._init_marked_test(cget_status)
-
-                    # if needed, finish respin related actions
-                    if not self._finish_respin(cget_status):
-                        continue
-
-                    # from this point on, all conditions needed to start the test are met
-                    break
-                else:
-                    # if the test cannot start on any instance, return to top-level loop
-                    cget_status.tried_all_instances = True
-                    continue
-
-                self._create_test_status_files(cget_status)
-
-                # cluster instance is ready, we can start the test
-                break
+            # the cluster instance was swapped with a standby instance, respin it in background
+            if cget_status.standby_respin_instance != -1:
+                standby.start_background_respin(
+                    pytest_tmp_dir=self.pytest_tmp_dir,
+                    instance_num=cget_status.standby_respin_instance,
+                    cli_coverage_dir=self.pytest_config.getoption(artifacts.CLI_COVERAGE_ARG),
+                )
+                cget_status.standby_respin_instance = -1
 
-        return instance_num
+            if found:
+                return self.cluster_instance_num
@@ -2,5 +2,6 @@
 # pylint: disable=unused-import
 # flake8: noqa
 from cardano_node_tests.cluster_management.common import CLUSTER_LOCK
+from cardano_node_tests.cluster_management.common import RESOURCES_WAIT_STATS
 from cardano_node_tests.cluster_management.manager import ClusterManager
 from cardano_node_tests.cluster_management.resources import Resources
@@ -1,6 +1,5 @@
 import re
-from pathlib import Path
-from typing import Iterator
+from typing import Iterable
 from typing import List
 
 CLUSTER_LOCK = ".cluster.lock"
@@ -14,17 +13,23 @@ RESPIN_IN_PROGRESS_GLOB = ".respin_in_progress"
 RESPIN_AFTER_MARK_GLOB = ".respin_after_mark"
 PRIO_IN_PROGRESS_GLOB = ".prio_in_progress"
 TEST_RUNNING_GLOB = ".test_running"
+RESOURCES_WAIT_GLOB = ".resources_wait"
 
 CLUSTER_DIR_TEMPLATE = "cluster"
 CLUSTER_RUNNING_FILE = ".cluster_running"
 CLUSTER_STOPPED_FILE = ".cluster_stopped"
 CLUSTER_DEAD_FILE = ".cluster_dead"
+CLUSTER_STANDBY_FILE = ".cluster_standby"
 CLUSTER_STARTED_BY_FRAMEWORK = ".cluster_started_by_cnt"
 
+# "worker id" used in status records created on behalf of background respin of standby instances
+STANDBY_WORKER_ID = "standby"
+
 CLUSTER_START_CMDS_LOG = "start_cluster_cmds.log"
+RESOURCES_WAIT_STATS = "resources_wait_stats.json"
 
 
-def _get_resources_from_paths(paths: Iterator[Path]) -> List[str]:
-    """Get resources names from status files path."""
-    resources = [re.search("_@@(.+)@@_", str(r)).group(1) for r in paths]  # type: ignore
+def _get_resources_from_names(names: Iterable[str]) -> List[str]:
+    """Get resources names from status records names."""
+    resources = [re.search("_@@(.+)@@_", r).group(1) for r in names]  # type: ignore
     return resources
@@ -0,0 +1,211 @@
+"""Client side of the scheduling coordinator.
+
+The scheduling coordinator is an optional daemon process (enabled by the `SCHEDULING_COORDINATOR`
+env variable) that makes scheduling decisions on behalf of all pytest workers. Instead of
+competing for the global cluster lock and evaluating the scheduling status on their own, the
+workers send `schedule` and `release` requests to the coordinator over a local Unix socket.
+
+The coordinator is the only process that accesses the scheduling status records, it keeps them
+in memory. Other processes (pytest workers, background respins) access the records through
+`CoordinatorStatusStore`, that forwards every operation to the coordinator. As the coordinator
+processes the requests one by one, no global cluster lock is needed.
+
+A `schedule` request is answered only once the test can start (or once the worker needs to act,
+e.g. respin the cluster instance), so the workers don't need to poll. The coordinator checks
+the waiting requests again whenever the status records change.
+
+The coordinator is started by the pytest controller process (xdist master) when the testing
+session starts and it is stopped when the session finishes.
+"""
+import contextlib
+import logging
+import os
+import subprocess
+import sys
+from multiprocessing import connection
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from cardano_node_tests.cluster_management import status_store
+from cardano_node_tests.utils import configuration
+from cardano_node_tests.utils import helpers
+
+LOGGER = logging.getLogger(__name__)
+
+COORDINATOR_SOCKET = ".coordinator.sock"
+COORDINATOR_LOG = "coordinator.log"
+
+
+class CoordinatorError(Exception):
+    pass
+
+
+def get_authkey() -> bytes:
+    """Return key for authenticating connections to the coordinator.
+
+    All pytest workers of a single testrun (and the coordinator started by the pytest controller)
+    share the same testrun UID.
+    """
+    return (os.environ.get("PYTEST_XDIST_TESTRUNUID") or "cardano-node-tests").encode()
+
+
+class CoordinatorClient:
+    """Client for the scheduling coordinator."""
+
+    def __init__(self, pytest_tmp_dir: Path) -> None:
+        self.address = str(pytest_tmp_dir / COORDINATOR_SOCKET)
+        self._conn: Optional[connection.Connection] = None
+
+    def _connect(self) -> connection.Connection:
+        if self._conn is None:
+            try:
+                self._conn = connection.Client(
+                    address=self.address, family="AF_UNIX", authkey=get_authkey()
+                )
+            except OSError as exc:
+                raise CoordinatorError(f"Cannot connect to coordinator: {exc}") from exc
+        return self._conn
+
+    def call(self, method: str, **kwargs: Any) -> Any:
+        """Call method on the coordinator.
+
+        `CoordinatorError` is raised when the coordinator is not available. Any failure that
+        happens after the request was sent is fatal, as the request might have been already
+        processed by the coordinator.
+        """
+        conn = self._connect()
+        try:
+            conn.send((method, kwargs))
+            status, result = conn.recv()
+        except (OSError, EOFError) as exc:
+            self.close()
+            raise RuntimeError(f"Connection to coordinator lost during `{method}`.") from exc
+
+        if status != "ok":
+            raise RuntimeError(f"Coordinator failed to process `{method}`:\n{result}")
+        return result
+
+    def close(self) -> None:
+        if self._conn is not None:
+            with contextlib.suppress(OSError):
+                self._conn.close()
+            self._conn = None
+
+
+# every process (pytest worker) has its own connection to the coordinator
+_CLIENTS: Dict[Path, CoordinatorClient] = {}
+
+
+def get_client(pytest_tmp_dir: Path) -> CoordinatorClient:
+    """Return coordinator client for the pytest run."""
+    client = _CLIENTS.get(pytest_tmp_dir)
+    if client is None:
+        client = CoordinatorClient(pytest_tmp_dir=pytest_tmp_dir)
+        _CLIENTS[pytest_tmp_dir] = client
+    return client
+
+
+class CoordinatorStatusStore(status_store.StatusStore):
+    """Status records kept in memory of the scheduling coordinator.
+
+    Every operation is forwarded to the coordinator.
+    """
+
+    def __init__(self, pytest_tmp_dir: Path) -> None:
+        super().__init__(pytest_tmp_dir=pytest_tmp_dir)
+        self.client = get_client(pytest_tmp_dir)
+
+    def _call(self, operation: str, **kwargs: Any) -> Any:
+        return self.client.call("store", operation=operation, kwargs=kwargs)
+
+    def glob(self, instance_num: int, pattern: str) -> List[str]:
+        return list(self._call("glob", instance_num=instance_num, pattern=pattern))
+
+    def glob_all(self, pattern: str) -> List[Tuple[int, str]]:
+        return list(self._call("glob_all", pattern=pattern))
+
+    def exists(self, instance_num: int, name: str) -> bool:
+        return bool(self._call("exists", instance_num=instance_num, name=name))
+
+    def touch(self, instance_num: int, name: str, content: str = "") -> None:
+        self._call("touch", instance_num=instance_num, name=name, content=content)
+
+    def read_text(self, instance_num: int, name: str) -> str:
+        return str(self._call("read_text", instance_num=instance_num, name=name))
+
+    def unlink(self, instance_num: int, name: str) -> None:
+        self._call("unlink", instance_num=instance_num, name=name)
+
+    def unlink_glob(self, instance_num: int, pattern: str) -> List[str]:
+        return list(self._call("unlink_glob", instance_num=instance_num, pattern=pattern))
+
+
+def is_enabled() -> bool:
+    """Check if scheduling decisions are made by the coordinator."""
+    return configuration.SCHEDULING_COORDINATOR and configuration.IS_XDIST
+
+
+def get_store(pytest_tmp_dir: Path) -> status_store.StatusStore:
+    """Return status store for the pytest run.
+
+    When the coordinator is enabled, the status records are kept by the coordinator.
+    """
+    if is_enabled():
+        return CoordinatorStatusStore(pytest_tmp_dir=pytest_tmp_dir)
+    return status_store.get_store(pytest_tmp_dir)
+
+
+def start_coordinator(pytest_tmp_dir: Path, num_of_instances: int, testrun_uid: str) -> None:
+    """Start the coordinator daemon.
+
+    Called by the pytest controller process before pytest workers are started.
+    """
+    sock_path = pytest_tmp_dir / COORDINATOR_SOCKET
+    cmd = [
+        sys.executable,
+        "-m",
+        "cardano_node_tests.cluster_management.coordinator_server",
+        "--pytest-tmp-dir",
+        str(pytest_tmp_dir),
+        "--num-of-instances",
+        str(num_of_instances),
+        # the coordinator exits when pytest (the xdist controller) is gone
+        "--parent-pid",
+        str(os.getpid()),
+    ]
+    # the coordinator authenticates the workers by the testrun UID
+    env = {**os.environ, "PYTEST_XDIST_TESTRUNUID": testrun_uid}
+    LOGGER.info(f"Starting scheduling coordinator with `{' '.join(cmd)}`.")
+    with open(pytest_tmp_dir / COORDINATOR_LOG, "a", encoding="utf-8") as logfile:
+        # pylint: disable=consider-using-with
+        subprocess.Popen(
+            cmd, stdout=logfile, stderr=subprocess.STDOUT, env=env, start_new_session=True
+        )
+
+    helpers.wait_for(
+        sock_path.exists, delay=1, num_sec=30, message="start the scheduling coordinator"
+    )
+
+
+def stop_coordinator(pytest_tmp_dir: Path, testrun_uid: str) -> None:
+    """Stop the coordinator daemon if it is running."""
+    sock_path = pytest_tmp_dir / COORDINATOR_SOCKET
+    if not sock_path.exists():
+        return
+
+    try:
+        conn = connection.Client(
+            address=str(sock_path), family="AF_UNIX", authkey=testrun_uid.encode()
+        )
+    except OSError as exc:
+        LOGGER.warning(f"Cannot connect to coordinator to stop it: {exc}")
+        return
+
+    with contextlib.suppress(OSError, EOFError):
+        conn.send(("shutdown", {}))
+        conn.recv()
+    conn.close()
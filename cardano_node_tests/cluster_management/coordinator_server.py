@@ -0,0 +1,385 @@
+"""Scheduling coordinator daemon.
+
+See `cardano_node_tests.cluster_management.coordinator` for details. The daemon is started by
+`coordinator.start_coordinator` in the pytest controller process, e.g.
+
+    python -m cardano_node_tests.cluster_management.coordinator_server \
+        --pytest-tmp-dir /tmp/pytest-of-user/pytest-1 --num-of-instances 9 --parent-pid 1234
+"""
+import argparse
+import dataclasses
+import datetime
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from multiprocessing import connection
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from cardano_node_tests.cluster_management import cluster_getter
+from cardano_node_tests.cluster_management import common
+from cardano_node_tests.cluster_management import coordinator
+from cardano_node_tests.cluster_management import status_store
+from cardano_node_tests.utils import configuration
+from cardano_node_tests.utils import locking
+
+LOGGER = logging.getLogger(__name__)
+
+# how often to check if the parent process is still alive
+ALIVE_CHECK_SEC = 5
+
+# how long the result of cluster instance health check is valid
+HEALTH_CHECK_SEC = 10
+
+# operations on status store that workers can request
+STORE_READ_OPS = frozenset(("glob", "glob_all", "exists", "read_text"))
+STORE_WRITE_OPS = frozenset(("touch", "unlink", "unlink_glob"))
+
+
+def _pid_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class _Store(status_store.MemoryStatusStore):
+    """Status records of the coordinator.
+
+    The cached health of a cluster instance is forgotten when the instance was (re)started.
+    """
+
+    def __init__(self, pytest_tmp_dir: Path, health_cache: Dict[int, Tuple[float, bool]]) -> None:
+        super().__init__(pytest_tmp_dir=pytest_tmp_dir)
+        self.health_cache = health_cache
+
+    def touch(self, instance_num: int, name: str, content: str = "") -> None:
+        super().touch(instance_num=instance_num, name=name, content=content)
+        if name == common.CLUSTER_RUNNING_FILE:
+            self.health_cache.pop(instance_num, None)
+
+    def unlink(self, instance_num: int, name: str) -> None:
+        super().unlink(instance_num=instance_num, name=name)
+        if name.startswith(common.RESPIN_IN_PROGRESS_GLOB):
+            self.health_cache.pop(instance_num, None)
+
+
+class _Scheduler(cluster_getter.ClusterScheduler):  # pylint: disable=abstract-method
+    """Scheduler that shares results of health checks with schedulers of other workers."""
+
+    def __init__(self, health_cache: Dict[int, Tuple[float, bool]], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.health_cache = health_cache
+
+    def _is_healthy(self, instance_num: int) -> bool:
+        checked_at, healthy = self.health_cache.get(instance_num, (0.0, False))
+        if time.time() - checked_at > HEALTH_CHECK_SEC:
+            healthy = super()._is_healthy(instance_num)
+            self.health_cache[instance_num] = (time.time(), healthy)
+        return healthy
+
+
+@dataclasses.dataclass
+class _ScheduleRequest:
+    """Scheduling request of a worker that waits for reply."""
+
+    conn: connection.Connection
+    scheduler: _Scheduler
+    cget_status: cluster_getter._ClusterGetStatus
+    marked_tests_cache: Dict[int, Dict[str, int]]
+    available_instances: List[int]
+    check_at: float = 0.0
+    # the check was triggered by change of status records, not by the `check_at` timer
+    woken_up: bool = False
+
+
+class Coordinator:
+    """Make scheduling decisions on behalf of pytest workers."""
+
+    def __init__(self, pytest_tmp_dir: Path, num_of_instances: int) -> None:
+        self.pytest_tmp_dir = pytest_tmp_dir
+        self.num_of_instances = num_of_instances
+        self.log_lock = f"{self.pytest_tmp_dir}/{common.LOG_LOCK}"
+        self._health_cache: Dict[int, Tuple[float, bool]] = {}
+        # the coordinator is the only process that accesses the status records
+        self.store = _Store(pytest_tmp_dir=self.pytest_tmp_dir, health_cache=self._health_cache)
+        self.finished = threading.Event()
+
+        # requests are checked in the order they were received
+        self._pending: List[_ScheduleRequest] = []
+
+        self._conns: List[connection.Connection] = []
+        self._conns_lock = threading.Lock()
+        # wakes up the main loop when new connection is accepted
+        self._wakeup_r, self._wakeup_w = os.pipe()
+
+    def _get_log_func(self, worker_id: str) -> Any:
+        def _log(msg: str) -> None:
+            if not configuration.SCHEDULING_LOG:
+                return
+
+            with locking.FileLockIfXdist(self.log_lock), open(
+                configuration.SCHEDULING_LOG, "a", encoding="utf-8"
+            ) as logfile:
+                logfile.write(f"{datetime.datetime.now()} on {worker_id} (coordinator): {msg}\n")
+
+        return _log
+
+    def _records_changed(self) -> None:
+        """Check all pending requests again, the status records changed.
+
+        Such checks are wakeups, the same as when a worker is woken up by other worker.
+        """
+        now = time.time()
+        for req in self._pending:
+            if req.check_at > now:
+                req.woken_up = True
+            req.check_at = 0.0
+
+    def schedule(
+        self,
+        conn: connection.Connection,
+        worker_id: str,
+        cget_status: cluster_getter._ClusterGetStatus,
+        marked_tests_cache: Dict[int, Dict[str, int]],
+        available_instances: List[int],
+        cluster_instance_num: int,
+    ) -> None:
+        """Queue scheduling request of the worker, the reply is sent once the worker can proceed."""
+        scheduler = _Scheduler(
+            health_cache=self._health_cache,
+            pytest_tmp_dir=self.pytest_tmp_dir,
+            worker_id=worker_id,
+            num_of_instances=self.num_of_instances,
+            log_func=self._get_log_func(worker_id),
+            store=self.store,
+        )
+        scheduler._cluster_instance_num = cluster_instance_num
+        self._pending.append(
+            _ScheduleRequest(
+                conn=conn,
+                scheduler=scheduler,
+                cget_status=cget_status,
+                marked_tests_cache=marked_tests_cache,
+                available_instances=available_instances,
+            )
+        )
+
+    def _check_pending(self) -> None:
+        """Check the pending scheduling requests that are due, reply when the worker can proceed.
+
+        The worker can proceed when the test can start, or when the worker needs to do something
+        time consuming on its own (respin the cluster instance).
+        """
+        changed = False
+        for req in list(self._pending):
+            if req.check_at > time.time():
+                continue
+
+            cget_status = req.cget_status
+            cget_status.woken_up = req.woken_up
+            req.woken_up = False
+            try:
+                found = req.scheduler._get_step(
+                    cget_status=cget_status,
+                    marked_tests_cache=req.marked_tests_cache,
+                    available_instances=req.available_instances,
+                )
+            except Exception:
+                self._pending.remove(req)
+                self._send(conn=req.conn, reply=("error", traceback.format_exc()))
+                continue
+
+            if not (found or cget_status.respin_ready or cget_status.standby_respin_instance != -1):
+                req.check_at = time.time() + max(cget_status.sleep_delay, 1)
+                continue
+
+            self._pending.remove(req)
+            self._send(
+                conn=req.conn,
+                reply=(
+                    "ok",
+                    (
+                        found,
+                        cget_status,
+                        req.marked_tests_cache,
+                        req.scheduler._cluster_instance_num,
+                    ),
+                ),
+            )
+            changed = True
+
+        if changed:
+            self._records_changed()
+
+    def release(self, worker_id: str, instance_num: int) -> Tuple[bool, List[str]]:
+        """Remove status records of a test that finished on the worker."""
+        result = cluster_getter.release_test(
+            store=self.store, instance_num=instance_num, worker_id=worker_id
+        )
+        self._records_changed()
+        return result
+
+    def store_op(self, operation: str, kwargs: Dict[str, Any]) -> Any:
+        """Perform operation on the status store on behalf of a worker."""
+        if operation in STORE_READ_OPS:
+            return getattr(self.store, operation)(**kwargs)
+        if operation in STORE_WRITE_OPS:
+            result = getattr(self.store, operation)(**kwargs)
+            self._records_changed()
+            return result
+        raise ValueError(f"Unknown store operation `{operation}`.")
+
+    def shutdown(self) -> None:
+        """Stop the coordinator."""
+        self.finished.set()
+
+    def _process(self, method: str, kwargs: Dict[str, Any]) -> Any:
+        if method == "release":
+            return self.release(**kwargs)
+        if method == "store":
+            return self.store_op(**kwargs)
+        if method == "shutdown":
+            return self.shutdown()
+        raise ValueError(f"Unknown method `{method}`.")
+
+    def _drop_conn(self, conn: connection.Connection) -> None:
+        """Forget connection closed by the worker, and the worker's pending request."""
+        with self._conns_lock:
+            if conn in self._conns:
+                self._conns.remove(conn)
+        self._pending = [r for r in self._pending if r.conn is not conn]
+
+    def _send(self, conn: connection.Connection, reply: Tuple[str, Any]) -> None:
+        try:
+            conn.send(reply)
+        except (OSError, EOFError):
+            self._drop_conn(conn)
+
+    def _accept(self, listener: connection.Listener) -> None:
+        """Accept new connections from workers."""
+        while not self.finished.is_set():
+            try:
+                conn = listener.accept()
+            except OSError:
+                # the listener was closed
+                return
+            except Exception as err:
+                # e.g. authentication failed
+                LOGGER.warning(f"Failed to accept connection: {err}")
+                continue
+            with self._conns_lock:
+                self._conns.append(conn)
+            os.write(self._wakeup_w, b"x")
+
+    def _get_timeout(self) -> float:
+        """Return how long to wait for requests before checking the pending requests again."""
+        if not self._pending:
+            return ALIVE_CHECK_SEC
+        next_check = min(r.check_at for r in self._pending)
+        return min(max(next_check - time.time(), 0.0), ALIVE_CHECK_SEC)
+
+    def serve(self, listener: connection.Listener, parent_pid: int) -> None:
+        """Process requests until shutdown is requested or the parent process is gone.
+
+        All requests are processed one by one in a single thread, so the scheduling decisions
+        are serialized without workers contending for the global cluster lock.
+        """
+        accept_thread = threading.Thread(target=self._accept, args=(listener,), daemon=True)
+        accept_thread.start()
+
+        while not self.finished.is_set():
+            if parent_pid and not _pid_exists(parent_pid):
+                LOGGER.warning("Parent process is gone, exiting.")
+                break
+
+            with self._conns_lock:
+                conns: List[Any] = [self._wakeup_r, *self._conns]
+
+            for conn in connection.wait(conns, timeout=self._get_timeout()):
+                if conn == self._wakeup_r:
+                    os.read(self._wakeup_r, 1024)
+                    continue
+
+                assert isinstance(conn, connection.Connection)
+                try:
+                    method, kwargs = conn.recv()
+                except (OSError, EOFError):
+                    # the worker closed the connection
+                    self._drop_conn(conn)
+                    continue
+
+                if method == "schedule":
+                    self.schedule(conn=conn, **kwargs)
+                    continue
+
+                try:
+                    reply = ("ok", self._process(method=method, kwargs=kwargs))
+                except Exception:
+                    reply = ("error", traceback.format_exc())
+                self._send(conn=conn, reply=reply)
+
+            self._check_pending()
+
+
+def get_args() -> argparse.Namespace:
+    """Get command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--pytest-tmp-dir",
+        required=True,
+        type=Path,
+        help="Path to pytest root tmp dir",
+    )
+    parser.add_argument(
+        "--num-of-instances",
+        required=True,
+        type=int,
+        help="Number of cluster instances",
+    )
+    parser.add_argument(
+        "--parent-pid",
+        type=int,
+        default=0,
+        help="Exit when process with this PID is gone",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    logging.basicConfig(
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        level=logging.INFO,
+    )
+    args = get_args()
+
+    sock_path = args.pytest_tmp_dir / coordinator.COORDINATOR_SOCKET
+    sock_path.unlink(missing_ok=True)
+
+    coord = Coordinator(pytest_tmp_dir=args.pytest_tmp_dir, num_of_instances=args.num_of_instances)
+    # the listener removes the socket file when closed
+    listener = connection.Listener(
+        address=str(sock_path), family="AF_UNIX", authkey=coordinator.get_authkey()
+    )
+    LOGGER.info(f"Scheduling coordinator listening on '{sock_path}'.")
+
+    try:
+        coord.serve(listener=listener, parent_pid=args.parent_pid)
+    finally:
+        listener.close()
+        LOGGER.info("Scheduling coordinator stopped.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,7 @@ import os
 import shutil
 from pathlib import Path
 from typing import Any
+from typing import Dict
 from typing import Iterable
 from typing import Iterator
 from typing import List
@@ -21,7 +22,9 @@ from cardano_clusterlib import clusterlib
 from cardano_node_tests.cluster_management import cache
 from cardano_node_tests.cluster_management import cluster_getter
 from cardano_node_tests.cluster_management import common
+from cardano_node_tests.cluster_management import coordinator
 from cardano_node_tests.cluster_management import resources_management
+from cardano_node_tests.cluster_management import wakeup
 from cardano_node_tests.utils import artifacts
 from cardano_node_tests.utils import cluster_nodes
 from cardano_node_tests.utils import cluster_scripts
@@ -33,7 +36,9 @@ from cardano_node_tests.utils import temptools
 
 LOGGER = logging.getLogger(__name__)
 
-if configuration.CLUSTERS_COUNT > 1 and configuration.DEV_CLUSTER_RUNNING:
+if (
+    configuration.CLUSTERS_COUNT > 1 or configuration.SPARE_CLUSTERS_COUNT
+) and configuration.DEV_CLUSTER_RUNNING:
     raise RuntimeError("Cannot run multiple cluster instances when 'DEV_CLUSTER_RUNNING' is set.")
 
 
@@ -68,15 +73,22 @@ class ClusterManager:
 
         if configuration.IS_XDIST:
             self.range_num = 5
-            self.num_of_instances = configuration.CLUSTERS_COUNT
+            # the spare instances are in the pool of instances as well, some instances are just
+            # kept in standby
+            self.num_of_instances = (
+                configuration.CLUSTERS_COUNT + configuration.SPARE_CLUSTERS_COUNT
+            )
         else:
             self.range_num = 1
             self.num_of_instances = 1
 
         self.cluster_lock = f"{self.pytest_tmp_dir}/{common.CLUSTER_LOCK}"
         self.log_lock = f"{self.pytest_tmp_dir}/{common.LOG_LOCK}"
+        self.store = coordinator.get_store(self.pytest_tmp_dir)
 
         self._cluster_instance_num = -1
+        # what the test requested, recorded for scheduling of future test runs
+        self.requested: Dict[str, Any] = {}
 
     @property
     def cluster_instance_num(self) -> int:
@@ -139,11 +151,12 @@ class ClusterManager:
         work_dir = cluster_nodes.get_cluster_env().work_dir
 
         for instance_num in range(self.num_of_instances):
-            instance_dir = self.pytest_tmp_dir / f"{common.CLUSTER_DIR_TEMPLATE}{instance_num}"
-            cluster_stopped = (instance_dir / common.CLUSTER_STOPPED_FILE).exists()
-            cluster_started_or_dead = (instance_dir / common.CLUSTER_RUNNING_FILE).exists() or (
-                instance_dir / common.CLUSTER_DEAD_FILE
-            ).exists()
+            cluster_stopped = self.store.exists(
+                instance_num=instance_num, name=common.CLUSTER_STOPPED_FILE
+            )
+            cluster_started_or_dead = self.store.exists(
+                instance_num=instance_num, name=common.CLUSTER_RUNNING_FILE
+            ) or self.store.exists(instance_num=instance_num, name=common.CLUSTER_DEAD_FILE)
 
             if cluster_stopped or not cluster_started_or_dead:
                 self.log(f"c{instance_num}: cluster instance not running")
@@ -174,18 +187,23 @@ class ClusterManager:
                 log_file=state_dir / common.CLUSTER_START_CMDS_LOG,
                 pytest_config=self.pytest_config,
             )
-            artifacts.save_cluster_artifacts(save_dir=self.pytest_tmp_dir, state_dir=state_dir)
+            artifacts.save_cluster_artifacts(
+                save_dir=self.pytest_tmp_dir, state_dir=state_dir, hardlink=True
+            )
 
             shutil.rmtree(state_dir, ignore_errors=True)
 
-            (instance_dir / common.CLUSTER_STOPPED_FILE).touch()
+            self.store.touch(instance_num=instance_num, name=common.CLUSTER_STOPPED_FILE)
             self.log(f"c{instance_num}: stopped cluster instance")
 
     def set_needs_respin(self) -> None:
         """Indicate that the cluster instance needs respin."""
         with locking.FileLockIfXdist(self.cluster_lock):
             self.log(f"c{self.cluster_instance_num}: called `set_needs_respin`")
-            (self.instance_dir / f"{common.RESPIN_NEEDED_GLOB}_{self.worker_id}").touch()
+            self.store.touch(
+                instance_num=self.cluster_instance_num,
+                name=f"{common.RESPIN_NEEDED_GLOB}_{self.worker_id}",
+            )
 
     @contextlib.contextmanager
     def respin_on_failure(self) -> Iterator[None]:
@@ -224,45 +242,46 @@ class ClusterManager:
         current_test = os.environ.get("PYTEST_CURRENT_TEST") or ""
         self.log(f"c{self._cluster_instance_num}: called `on_test_stop` for '{current_test}'")
 
+        instance_num = self._cluster_instance_num
+        if coordinator.is_enabled():
+            self._on_test_stop_coordinator(instance_num=instance_num)
+            return
+
         with locking.FileLockIfXdist(self.cluster_lock):
-            # There's only one test running on a worker at a time. Deleting the corresponding rules
-            # file right after a test is finished is therefore safe. The effect is that the rules
-            # apply only from the time they were added (by `logfiles.add_ignore_rule`) until the end
-            # of the test.
-            # However sometimes we don't want to remove the rules file. Imagine situation when test
-            # failed and cluster instance needs to be respun. The failed test already finished,
-            # but other tests are still running and need to finish first before respin can happen.
-            # If the ignored error continues to get printed into log file, tests that are still
-            # running on the cluster instance would report that error. Therefore if the cluster
-            # instance is scheduled for respin, don't delete the rules file.
-            if not list(self.instance_dir.glob(f"{common.RESPIN_NEEDED_GLOB}_*")):
-                logfiles.clean_ignore_rules(ignore_file_id=self.worker_id)
-
-            # remove resource locking files created by the worker, ignore resources that have mark
-            resource_locking_files = list(
-                self.instance_dir.glob(f"{common.RESOURCE_LOCKED_GLOB}_@@*@@_{self.worker_id}")
+            respin_needed, tnames = cluster_getter.release_test(
+                store=self.store, instance_num=instance_num, worker_id=self.worker_id
             )
-            for f in resource_locking_files:
-                f.unlink()
+            self._clean_ignore_rules(respin_needed=respin_needed)
+            self.log(f"c{instance_num}: running tests: {tnames}")
 
-            # remove "resource in use" files created by the worker, ignore resources that have mark
-            resource_in_use_files = list(
-                self.instance_dir.glob(f"{common.RESOURCE_IN_USE_GLOB}_@@*@@_{self.worker_id}")
-            )
-            for f in resource_in_use_files:
-                f.unlink()
+        # wake up workers that are waiting for resources freed by this test
+        if configuration.IS_XDIST:
+            wakeup.notify_waiters(pytest_tmp_dir=self.pytest_tmp_dir, instance_num=instance_num)
 
-            # remove file that indicates that a test is running on the worker
-            list(self.instance_dir.glob(f"{common.TEST_RUNNING_GLOB}*_{self.worker_id}"))[0].unlink(
-                missing_ok=True
-            )
+    def _on_test_stop_coordinator(self, instance_num: int) -> None:
+        """Let the scheduling coordinator release the resources used by the test."""
+        respin_needed, tnames = coordinator.get_client(self.pytest_tmp_dir).call(
+            "release", worker_id=self.worker_id, instance_num=instance_num
+        )
 
-            # log names of tests that keep running on the cluster instance
-            tnames = [
-                tf.read_text().strip()
-                for tf in self.instance_dir.glob(f"{common.TEST_RUNNING_GLOB}*")
-            ]
-            self.log(f"c{self._cluster_instance_num}: running tests: {tnames}")
+        # the ignore rules file is owned by this worker, no need to hold the cluster lock
+        self._clean_ignore_rules(respin_needed=respin_needed)
+        self.log(f"c{instance_num}: running tests: {tnames}")
+
+    def _clean_ignore_rules(self, respin_needed: bool) -> None:
+        """Clean ignore rules of the finished test."""
+        # There's only one test running on a worker at a time. Deleting the corresponding rules
+        # file right after a test is finished is therefore safe. The effect is that the rules
+        # apply only from the time they were added (by `logfiles.add_ignore_rule`) until the end
+        # of the test.
+        # However sometimes we don't want to remove the rules file. Imagine situation when test
+        # failed and cluster instance needs to be respun. The failed test already finished,
+        # but other tests are still running and need to finish first before respin can happen.
+        # If the ignored error continues to get printed into log file, tests that are still
+        # running on the cluster instance would report that error. Therefore if the cluster
+        # instance is scheduled for respin, don't delete the rules file.
+        if not respin_needed:
+            logfiles.clean_ignore_rules(ignore_file_id=self.worker_id)
 
     def _get_resources_by_glob(
         self,
@@ -272,7 +291,11 @@ class ClusterManager:
         if from_set is not None and isinstance(from_set, str):
             raise AssertionError("`from_set` cannot be a string")
 
-        resources_locked = set(common._get_resources_from_paths(paths=self.instance_dir.glob(glob)))
+        resources_locked = set(
+            common._get_resources_from_names(
+                names=self.store.glob(instance_num=self.cluster_instance_num, pattern=glob)
+            )
+        )
 
         if from_set is not None:
             return list(resources_locked.intersection(from_set))
@@ -343,6 +366,11 @@ class ClusterManager:
 
         **IMPORTANT**: This method must be called before any other method of this class.
         """
+        self.requested = {
+            "mark": mark,
+            "lock_resources": sorted(r for r in lock_resources if isinstance(r, str)),
+        }
+
         # get number of initialized cluster instance once it is possible to start a test
         instance_num = cluster_getter.ClusterGetter(
             tmp_path_factory=self.tmp_path_factory,
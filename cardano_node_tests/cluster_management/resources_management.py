@@ -62,3 +62,22 @@ def get_resources(
         selected_resources.extend(filtered)
 
     return list({*named_resources, *selected_resources})
+
+
+def get_unavailable(
+    resources: ResourcesType,
+    unavailable: Iterable[str],
+) -> List[str]:
+    """Get unavailable resources that prevent `resources` from being used or locked."""
+    unavailable_set = set(unavailable)
+    named_resources = [r for r in resources if isinstance(r, str)]
+    blocking = {r for r in named_resources if r in unavailable_set}
+
+    # a filter is blocked only when it cannot select any resource at all
+    already_unavailable = {*unavailable_set, *named_resources}
+    resources_w_filter = [r for r in resources if not isinstance(r, str)]
+    for res_filter in resources_w_filter:
+        if not res_filter.filter(unavailable=already_unavailable):
+            blocking.update(r for r in res_filter.resources if r in unavailable_set)
+
+    return sorted(blocking)
@@ -0,0 +1,114 @@
+"""Warm-standby cluster instances.
+
+When `SPARE_CLUSTERS_COUNT` is set, that many cluster instances are started on top of the
+`CLUSTERS_COUNT` instances. The spare instances are started in background and are kept in standby,
+i.e. no tests are scheduled on them.
+
+When an instance needs respin (and no custom start command is needed), it is swapped with a ready
+standby instance. The standby instance becomes active right away, and the instance that needed
+respin is respun in a background process. Once respun, it becomes a standby instance.
+When there is no standby instance ready, the instance is respun by the worker as usual.
+"""
+import contextlib
+import logging
+import os
+import signal
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+from cardano_node_tests.cluster_management import common
+from cardano_node_tests.cluster_management import coordinator
+from cardano_node_tests.utils import cluster_nodes
+from cardano_node_tests.utils import cluster_scripts
+from cardano_node_tests.utils import configuration
+from cardano_node_tests.utils import helpers
+
+LOGGER = logging.getLogger(__name__)
+
+STANDBY_PID_GLOB = ".standby_respin"
+
+
+def get_pid_file(pytest_tmp_dir: Path, instance_num: int) -> Path:
+    return pytest_tmp_dir / f"{STANDBY_PID_GLOB}_c{instance_num}.pid"
+
+
+def start_background_respin(
+    pytest_tmp_dir: Path, instance_num: int, cli_coverage_dir: Optional[str] = None
+) -> None:
+    """Start respin of the cluster instance in a background process.
+
+    The "respin in progress" status record for the instance must be already created, under
+    the global cluster lock.
+    """
+    cmd = [
+        sys.executable,
+        "-m",
+        "cardano_node_tests.cluster_management.standby_respin",
+        "--pytest-tmp-dir",
+        str(pytest_tmp_dir),
+        "--instance-num",
+        str(instance_num),
+    ]
+    if cli_coverage_dir:
+        cmd.extend(["--cli-coverage-dir", str(cli_coverage_dir)])
+
+    LOGGER.info(f"Starting background respin with `{' '.join(cmd)}`.")
+    with open(
+        pytest_tmp_dir / f"standby_respin_c{instance_num}.log", "a", encoding="utf-8"
+    ) as logfile:
+        # pylint: disable=consider-using-with
+        proc = subprocess.Popen(
+            cmd, stdout=logfile, stderr=subprocess.STDOUT, start_new_session=True
+        )
+    get_pid_file(pytest_tmp_dir=pytest_tmp_dir, instance_num=instance_num).write_text(str(proc.pid))
+
+
+def init_spare_instances(pytest_tmp_dir: Path, cli_coverage_dir: Optional[str] = None) -> None:
+    """Start the spare cluster instances in background.
+
+    Must be called under the global cluster lock.
+    """
+    store = coordinator.get_store(pytest_tmp_dir)
+    first_spare = configuration.CLUSTERS_COUNT
+    for instance_num in range(first_spare, first_spare + configuration.SPARE_CLUSTERS_COUNT):
+        instance_dir = pytest_tmp_dir / f"{common.CLUSTER_DIR_TEMPLATE}{instance_num}"
+        instance_dir.mkdir(exist_ok=True)
+
+        # already initialized by other worker
+        if store.exists(
+            instance_num=instance_num,
+            name=f"{common.RESPIN_IN_PROGRESS_GLOB}_{common.STANDBY_WORKER_ID}",
+        ) or store.exists(instance_num=instance_num, name=common.CLUSTER_RUNNING_FILE):
+            continue
+
+        store.touch(
+            instance_num=instance_num,
+            name=f"{common.RESPIN_IN_PROGRESS_GLOB}_{common.STANDBY_WORKER_ID}",
+        )
+        start_background_respin(
+            pytest_tmp_dir=pytest_tmp_dir,
+            instance_num=instance_num,
+            cli_coverage_dir=cli_coverage_dir,
+        )
+
+
+def stop_background_respins(pytest_tmp_dir: Path) -> None:
+    """Kill background respins that are still in progress."""
+    work_dir = cluster_nodes.get_cluster_env().work_dir
+    for pid_file in pytest_tmp_dir.glob(f"{STANDBY_PID_GLOB}_c*.pid"):
+        instance_num = int(pid_file.stem.split("_c")[-1])
+        LOGGER.info(f"Stopping background respin of cluster instance {instance_num}.")
+
+        # the start script is in the process group of the background respin
+        with contextlib.suppress(ProcessLookupError, ValueError):
+            os.killpg(int(pid_file.read_text().strip()), signal.SIGTERM)
+        pid_file.unlink(missing_ok=True)
+
+        # the cluster instance might be partially started
+        stop_script = (
+            work_dir / f"{cluster_nodes.STATE_CLUSTER}{instance_num}" / cluster_scripts.STOP_SCRIPT
+        )
+        if stop_script.exists():
+            helpers.run_command(str(stop_script), ignore_fail=True)
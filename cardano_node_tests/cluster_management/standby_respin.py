@@ -0,0 +1,137 @@
+"""Background respin of a cluster instance that is put to standby afterwards.
+
+See `cardano_node_tests.cluster_management.standby` for details. The background respin is started
+by `standby.start_background_respin`, e.g.
+
+    python -m cardano_node_tests.cluster_management.standby_respin \
+        --pytest-tmp-dir /tmp/pytest-of-user/pytest-1 --instance-num 9
+"""
+import argparse
+import datetime
+import logging
+import sys
+from pathlib import Path
+from typing import Optional
+
+from cardano_clusterlib import clusterlib
+
+from cardano_node_tests.cluster_management import cluster_getter
+from cardano_node_tests.cluster_management import common
+from cardano_node_tests.cluster_management import standby
+from cardano_node_tests.utils import artifacts
+from cardano_node_tests.utils import cluster_nodes
+from cardano_node_tests.utils import configuration
+from cardano_node_tests.utils import locking
+
+LOGGER = logging.getLogger(__name__)
+
+
+class StandbyRespinner(cluster_getter.ClusterScheduler):
+    """Respin cluster instance outside of pytest and put it to standby."""
+
+    def __init__(
+        self, pytest_tmp_dir: Path, instance_num: int, cli_coverage_dir: Optional[str]
+    ) -> None:
+        super().__init__(
+            pytest_tmp_dir=pytest_tmp_dir,
+            worker_id=common.STANDBY_WORKER_ID,
+            num_of_instances=configuration.CLUSTERS_COUNT + configuration.SPARE_CLUSTERS_COUNT,
+            log_func=self._log,
+        )
+        self.cli_coverage_dir = cli_coverage_dir
+        self.log_lock = f"{self.pytest_tmp_dir}/{common.LOG_LOCK}"
+        self._cluster_instance_num = instance_num
+
+    def _log(self, msg: str) -> None:
+        if not configuration.SCHEDULING_LOG:
+            return
+
+        with locking.FileLockIfXdist(self.log_lock), open(
+            configuration.SCHEDULING_LOG, "a", encoding="utf-8"
+        ) as logfile:
+            logfile.write(f"{datetime.datetime.now()} on {self.worker_id}: {msg}\n")
+
+    def _create_addrs_data_dir(self) -> Path:
+        addrs_dir = (
+            self.instance_dir / f"addrs_data_ci{self.cluster_instance_num}_"
+            f"{clusterlib.get_rand_str(8)}"
+        )
+        addrs_dir.mkdir(parents=True)
+        return addrs_dir
+
+    def _save_start_script_coverage(self, log_file: Path) -> None:
+        if self.cli_coverage_dir:
+            artifacts.copy_start_script_coverage(
+                log_file=log_file, cli_coverage_dir=Path(self.cli_coverage_dir)
+            )
+
+    def respin(self) -> bool:
+        """Respin the cluster instance and put it to standby."""
+        instance_num = self.cluster_instance_num
+        cluster_nodes.set_cluster_env(instance_num)
+
+        try:
+            respun = self._respin()
+        except Exception as err:
+            self.log(f"c{instance_num}: background respin failed:\n{err}")
+            with locking.FileLockIfXdist(self.cluster_lock):
+                self.store.touch(instance_num=instance_num, name=common.CLUSTER_DEAD_FILE)
+            respun = False
+
+        with locking.FileLockIfXdist(self.cluster_lock):
+            if respun:
+                self.log(f"c{instance_num}: putting cluster instance to standby")
+                self.store.touch(instance_num=instance_num, name=common.CLUSTER_STANDBY_FILE)
+            self.store.unlink(
+                instance_num=instance_num,
+                name=f"{common.RESPIN_IN_PROGRESS_GLOB}_{common.STANDBY_WORKER_ID}",
+            )
+
+        standby.get_pid_file(pytest_tmp_dir=self.pytest_tmp_dir, instance_num=instance_num).unlink(
+            missing_ok=True
+        )
+        self._notify_waiters(instance_num=instance_num)
+        return respun
+
+
+def get_args() -> argparse.Namespace:
+    """Get command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--pytest-tmp-dir",
+        required=True,
+        type=Path,
+        help="Path to pytest root tmp dir",
+    )
+    parser.add_argument(
+        "--instance-num",
+        required=True,
+        type=int,
+        help="Number of cluster instance to respin",
+    )
+    parser.add_argument(
+        "--cli-coverage-dir",
+        help="Path to directory for storing coverage info",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    logging.basicConfig(
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        level=logging.INFO,
+    )
+    args = get_args()
+
+    respinner = StandbyRespinner(
+        pytest_tmp_dir=args.pytest_tmp_dir,
+        instance_num=args.instance_num,
+        cli_coverage_dir=args.cli_coverage_dir,
+    )
+    retval = 0 if respinner.respin() else 1
+    artifacts.wait_for_background_tasks()
+    return retval
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""Storage for status records used for scheduling tests on cluster instances.
+
+The status records (tests running, marks, locked and used resources, respin flags, etc.) can be
+stored either as marker files in the `clusterN` dirs (the "files" backend, default), or as indexed
+records in a single SQLite database (the "sqlite" backend). The backend is selected by the
+`SCHEDULING_BACKEND` env variable.
+
+Names of the records are the same for both backends, so glob patterns that are used for matching
+the marker files can be used for matching the database records as well.
+
+The records are supposed to be modified only under the global cluster lock. When the scheduling
+coordinator is enabled, the records are kept in memory of the coordinator process instead (see
+`cardano_node_tests.cluster_management.coordinator`).
+"""
+import fnmatch
+import sqlite3
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from cardano_node_tests.cluster_management import common
+from cardano_node_tests.utils import configuration
+
+# "instance number" for records that are not specific to any cluster instance
+ROOT = -1
+
+SQLITE_DB = ".scheduling_status.db"
+
+
+class StatusStore:
+    """Base class for storage of status records."""
+
+    def __init__(self, pytest_tmp_dir: Path) -> None:
+        self.pytest_tmp_dir = pytest_tmp_dir
+
+    def glob(self, instance_num: int, pattern: str) -> List[str]:
+        """Return names of records on the cluster instance that match the glob pattern."""
+        raise NotImplementedError()
+
+    def glob_all(self, pattern: str) -> List[Tuple[int, str]]:
+        """Return `(instance_num, name)` of records on all cluster instances that match the pattern.
+
+        Records that are not specific to any cluster instance are not included.
+        """
+        raise NotImplementedError()
+
+    def exists(self, instance_num: int, name: str) -> bool:
+        """Check if the record exists."""
+        raise NotImplementedError()
+
+    def touch(self, instance_num: int, name: str, content: str = "") -> None:
+        """Create the record, or replace content of existing record."""
+        raise NotImplementedError()
+
+    def read_text(self, instance_num: int, name: str) -> str:
+        """Return content of the record."""
+        raise NotImplementedError()
+
+    def unlink(self, instance_num: int, name: str) -> None:
+        """Remove the record, if it exists."""
+        raise NotImplementedError()
+
+    def unlink_glob(self, instance_num: int, pattern: str) -> List[str]:
+        """Remove all records that match the glob pattern and return their names."""
+        names = self.glob(instance_num=instance_num, pattern=pattern)
+        for name in names:
+            self.unlink(instance_num=instance_num, name=name)
+        return names
+
+
+class FilesStatusStore(StatusStore):
+    """Status records stored as marker files in the `clusterN` dirs."""
+
+    def _get_dir(self, instance_num: int) -> Path:
+        if instance_num == ROOT:
+            return self.pytest_tmp_dir
+        return self.pytest_tmp_dir / f"{common.CLUSTER_DIR_TEMPLATE}{instance_num}"
+
+    def glob(self, instance_num: int, pattern: str) -> List[str]:
+        return [p.name for p in self._get_dir(instance_num).glob(pattern)]
+
+    def glob_all(self, pattern: str) -> List[Tuple[int, str]]:
+        records = []
+        for p in self.pytest_tmp_dir.glob(f"{common.CLUSTER_DIR_TEMPLATE}*/{pattern}"):
+            instance_str = p.parent.name.replace(common.CLUSTER_DIR_TEMPLATE, "")
+            if not instance_str.isdigit():
+                continue
+            records.append((int(instance_str), p.name))
+        return records
+
+    def exists(self, instance_num: int, name: str) -> bool:
+        return (self._get_dir(instance_num) / name).exists()
+
+    def touch(self, instance_num: int, name: str, content: str = "") -> None:
+        status_file = self._get_dir(instance_num) / name
+        if content:
+            status_file.write_text(content)
+        else:
+            status_file.touch()
+
+    def read_text(self, instance_num: int, name: str) -> str:
+        return (self._get_dir(instance_num) / name).read_text()
+
+    def unlink(self, instance_num: int, name: str) -> None:
+        (self._get_dir(instance_num) / name).unlink(missing_ok=True)
+
+
+class SQLiteStatusStore(StatusStore):
+    """Status records stored in a single SQLite database.
+
+    The records are indexed by cluster instance number and record name, so matching a glob
+    pattern with a fixed prefix is an index lookup instead of a directory scan.
+    """
+
+    def __init__(self, pytest_tmp_dir: Path) -> None:
+        super().__init__(pytest_tmp_dir=pytest_tmp_dir)
+        self.db_file = pytest_tmp_dir / SQLITE_DB
+        # the connection is in autocommit mode, every statement is a transaction on its own
+        self.conn = sqlite3.connect(self.db_file, timeout=60, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS status ("
+            "instance INTEGER NOT NULL, "
+            "name TEXT NOT NULL, "
+            "content TEXT NOT NULL DEFAULT '', "
+            "PRIMARY KEY (instance, name))"
+        )
+
+    def glob(self, instance_num: int, pattern: str) -> List[str]:
+        cur = self.conn.execute(
+            "SELECT name FROM status WHERE instance = ? AND name GLOB ?;", (instance_num, pattern)
+        )
+        return [r[0] for r in cur.fetchall()]
+
+    def glob_all(self, pattern: str) -> List[Tuple[int, str]]:
+        cur = self.conn.execute(
+            "SELECT instance, name FROM status WHERE instance >= 0 AND name GLOB ?;", (pattern,)
+        )
+        return [(r[0], r[1]) for r in cur.fetchall()]
+
+    def exists(self, instance_num: int, name: str) -> bool:
+        cur = self.conn.execute(
+            "SELECT 1 FROM status WHERE instance = ? AND name = ?;", (instance_num, name)
+        )
+        return cur.fetchone() is not None
+
+    def touch(self, instance_num: int, name: str, content: str = "") -> None:
+        self.conn.execute(
+            "INSERT INTO status (instance, name, content) VALUES (?, ?, ?) "
+            "ON CONFLICT (instance, name) DO UPDATE SET content = excluded.content;",
+            (instance_num, name, content),
+        )
+
+    def read_text(self, instance_num: int, name: str) -> str:
+        cur = self.conn.execute(
+            "SELECT content FROM status WHERE instance = ? AND name = ?;", (instance_num, name)
+        )
+        row = cur.fetchone()
+        if row is None:
+            raise FileNotFoundError(f"Status record '{name}' doesn't exist on c{instance_num}.")
+        return str(row[0])
+
+    def unlink(self, instance_num: int, name: str) -> None:
+        self.conn.execute(
+            "DELETE FROM status WHERE instance = ? AND name = ?;", (instance_num, name)
+        )
+
+    def unlink_glob(self, instance_num: int, pattern: str) -> List[str]:
+        names = self.glob(instance_num=instance_num, pattern=pattern)
+        self.conn.execute(
+            "DELETE FROM status WHERE instance = ? AND name GLOB ?;", (instance_num, pattern)
+        )
+        return names
+
+
+class MemoryStatusStore(StatusStore):
+    """Status records kept in memory of a single process.
+
+    Used by the scheduling coordinator, which is the only process that accesses the records.
+    """
+
+    def __init__(self, pytest_tmp_dir: Path) -> None:
+        super().__init__(pytest_tmp_dir=pytest_tmp_dir)
+        self.records: Dict[int, Dict[str, str]] = {}
+
+    def glob(self, instance_num: int, pattern: str) -> List[str]:
+        return fnmatch.filter(self.records.get(instance_num) or {}, pattern)
+
+    def glob_all(self, pattern: str) -> List[Tuple[int, str]]:
+        return [
+            (instance_num, name)
+            for instance_num, records in self.records.items()
+            if instance_num != ROOT
+            for name in fnmatch.filter(records, pattern)
+        ]
+
+    def exists(self, instance_num: int, name: str) -> bool:
+        return name in (self.records.get(instance_num) or {})
+
+    def touch(self, instance_num: int, name: str, content: str = "") -> None:
+        self.records.setdefault(instance_num, {})[name] = content
+
+    def read_text(self, instance_num: int, name: str) -> str:
+        try:
+            return self.records[instance_num][name]
+        except KeyError as exc:
+            raise FileNotFoundError(
+                f"Status record '{name}' doesn't exist on c{instance_num}."
+            ) from exc
+
+    def unlink(self, instance_num: int, name: str) -> None:
+        (self.records.get(instance_num) or {}).pop(name, None)
+
+
+# every process (pytest worker) has its own connection to the store
+_STORES: Dict[Path, StatusStore] = {}
+
+
+def get_store(pytest_tmp_dir: Path) -> StatusStore:
+    """Return status store for the pytest run, backend is selected by `SCHEDULING_BACKEND`."""
+    store = _STORES.get(pytest_tmp_dir)
+    if store is not None:
+        return store
+
+    if configuration.SCHEDULING_BACKEND == "sqlite":
+        store = SQLiteStatusStore(pytest_tmp_dir=pytest_tmp_dir)
+    else:
+        store = FilesStatusStore(pytest_tmp_dir=pytest_tmp_dir)
+
+    _STORES[pytest_tmp_dir] = store
+    return store
@@ -0,0 +1,128 @@
+"""Wakeup notifications for pytest workers that are waiting for a cluster instance.
+
+A waiting worker binds a Unix datagram socket in the pytest root tmp dir and waits on it instead
+of plain sleeping. When a worker frees a cluster instance (e.g. test finished, respin finished),
+it sends a notification to the workers waiting for that cluster instance, and to the workers that
+are waiting for any cluster instance.
+
+The notifications are just hints that the scheduling status might have changed, the waiting
+worker still needs to check the status under the global cluster lock. When the notification
+is lost (or cannot be delivered at all), the worker wakes up after the usual sleep delay.
+"""
+import contextlib
+import logging
+import select
+import socket
+import time
+from pathlib import Path
+from typing import List
+from typing import Optional
+
+LOGGER = logging.getLogger(__name__)
+
+WAITER_SOCKET_GLOB = ".waiter"
+
+# instance number of workers that are not waiting for any particular cluster instance
+ANY_INSTANCE = -1
+
+
+def _instance_str(instance_num: int) -> str:
+    return "any" if instance_num == ANY_INSTANCE else str(instance_num)
+
+
+class Waiter:
+    """Wait for wakeup notification or for timeout, whatever comes first."""
+
+    def __init__(self, pytest_tmp_dir: Path, worker_id: str) -> None:
+        self.pytest_tmp_dir = pytest_tmp_dir
+        self.worker_id = worker_id
+        self._sock: Optional[socket.socket] = None
+        self._sock_path: Optional[Path] = None
+        self._disabled = False
+
+    def _get_sock_path(self, instance_num: int) -> Path:
+        return (
+            self.pytest_tmp_dir
+            / f"{WAITER_SOCKET_GLOB}_c{_instance_str(instance_num)}_{self.worker_id}.sock"
+        )
+
+    def _bind(self, instance_num: int) -> Optional[socket.socket]:
+        """Bind socket for receiving notifications for given cluster instance."""
+        if self._disabled:
+            return None
+
+        sock_path = self._get_sock_path(instance_num)
+        if self._sock and self._sock_path == sock_path:
+            return self._sock
+
+        self.close()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock_path.unlink(missing_ok=True)
+        try:
+            sock.bind(str(sock_path))
+        except OSError as exc:
+            # e.g. the path is too long for Unix socket, fall back to plain sleeping
+            LOGGER.warning(f"Cannot bind wakeup socket '{sock_path}', using sleep: {exc}")
+            sock.close()
+            self._disabled = True
+            return None
+
+        sock.setblocking(False)
+        self._sock = sock
+        self._sock_path = sock_path
+        return sock
+
+    def wait(self, timeout: float, instance_num: int = ANY_INSTANCE) -> bool:
+        """Wait until notified or until timeout.
+
+        Return True when woken up by notification.
+        """
+        sock = self._bind(instance_num)
+        if sock is None:
+            time.sleep(timeout)
+            return False
+
+        ready, *__ = select.select([sock], [], [], timeout)
+        if not ready:
+            return False
+
+        # drain all pending notifications, one status check is enough for all of them
+        with contextlib.suppress(OSError):
+            while True:
+                sock.recv(16)
+
+        return True
+
+    def close(self) -> None:
+        """Close the socket and remove the socket file."""
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+        if self._sock_path:
+            self._sock_path.unlink(missing_ok=True)
+            self._sock_path = None
+
+
+def _get_waiters_socks(pytest_tmp_dir: Path, instance_num: int) -> List[Path]:
+    if instance_num == ANY_INSTANCE:
+        return list(pytest_tmp_dir.glob(f"{WAITER_SOCKET_GLOB}_c*_*.sock"))
+
+    return [
+        *pytest_tmp_dir.glob(f"{WAITER_SOCKET_GLOB}_c{instance_num}_*.sock"),
+        *pytest_tmp_dir.glob(f"{WAITER_SOCKET_GLOB}_cany_*.sock"),
+    ]
+
+
+def notify_waiters(pytest_tmp_dir: Path, instance_num: int = ANY_INSTANCE) -> None:
+    """Wake up workers waiting for the cluster instance (all waiting workers by default)."""
+    socks = _get_waiters_socks(pytest_tmp_dir=pytest_tmp_dir, instance_num=instance_num)
+    if not socks:
+        return
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+        sock.setblocking(False)
+        for sock_path in socks:
+            # the waiter might be already gone, or its queue is full and it will wake up anyway
+            with contextlib.suppress(OSError):
+                sock.sendto(b"1", str(sock_path))
@@ -1,12 +1,64 @@
+import collections
+import json
+import logging
 from collections import OrderedDict
+from pathlib import Path
 from typing import Any
+from typing import Counter
+from typing import Dict
+from typing import List
+from typing import Set
 
 import pytest
+from _pytest.config import Config
+from _pytest.main import Session
+from _pytest.reports import TestReport
 from xdist import scheduler
 from xdist import workermanage
 
+from cardano_node_tests.utils import configuration
+
+LOGGER = logging.getLogger(__name__)
+
 LONG_MARKER = "long"
 
+# name of the user property where the cluster manager records what the test requested
+CLUSTER_REQUEST_PROP = "cluster_request"
+
+# estimated duration of tests that are not recorded in the durations DB yet
+DEFAULT_DURATION = 30.0
+DEFAULT_LONG_DURATION = 1800.0
+
+# weight of the last measured duration when updating the durations DB
+DURATION_WEIGHT = 0.5
+
+
+def get_base_nodeid(nodeid: str) -> str:
+    """Return nodeid without the group name and long-running marker suffixes."""
+    # check the index of ']' to avoid the case: parametrize mark value has '@'
+    param_end_idx = nodeid.rfind("]")
+    scope_start_idx = param_end_idx if param_end_idx != -1 else 0
+
+    suffix_idx = nodeid.find("@", scope_start_idx)
+    if suffix_idx == -1:
+        return nodeid
+    return nodeid[:suffix_idx]
+
+
+def load_durations(db_file: Path) -> Dict[str, dict]:
+    """Load durations DB, i.e. records of durations and requested resources of tests."""
+    if not db_file.exists():
+        return {}
+
+    try:
+        with open(db_file, encoding="utf-8") as in_json:
+            durations: Dict[str, dict] = json.load(in_json)
+    except (OSError, ValueError) as err:
+        LOGGER.warning(f"Failed to load durations DB '{db_file}': {err}")
+        return {}
+
+    return durations
+
 
 class OneLongScheduling(scheduler.LoadScopeScheduling):
     """Scheduling plugin that tries to schedule no more than one long-running test per worker.
@@ -98,6 +150,20 @@ class OneLongScheduling(scheduler.LoadScopeScheduling):
 
         return ""
 
+    def _select_scope(self, assigned_to_node: OrderedDict) -> str:
+        """Select a work unit for a node, return empty string when there is no preference."""
+        # check if there are any long-running tests already pending
+        long_pending = self._is_long_pending(assigned_to_node)
+
+        if long_pending:
+            # try to find a work unit with no long-running test if there is already a long-running
+            # test pending
+            return self._get_short_scope()
+
+        # Try to find a work unit with long-running test if there is no long-running test
+        # pending. We want to schedule long-running tests as early as possible
+        return self._get_long_scope()
+
     def _assign_work_unit(self, node: workermanage.WorkerController) -> None:
         """Assign a work unit to a node."""
         assert self.workqueue
@@ -105,21 +171,9 @@ class OneLongScheduling(scheduler.LoadScopeScheduling):
         assigned_to_node = self.assigned_work.setdefault(node, default=OrderedDict())
         scope, work_unit = None, None
 
-        # check if there are any long-running tests already pending
-        long_pending = self._is_long_pending(assigned_to_node)
-
-        if long_pending:
-            # try to find a work unit with no long-running test if there is already a long-running
-            # test pending
-            scope = self._get_short_scope()
-            if scope:
-                work_unit = self.workqueue.pop(scope)
-        else:
-            # Try to find a work unit with long-running test if there is no long-running test
-            # pending. We want to schedule long-running tests as early as possible
-            scope = self._get_long_scope()
-            if scope:
-                work_unit = self.workqueue.pop(scope)
+        scope = self._select_scope(assigned_to_node)
+        if scope:
+            work_unit = self.workqueue.pop(scope)
 
         # grab the first unit of work if none was grabbed above
         if work_unit is None:
@@ -139,6 +193,143 @@ class OneLongScheduling(scheduler.LoadScopeScheduling):
         node.send_runtest_some(nodeids_indexes)
 
 
+class CostAwareScheduling(OneLongScheduling):
+    """Scheduling plugin that uses durations of tests recorded in previous runs.
+
+    Work units are assigned in the longest-processing-time-first order, so the long work units
+    don't end up at the tail of the testrun, where other workers would be idle.
+
+    A resource (e.g. `Resources.PERF`) can be locked only by a single test on a cluster instance,
+    so there's no point in having more work units that lock the same resource pending than there
+    are cluster instances. Such work units would just wait for the resource while blocking
+    the worker. These work units are postponed when possible.
+
+    The "one long-running test per worker" rule still applies.
+    """
+
+    # pylint: disable=abstract-method
+
+    def __init__(self, config: Config, log: Any, durations: Dict[str, dict]) -> None:
+        super().__init__(config, log)
+        self.durations = durations
+        self.max_locks = configuration.CLUSTERS_COUNT or 1
+        self._sorted_scopes: List[str] = []
+
+        known = sorted(r["duration"] for r in durations.values() if "duration" in r)
+        self.default_duration = known[len(known) // 2] if known else DEFAULT_DURATION
+
+    def _get_nodeid_cost(self, nodeid: str) -> float:
+        record = self.durations.get(get_base_nodeid(nodeid)) or {}
+        if "duration" in record:
+            return float(record["duration"])
+        if nodeid.endswith(f"@{LONG_MARKER}"):
+            return DEFAULT_LONG_DURATION
+        return self.default_duration
+
+    def _get_nodeids_locks(self, nodeids: Dict[str, bool]) -> Set[str]:
+        """Return resources that were locked by the tests (not yet completed) in previous runs."""
+        locks: Set[str] = set()
+        for nodeid, is_completed in nodeids.items():
+            if is_completed:
+                continue
+            record = self.durations.get(get_base_nodeid(nodeid)) or {}
+            locks.update(record.get("lock_resources") or ())
+        return locks
+
+    def _get_pending_locks(self) -> Counter[str]:
+        """Return number of pending work units that lock each resource."""
+        pending: Counter[str] = collections.Counter()
+        for assigned_to_node in self.assigned_work.values():
+            for nodeids_dict in assigned_to_node.values():
+                pending.update(self._get_nodeids_locks(nodeids_dict))
+        return pending
+
+    def _get_sorted_scopes(self) -> List[str]:
+        """Return scopes from the workqueue sorted by the cost, most expensive first."""
+        # the workqueue doesn't get new work units after the initial distribution
+        if not self._sorted_scopes:
+            self._sorted_scopes = sorted(
+                self.workqueue,
+                key=lambda sc: sum(self._get_nodeid_cost(n) for n in self.workqueue[sc]),
+                reverse=True,
+            )
+        self._sorted_scopes = [sc for sc in self._sorted_scopes if sc in self.workqueue]
+        return self._sorted_scopes
+
+    def _select_scope(self, assigned_to_node: OrderedDict) -> str:
+        long_pending = self._is_long_pending(assigned_to_node)
+        pending_locks = self._get_pending_locks()
+
+        fallback = ""
+        for scope in self._get_sorted_scopes():
+            nodeids_dict = self.workqueue[scope]
+            if long_pending and any(n.endswith(f"@{LONG_MARKER}") for n in nodeids_dict):
+                continue
+
+            fallback = fallback or scope
+            locks = self._get_nodeids_locks(nodeids_dict)
+            if all(pending_locks[r] < self.max_locks for r in locks):
+                return str(scope)
+
+        # all the remaining work units would wait for resources, take the most expensive one
+        return str(fallback)
+
+
+class DurationsRecorder:
+    """Plugin that records durations and requested resources of tests into the durations DB."""
+
+    def __init__(self, db_file: Path) -> None:
+        self.db_file = db_file
+        self.durations: Dict[str, float] = {}
+        self.requests: Dict[str, dict] = {}
+        self.skipped: Set[str] = set()
+
+    def pytest_runtest_logreport(self, report: TestReport) -> None:
+        nodeid = get_base_nodeid(report.nodeid)
+        self.durations[nodeid] = self.durations.get(nodeid, 0.0) + report.duration
+        if report.skipped:
+            self.skipped.add(nodeid)
+
+        for name, value in report.user_properties:
+            if name == CLUSTER_REQUEST_PROP and isinstance(value, dict):
+                self.requests[nodeid] = value
+
+    def pytest_sessionfinish(self, session: Session) -> None:  # noqa: ARG002
+        # pylint: disable=unused-argument
+        if not self.durations:
+            return
+
+        records = load_durations(self.db_file)
+        for nodeid, last_duration in self.durations.items():
+            # durations of skipped tests don't say anything about the next run
+            if nodeid in self.skipped:
+                continue
+
+            record = records.setdefault(nodeid, {})
+            old_duration = record.get("duration")
+            duration = (
+                last_duration
+                if old_duration is None
+                else DURATION_WEIGHT * last_duration + (1 - DURATION_WEIGHT) * old_duration
+            )
+            record["duration"] = round(duration, 3)
+            record.update(self.requests.get(nodeid) or {})
+
+        tmp_file = self.db_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as out_json:
+            json.dump(records, out_json, indent=1, sort_keys=True)
+        tmp_file.replace(self.db_file)
+
+
+def pytest_configure(config: Config) -> None:
+    # record durations only on the xdist controller (or when running without xdist)
+    if configuration.SCHEDULING_DURATIONS_DB and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(
+            DurationsRecorder(db_file=Path(configuration.SCHEDULING_DURATIONS_DB)),
+            "durations_recorder",
+        )
+
+
 @pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(items: list) -> None:
     for item in items:
@@ -167,4 +358,7 @@ def pytest_collection_modifyitems(items: list) -> None:
 
 
 def pytest_xdist_make_scheduler(config: Any, log: Any) -> OneLongScheduling:
+    if configuration.SCHEDULING_DURATIONS_DB:
+        durations = load_durations(Path(configuration.SCHEDULING_DURATIONS_DB))
+        return CostAwareScheduling(config, log, durations=durations)
     return OneLongScheduling(config, log)
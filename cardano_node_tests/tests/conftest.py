@@ -3,6 +3,7 @@ import json
 import logging
 import os
 import shutil
+import uuid
 from pathlib import Path
 from typing import Any
 from typing import Dict
@@ -16,12 +17,18 @@ from _pytest.tmpdir import TempPathFactory
 from cardano_clusterlib import clusterlib
 from xdist import workermanage
 
+from cardano_node_tests.cluster_management import cluster_getter
 from cardano_node_tests.cluster_management import cluster_management
+from cardano_node_tests.cluster_management import coordinator
 from cardano_node_tests.cluster_management import resources_management
+from cardano_node_tests.cluster_management import standby
+from cardano_node_tests.pytest_plugins import xdist_scheduler
 from cardano_node_tests.utils import artifacts
 from cardano_node_tests.utils import cluster_nodes
 from cardano_node_tests.utils import configuration
 from cardano_node_tests.utils import dbsync_conn
+from cardano_node_tests.utils import dbsync_queries
+from cardano_node_tests.utils import faucet
 from cardano_node_tests.utils import helpers
 from cardano_node_tests.utils import locking
 from cardano_node_tests.utils import temptools
@@ -110,6 +117,41 @@ def pytest_configure(config: Any) -> None:
         LOGGER.warning("WARNING: Not using `cardano-cli` from nix!")
 
 
+def _is_xdist_controller(config: Any) -> bool:
+    """Check if this is the pytest controller process (xdist master) that runs pytest workers."""
+    return getattr(config.option, "dist", "no") != "no" and not hasattr(config, "workerinput")
+
+
+def pytest_sessionstart(session: Any) -> None:
+    # start the scheduling coordinator in the controller process, before pytest workers start
+    config = session.config
+    if not (configuration.SCHEDULING_COORDINATOR and _is_xdist_controller(config)):
+        return
+
+    # the workers are authenticated by the testrun UID, make sure it is known in advance
+    if not config.option.testrunuid:
+        config.option.testrunuid = uuid.uuid4().hex
+
+    coordinator.start_coordinator(
+        pytest_tmp_dir=temptools.get_pytest_root_tmp(config._tmp_path_factory),
+        num_of_instances=configuration.CLUSTERS_COUNT + configuration.SPARE_CLUSTERS_COUNT,
+        testrun_uid=config.option.testrunuid,
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session: Any) -> None:
+    # stop the scheduling coordinator, all pytest workers are finished by now
+    config = session.config
+    if not (configuration.SCHEDULING_COORDINATOR and _is_xdist_controller(config)):
+        return
+
+    coordinator.stop_coordinator(
+        pytest_tmp_dir=temptools.get_pytest_root_tmp(config._tmp_path_factory),
+        testrun_uid=config.option.testrunuid,
+    )
+
+
 def _skip_all_tests(config: Any, items: list) -> bool:
     """Skip all tests if specified on command line.
 
@@ -173,6 +215,8 @@ def change_dir(tmp_path_factory: TempPathFactory) -> None:
 def close_dbconn() -> Generator[None, None, None]:
     """Close connection to db-sync database at the end of session."""
     yield
+    if dbsync_queries.QueryStats.stats:
+        LOGGER.info(f"db-sync query stats:\n{dbsync_queries.QueryStats.get_report()}")
     dbsync_conn.close_all()
 
 
@@ -187,6 +231,7 @@ def _stop_all_cluster_instances(
 
     # stop all cluster instances
     with helpers.ignore_interrupt():
+        standby.stop_background_respins(pytest_tmp_dir=cluster_manager_obj.pytest_tmp_dir)
         cluster_manager_obj.stop_all_clusters()
 
 
@@ -222,12 +267,27 @@ def _save_env_for_allure(pytest_config: Config) -> None:
             infile.write(f"{name}={v}\n")
 
 
+def _save_resources_wait_stats(pytest_root_tmp: Path) -> None:
+    """Save statistics of time tests spent waiting for resources, so bottlenecks can be found."""
+    stats = cluster_getter.get_resources_wait_stats(pytest_tmp_dir=pytest_root_tmp)
+    if not stats:
+        return
+
+    with open(
+        pytest_root_tmp / cluster_management.RESOURCES_WAIT_STATS, "w", encoding="utf-8"
+    ) as out_json:
+        json.dump(stats, out_json, indent=4)
+
+
 @pytest.fixture(scope="session")
 def testenv_setup_teardown(
     tmp_path_factory: TempPathFactory, worker_id: str, request: FixtureRequest
 ) -> Generator[None, None, None]:
     pytest_root_tmp = temptools.get_pytest_root_tmp(tmp_path_factory)
 
+    # funding requests of all workers are batched in the pytest root tmp dir
+    faucet.set_batches_root(pytest_root_tmp)
+
     with locking.FileLockIfXdist(f"{pytest_root_tmp}/{cluster_management.CLUSTER_LOCK}"):
         # save environment info for Allure
         if not list(pytest_root_tmp.glob(".started_session_*")):
@@ -235,8 +295,18 @@ def testenv_setup_teardown(
 
         (pytest_root_tmp / f".started_session_{worker_id}").touch()
 
+        # start the spare cluster instances in background if they are not started yet
+        if configuration.SPARE_CLUSTERS_COUNT and configuration.IS_XDIST:
+            standby.init_spare_instances(
+                pytest_tmp_dir=pytest_root_tmp,
+                cli_coverage_dir=request.config.getoption(artifacts.CLI_COVERAGE_ARG),
+            )
+
     yield
 
+    # wait for artifacts that are still being saved in background
+    artifacts.wait_for_background_tasks()
+
     with locking.FileLockIfXdist(f"{pytest_root_tmp}/{cluster_management.CLUSTER_LOCK}"):
         # save CLI coverage to dir specified by `--cli-coverage-dir`
         cluster_manager_obj = cluster_management.ClusterManager(
@@ -264,6 +334,9 @@ def testenv_setup_teardown(
                     pytest_config=request.config,
                 )
 
+            # save statistics of time tests spent waiting for resources
+            _save_resources_wait_stats(pytest_root_tmp=pytest_root_tmp)
+
             # copy collected artifacts to dir specified by `--artifacts-base-dir`
             artifacts.copy_artifacts(pytest_tmp_dir=pytest_root_tmp, pytest_config=request.config)
 
@@ -335,6 +408,11 @@ def cluster_manager(
 
     yield cluster_manager_obj
 
+    if cluster_manager_obj.requested:
+        request.node.user_properties.append(
+            (xdist_scheduler.CLUSTER_REQUEST_PROP, cluster_manager_obj.requested)
+        )
+
     errors = cluster_manager_obj.get_logfiles_errors()
     cluster_manager_obj.on_test_stop()
     _raise_logs_error(errors)
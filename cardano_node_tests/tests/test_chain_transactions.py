@@ -1,6 +1,5 @@
 """Tests for transactions chaining."""
 import logging
-import time
 from pathlib import Path
 from typing import Optional
 from typing import Tuple
@@ -166,14 +165,13 @@ class TestTxChaining:
             _repeat_submit(tx_file)
 
         if configuration.HAS_DBSYNC:
-            # wait a bit for all Txs to appear in db-sync
-            time.sleep(5)
-
-            check_tx_outs = [
-                dbsync_utils.check_tx(cluster_obj=cluster, tx_raw_output=t) for t in tx_raw_outputs
-            ]
+            check_results = dbsync_utils.check_txs(
+                cluster_obj=cluster, tx_raw_outputs=tx_raw_outputs
+            )
+            failed_checks = [f"{r.txhash}: {r.error}" for r in check_results if r.error]
+            assert not failed_checks, "db-sync checks failed:\n" + "\n".join(failed_checks)
 
-            block_ids = [r.block_id for r in check_tx_outs if r]
+            block_ids = [r.record.block_id for r in check_results if r.record]
             assert block_ids == sorted(block_ids), "Block IDs of Txs are not ordered"
 
             how_many_blocks = block_ids[-1] - block_ids[0]
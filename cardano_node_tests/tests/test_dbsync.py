@@ -107,7 +107,7 @@ class TestDBSync:
         rec = None
         prev_rec = None
         errors: List[str] = []
-        for rec in dbsync_queries.query_blocks(epoch_from=epoch_from):
+        for rec in dbsync_queries.query_blocks(epoch_from=epoch_from, stream=True):
             if not prev_rec:
                 prev_rec = rec
                 continue
@@ -235,6 +235,53 @@ class TestDBSync:
             pp_cost_models["PlutusScriptV2"] == db_cost_models["PlutusV2"]
         ), "PlutusV2 cost model is not the expected"
 
+    @allure.link(helpers.get_vcs_link())
+    @pytest.mark.order(-10)
+    @pytest.mark.testnets
+    def test_tx_record_single_query(self, cluster: clusterlib.ClusterLib):
+        """Check that TX data retrieved using single SQL query match the multi-query data.
+
+        * get hashes of the latest transactions recorded in db-sync
+        * get TX records using a separate SQL query for each kind of records
+        * get TX records using a single SQL query
+        * check that the records match and compare the time needed for getting them
+        """
+        common.get_test_id(cluster)
+
+        def _normalize(record: dbsync_utils.TxRecord) -> dict:
+            # order of records is not defined in the multi-query data, and the txout index
+            # of minted tokens is not meaningful
+            normalized = record._asdict()
+            normalized["mint"] = [r._replace(utxo_ix=0) for r in record.mint]
+            normalized["metadata"] = [(r.key, r.json, bytes(r.bytes)) for r in record.metadata]
+            return {
+                k: sorted(v, key=repr) if isinstance(v, list) else v for k, v in normalized.items()
+            }
+
+        txhashes = dbsync_queries.query_latest_tx_hashes(limit=100)
+        if not txhashes:
+            pytest.skip("No transactions recorded in db-sync.")
+
+        start = time.perf_counter()
+        multi_query_records = [dbsync_utils.get_tx_record_multi_query(h) for h in txhashes]
+        multi_query_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        single_query_records = [dbsync_utils.get_tx_record(h) for h in txhashes]
+        single_query_time = time.perf_counter() - start
+
+        LOGGER.info(
+            f"Retrieved {len(txhashes)} TX records in {multi_query_time:.3f}s using multiple "
+            f"queries, in {single_query_time:.3f}s using single query."
+        )
+
+        mismatched = [
+            m.tx_hash
+            for m, s in zip(multi_query_records, single_query_records)
+            if _normalize(m) != _normalize(s)
+        ]
+        assert not mismatched, f"TX records don't match: {mismatched}"
+
     @allure.link(helpers.get_vcs_link())
     @pytest.mark.testnets
     def test_reconnect_dbsync(
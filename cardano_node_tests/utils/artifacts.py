@@ -1,14 +1,25 @@
 """Functionality for collecting testing artifacts."""
-import json
+import concurrent.futures
+import contextlib
+import fcntl
+import gzip
 import logging
 import os
 import shutil
+import threading
 from pathlib import Path
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 from _pytest.config import Config
 from cardano_clusterlib import clusterlib
 
+from cardano_node_tests.utils import cli_coverage
+from cardano_node_tests.utils import configuration
 from cardano_node_tests.utils import helpers
 
 LOGGER = logging.getLogger(__name__)
@@ -17,24 +28,54 @@ CLI_COVERAGE_ARG = "--cli-coverage-dir"
 ARTIFACTS_BASE_DIR_ARG = "--artifacts-base-dir"
 CLUSTER_INSTANCE_ID_FILENAME = "cluster_instance_id.log"
 
+# max number of files saved in parallel
+COLLECT_WORKERS = 8
+
+# files that are compressed when `COMPRESS_ARTIFACTS_LOGS` is set
+LOG_SUFFIXES = (".log", ".stdout", ".stderr")
+
+# threads running background tasks, see `run_in_background`
+_BACKGROUND_TASKS: List[threading.Thread] = []
+
+# ioctl request for cloning a file on filesystems that support reflinks (btrfs, xfs)
+FICLONE = 0x40049409
+
+
+@helpers.callonce
+def _get_cli_coverage_file_name() -> str:
+    """Return name of the CLI coverage file of this process."""
+    return f"cli_coverage_{helpers.get_timestamped_rand_str()}{cli_coverage.COVERAGE_SUFFIX}"
+
 
 def save_cli_coverage(cluster_obj: clusterlib.ClusterLib, pytest_config: Config) -> Optional[Path]:
-    """Save CLI coverage info."""
+    """Save CLI coverage info.
+
+    The coverage info is appended to the coverage file of this process, and the coverage info
+    recorded by `cluster_obj` is reset, so it is not saved twice.
+    """
     cli_coverage_dir = pytest_config.getoption(CLI_COVERAGE_ARG)
     if not (cli_coverage_dir and cluster_obj.cli_coverage):
         return None
 
-    json_file = Path(cli_coverage_dir) / f"cli_coverage_{helpers.get_timestamped_rand_str()}.json"
-    with open(json_file, "w", encoding="utf-8") as out_json:
-        json.dump(cluster_obj.cli_coverage, out_json, indent=4)
-    LOGGER.info(f"Coverage file saved to '{cli_coverage_dir}'.")
-    return json_file
+    cov_file = Path(cli_coverage_dir) / _get_cli_coverage_file_name()
+    cli_coverage.append_coverage(coverage_dict=cluster_obj.cli_coverage, out_file=cov_file)
+    cluster_obj.cli_coverage.clear()
+    LOGGER.info(f"Coverage info saved to '{cov_file}'.")
+    return cov_file
 
 
 def save_start_script_coverage(log_file: Path, pytest_config: Config) -> Optional[Path]:
     """Save info about CLI commands executed by cluster start script."""
     cli_coverage_dir = pytest_config.getoption(CLI_COVERAGE_ARG)
-    if not (cli_coverage_dir and log_file.exists()):
+    if not cli_coverage_dir:
+        return None
+
+    return copy_start_script_coverage(log_file=log_file, cli_coverage_dir=Path(cli_coverage_dir))
+
+
+def copy_start_script_coverage(log_file: Path, cli_coverage_dir: Path) -> Optional[Path]:
+    """Copy info about CLI commands executed by cluster start script to coverage dir."""
+    if not log_file.exists():
         return None
 
     dest_file = (
@@ -45,8 +86,111 @@ def save_start_script_coverage(log_file: Path, pytest_config: Config) -> Optiona
     return dest_file
 
 
-def save_cluster_artifacts(save_dir: Path, state_dir: Path) -> None:
-    """Save cluster artifacts (logs, certs, etc.)."""
+def _reflink(src: Path, dst: Path) -> bool:
+    """Create copy-on-write clone of the file, if supported by the filesystem."""
+    try:
+        with open(src, "rb") as src_fp, open(dst, "wb") as dst_fp:
+            fcntl.ioctl(dst_fp.fileno(), FICLONE, src_fp.fileno())
+    except OSError:
+        dst.unlink(missing_ok=True)
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _compress(src: Path, dst: Path) -> None:
+    with open(src, "rb") as src_fp, gzip.open(dst, "wb") as dst_fp:
+        shutil.copyfileobj(src_fp, dst_fp, length=1024 * 1024)
+    shutil.copystat(src, dst)
+
+
+def _is_unchanged(src_stat: os.stat_result, dst: Path, compressed: bool) -> bool:
+    """Check if the file was already saved by previous artifacts collection."""
+    try:
+        dst_stat = dst.stat()
+    except FileNotFoundError:
+        return False
+    return dst_stat.st_mtime_ns == src_stat.st_mtime_ns and (
+        compressed or dst_stat.st_size == src_stat.st_size
+    )
+
+
+def _save_file(src: Path, dst: Path, hardlink: bool) -> None:
+    """Save the file using the cheapest method available.
+
+    Use hardlink (if allowed), copy-on-write clone, or plain copy, in that order.
+    """
+    src_stat = src.stat()
+    compress = configuration.COMPRESS_ARTIFACTS_LOGS and src.name.endswith(LOG_SUFFIXES)
+    if compress:
+        dst = dst.with_name(f"{dst.name}.gz")
+
+    if _is_unchanged(src_stat=src_stat, dst=dst, compressed=compress):
+        return
+    dst.unlink(missing_ok=True)
+
+    if compress:
+        _compress(src=src, dst=dst)
+        return
+    if hardlink:
+        with contextlib.suppress(OSError):
+            os.link(src, dst)
+            return
+    if not _reflink(src=src, dst=dst):
+        shutil.copy2(src, dst)
+
+
+def collect_files(files: Iterable[Tuple[Path, Path]], hardlink: bool = False) -> None:
+    """Save files to their destinations in parallel.
+
+    Hardlinks can be used only when the source files are not going to be modified in place.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=COLLECT_WORKERS) as executor:
+        futures = [
+            executor.submit(_save_file, src=src, dst=dst, hardlink=hardlink) for src, dst in files
+        ]
+        for fut in concurrent.futures.as_completed(futures):
+            fut.result()
+
+
+def _iter_tree(src_dir: Path, dst_dir: Path) -> Iterator[Tuple[Path, Path]]:
+    """Recreate directory structure and symlinks, yield regular files that need to be saved."""
+    for root, dirnames, filenames in os.walk(src_dir):
+        root_path = Path(root)
+        dst_root = dst_dir / root_path.relative_to(src_dir)
+        dst_root.mkdir(parents=True, exist_ok=True)
+        for name in (*dirnames, *filenames):
+            src = root_path / name
+            if src.is_symlink():
+                dst = dst_root / name
+                # `Path.readlink` is not available in Python 3.8
+                if not dst.is_symlink():
+                    dst.symlink_to(os.readlink(src))  # noqa: PTH115
+            # skip sockets and other special files
+            elif name in filenames and src.is_file():
+                yield src, dst_root / name
+
+
+def collect_tree(src_dir: Path, dst_dir: Path, hardlink: bool = False) -> None:
+    """Save directory tree, similar to `shutil.copytree(symlinks=True)`."""
+    collect_files(_iter_tree(src_dir=src_dir, dst_dir=dst_dir), hardlink=hardlink)
+
+
+def save_cluster_artifacts(
+    save_dir: Path, state_dir: Path, hardlink: bool = False, dir_name: str = ""
+) -> None:
+    """Save cluster artifacts (logs, certs, etc.).
+
+    Files can be hardlinked only when the cluster instance is stopped and its state dir is not
+    going to be reused.
+
+    Args:
+        save_dir: A path to dir where the artifacts will be saved.
+        state_dir: A path to the cluster instance state dir.
+        hardlink: Whether the files can be hardlinked (optional).
+        dir_name: A name of the state dir, when it differs from the original name, e.g. when
+            the state dir was renamed (optional).
+    """
     dir_rand_str = ""
     cluster_instance_id_log = state_dir / CLUSTER_INSTANCE_ID_FILENAME
     if cluster_instance_id_log.exists():
@@ -54,7 +198,7 @@ def save_cluster_artifacts(save_dir: Path, state_dir: Path) -> None:
             dir_rand_str = fp_in.read().strip()
     dir_rand_str = dir_rand_str or helpers.get_rand_str(8)
 
-    destdir = save_dir / "cluster_artifacts" / f"{state_dir.name}_{dir_rand_str}"
+    destdir = save_dir / "cluster_artifacts" / f"{dir_name or state_dir.name}_{dir_rand_str}"
     destdir.mkdir(parents=True)
 
     files_list = [
@@ -67,13 +211,12 @@ def save_cluster_artifacts(save_dir: Path, state_dir: Path) -> None:
     ]
     dirs_to_copy = ("nodes", "shelley")
 
-    for fpath in files_list:
-        shutil.copy(fpath, destdir)
+    collect_files(((f, destdir / f.name) for f in files_list), hardlink=hardlink)
     for dname in dirs_to_copy:
         src_dir = state_dir / dname
         if not src_dir.exists():
             continue
-        shutil.copytree(src_dir, destdir / dname, symlinks=True, ignore_dangling_symlinks=True)
+        collect_tree(src_dir=src_dir, dst_dir=destdir / dname, hardlink=hardlink)
 
     if not os.listdir(destdir):
         destdir.rmdir()
@@ -82,6 +225,22 @@ def save_cluster_artifacts(save_dir: Path, state_dir: Path) -> None:
     LOGGER.info(f"Cluster artifacts saved to '{destdir}'.")
 
 
+def run_in_background(func: Callable[[], None], name: str) -> None:
+    """Run task that saves artifacts in a background thread.
+
+    The task must finish before the pytest session ends, see `wait_for_background_tasks`.
+    """
+    thread = threading.Thread(target=func, name=name)
+    thread.start()
+    _BACKGROUND_TASKS.append(thread)
+
+
+def wait_for_background_tasks() -> None:
+    """Wait until all background tasks started by this process finish."""
+    while _BACKGROUND_TASKS:
+        _BACKGROUND_TASKS.pop().join()
+
+
 def copy_artifacts(pytest_tmp_dir: Path, pytest_config: Config) -> None:
     """Copy collected tests and cluster artifacts to artifacts dir."""
     artifacts_base_dir = pytest_config.getoption(ARTIFACTS_BASE_DIR_ARG)
@@ -98,5 +257,6 @@ def copy_artifacts(pytest_tmp_dir: Path, pytest_config: Config) -> None:
     if destdir.resolve().is_dir():
         shutil.rmtree(destdir)
 
-    shutil.copytree(pytest_tmp_dir, destdir, symlinks=True, ignore_dangling_symlinks=True)
+    # the pytest tmp dir is not modified anymore, the files can be hardlinked
+    collect_tree(src_dir=pytest_tmp_dir, dst_dir=destdir, hardlink=True)
     LOGGER.info(f"Collected artifacts copied to '{artifacts_dir}'.")
@@ -0,0 +1,101 @@
+"""Encoding and decoding of bech32 strings (BIP 173).
+
+Produces the same output as the `bech32` command line tool used by Cardano, without running
+a subprocess for every conversion. Unlike BIP 173, the length of the encoded string is not
+limited to 90 characters, as Cardano addresses can be longer.
+"""
+import functools
+from typing import List
+from typing import Tuple
+
+CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+_CHARSET_MAP = {c: i for i, c in enumerate(CHARSET)}
+_GENERATOR = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+
+
+def _polymod(values: List[int]) -> int:
+    chk = 1
+    for value in values:
+        top = chk >> 25
+        chk = (chk & 0x1FFFFFF) << 5 ^ value
+        for i, gen in enumerate(_GENERATOR):
+            if (top >> i) & 1:
+                chk ^= gen
+    return chk
+
+
+def _hrp_expand(hrp: str) -> List[int]:
+    return [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp]
+
+
+def _create_checksum(hrp: str, data: List[int]) -> List[int]:
+    polymod = _polymod(_hrp_expand(hrp) + data + [0] * 6) ^ 1
+    return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+
+
+def _convert_bits(data: bytes, from_bits: int, to_bits: int, pad: bool) -> List[int]:
+    """Regroup bits of the input values, e.g. from 8-bit bytes to 5-bit words."""
+    acc = 0
+    bits = 0
+    out = []
+    max_value = (1 << to_bits) - 1
+    for value in data:
+        acc = (acc << from_bits) | value
+        bits += from_bits
+        while bits >= to_bits:
+            bits -= to_bits
+            out.append((acc >> bits) & max_value)
+    if pad:
+        if bits:
+            out.append((acc << (to_bits - bits)) & max_value)
+    elif bits >= from_bits or (acc << (to_bits - bits)) & max_value:
+        raise ValueError("Invalid padding of bech32 data.")
+    return out
+
+
+def _decode(bech32: str) -> Tuple[str, bytes]:
+    """Return human readable part and data of a bech32 string."""
+    if bech32.lower() != bech32 and bech32.upper() != bech32:
+        raise ValueError(f"Mixed case in bech32 string `{bech32}`.")
+
+    bech32 = bech32.lower()
+    sep_pos = bech32.rfind("1")
+    if sep_pos < 1 or sep_pos + 7 > len(bech32):
+        raise ValueError(f"Invalid position of separator in bech32 string `{bech32}`.")
+
+    hrp = bech32[:sep_pos]
+    if any(ord(c) < 33 or ord(c) > 126 for c in hrp):
+        raise ValueError(f"Invalid character in human readable part of `{bech32}`.")
+    try:
+        data = [_CHARSET_MAP[c] for c in bech32[sep_pos + 1 :]]
+    except KeyError as exc:
+        raise ValueError(f"Invalid character in data part of `{bech32}`.") from exc
+
+    if _polymod(_hrp_expand(hrp) + data) != 1:
+        raise ValueError(f"Invalid checksum of bech32 string `{bech32}`.")
+
+    return hrp, bytes(_convert_bits(bytes(data[:-6]), from_bits=5, to_bits=8, pad=False))
+
+
+def _encode(hrp: str, data: bytes) -> str:
+    words = _convert_bits(data, from_bits=8, to_bits=5, pad=True)
+    checksum = _create_checksum(hrp, words)
+    return f"{hrp}1{''.join(CHARSET[w] for w in words + checksum)}"
+
+
+@functools.lru_cache(maxsize=4096)
+def decode(bech32: str) -> str:
+    """Convert from bech32 string to hex string."""
+    return _decode(bech32.strip())[1].hex()
+
+
+@functools.lru_cache(maxsize=4096)
+def encode(prefix: str, data: str) -> str:
+    """Convert hex string (or bech32 string with different prefix) to bech32 string."""
+    data = data.strip()
+    try:
+        data_bytes = bytes.fromhex(data)
+    except ValueError:
+        # the `bech32` tool accepts also bech32 input
+        data_bytes = _decode(data)[1]
+    return _encode(hrp=prefix.lower(), data=data_bytes)
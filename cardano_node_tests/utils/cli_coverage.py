@@ -0,0 +1,79 @@
+"""Compact, append-only format of CLI coverage files.
+
+Each line of a coverage file is a JSON array with a count and a command path, e.g.
+`[3, ["cardano-cli", "query", "tip", "--testnet-magic"]]`. The same path can be present
+multiple times, the counts are summed when the coverage is read.
+"""
+import collections
+import json
+from pathlib import Path
+from typing import Counter
+from typing import Iterator
+from typing import Tuple
+
+from cardano_clusterlib import clusterlib
+
+COVERAGE_SUFFIX = ".cov"
+
+CoveragePath = Tuple[str, ...]
+
+
+def iter_coverage_paths(
+    coverage_dict: dict, prefix: CoveragePath = ()
+) -> Iterator[Tuple[CoveragePath, int]]:
+    """Yield command paths and their counts from the nested coverage dict."""
+    for key, value in coverage_dict.items():
+        if key == "_count" or not isinstance(value, dict):
+            continue
+        path = (*prefix, key)
+        yield path, value.get("_count", 0)
+        yield from iter_coverage_paths(coverage_dict=value, prefix=path)
+
+
+def append_coverage(coverage_dict: dict, out_file: Path) -> None:
+    """Append coverage info from the nested coverage dict to the coverage file."""
+    lines = [f"{json.dumps([count, path])}\n" for path, count in iter_coverage_paths(coverage_dict)]
+    if not lines:
+        return
+    # single write, so the lines are not interleaved with writes of other processes
+    with open(out_file, "a", encoding="utf-8") as out_fp:
+        out_fp.write("".join(lines))
+
+
+def read_coverage(in_file: Path) -> Counter[CoveragePath]:
+    """Read coverage info from the compact coverage file."""
+    counts: Counter[CoveragePath] = collections.Counter()
+    with open(in_file, encoding="utf-8") as in_fp:
+        for line in in_fp:
+            if not line.strip():
+                continue
+            count, path = json.loads(line)
+            counts[tuple(path)] += count
+    return counts
+
+
+def read_json_coverage(in_file: Path) -> Counter[CoveragePath]:
+    """Read coverage info from a coverage file in the (legacy) nested JSON format."""
+    with open(in_file, encoding="utf-8") as in_fp:
+        coverage_dict = json.load(in_fp)
+    return collections.Counter(dict(iter_coverage_paths(coverage_dict)))
+
+
+def read_log_coverage(log_file: Path) -> Counter[CoveragePath]:
+    """Read coverage info from log file containing CLI commands."""
+    coverage_dict: dict = {}
+    with open(log_file, encoding="utf-8") as in_fp:
+        for line in in_fp:
+            if not line.startswith("cardano-cli"):
+                continue
+            clusterlib.record_cli_coverage(cli_args=line.split(), coverage_dict=coverage_dict)
+    return collections.Counter(dict(iter_coverage_paths(coverage_dict)))
+
+
+def read_any_coverage(in_file: Path) -> Counter[CoveragePath]:
+    """Read coverage info from a coverage file in any of the supported formats."""
+    if in_file.suffix == COVERAGE_SUFFIX:
+        return read_coverage(in_file)
+    if in_file.suffix == ".json":
+        return read_json_coverage(in_file)
+    return read_log_coverage(in_file)
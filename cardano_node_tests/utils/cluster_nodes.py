@@ -1,8 +1,13 @@
 """Functionality for cluster setup and interaction with cluster nodes."""
+import concurrent.futures
+import contextlib
+import http.client
 import json
 import logging
 import os
 import pickle
+import socket
+import subprocess
 import time
 from pathlib import Path
 from typing import Any
@@ -18,8 +23,10 @@ from cardano_clusterlib import clusterlib
 from cardano_node_tests.utils import cluster_scripts
 from cardano_node_tests.utils import clusterlib_utils
 from cardano_node_tests.utils import configuration
+from cardano_node_tests.utils import faucet
 from cardano_node_tests.utils import helpers
 from cardano_node_tests.utils import slots_offset
+from cardano_node_tests.utils import supervisor_rpc
 from cardano_node_tests.utils.types import FileType
 
 LOGGER = logging.getLogger(__name__)
@@ -27,6 +34,10 @@ LOGGER = logging.getLogger(__name__)
 ADDRS_DATA = "addrs_data.pickle"
 STATE_CLUSTER = "state-cluster"
 
+# how long to wait for nodes to become ready, e.g. after restart
+NODES_READY_TIMEOUT = 120
+NODES_READY_POLL_SEC = 0.5
+
 
 class ClusterEnv(NamedTuple):
     socket_path: Path
@@ -195,14 +206,26 @@ class LocalCluster(ClusterType):
         # fund new addresses from faucet address
         LOGGER.debug("Funding created addresses.")
         to_fund = [d["payment"] for d in new_addrs_data.values()]
-        clusterlib_utils.fund_from_faucet(
-            *to_fund,
-            cluster_obj=cluster_obj,
-            faucet_data=faucet_addrs_data["faucet"],
-            amount=100_000_000_000_000,
-            destination_dir=destination_dir,
-            force=True,
-        )
+        if configuration.FAUCET_UTXOS_COUNT > 1:
+            faucet.fund_utxo_pool(
+                *to_fund,
+                cluster_obj=cluster_obj,
+                faucet_data=faucet_addrs_data["faucet"],
+                amount=100_000_000_000_000,
+                num_utxos=configuration.FAUCET_UTXOS_COUNT,
+                destination_dir=destination_dir,
+            )
+            for addr_data in new_addrs_data.values():
+                addr_data[faucet.POOL_SIZE_KEY] = configuration.FAUCET_UTXOS_COUNT
+        else:
+            clusterlib_utils.fund_from_faucet(
+                *to_fund,
+                cluster_obj=cluster_obj,
+                faucet_data=faucet_addrs_data["faucet"],
+                amount=100_000_000_000_000,
+                destination_dir=destination_dir,
+                force=True,
+            )
 
         addrs_data = {**new_addrs_data, **faucet_addrs_data}
         return addrs_data
@@ -414,12 +437,11 @@ def restart_all_nodes(instance_num: Optional[int] = None) -> None:
 
     supervisor_port = get_cluster_type().cluster_scripts.get_instance_ports(instance_num).supervisor
     try:
-        helpers.run_command(f"supervisorctl -s http://localhost:{supervisor_port} restart nodes:")
+        supervisor_rpc.service_action(port=supervisor_port, service_name="nodes:", action="restart")
     except Exception as exc:
         raise Exception("Failed to restart cluster nodes.") from exc
 
-    # wait for nodes to start
-    time.sleep(5)
+    wait_for_nodes_ready(instance_num=instance_num)
 
 
 def services_action(
@@ -434,8 +456,8 @@ def services_action(
     supervisor_port = get_cluster_type().cluster_scripts.get_instance_ports(instance_num).supervisor
     for service_name in service_names:
         try:
-            helpers.run_command(
-                f"supervisorctl -s http://localhost:{supervisor_port} {action} {service_name}"
+            supervisor_rpc.service_action(
+                port=supervisor_port, service_name=service_name, action=action
             )
         except Exception as exc:
             raise Exception(f"Failed to restart service `{service_name}`") from exc
@@ -457,48 +479,184 @@ def restart_nodes(node_names: List[str], instance_num: Optional[int] = None) ->
     """Restart list of Cardano nodes of the running cluster."""
     service_names = [f"nodes:{n}" for n in node_names]
     services_action(service_names=service_names, action="restart", instance_num=instance_num)
+    wait_for_nodes_ready(node_names=node_names, instance_num=instance_num)
+
 
-    # wait for nodes to start
-    time.sleep(5)
+def _is_socket_ready(socket_path: Path) -> bool:
+    """Check that the node socket accepts connections."""
+    if not socket_path.is_socket():
+        return False
+
+    with contextlib.closing(socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)) as sock:
+        sock.settimeout(1)
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def _is_tip_ready(socket_path: Path, magic_args: List[str]) -> bool:
+    """Check that the node answers the tip query."""
+    try:
+        proc = subprocess.run(
+            ["cardano-cli", "query", "tip", *magic_args],
+            env={**os.environ, "CARDANO_NODE_SOCKET_PATH": str(socket_path)},
+            capture_output=True,
+            timeout=10,
+            check=False,
+        )
+    except subprocess.TimeoutExpired:
+        return False
+    return proc.returncode == 0
+
+
+def _check_node_ready(socket_path: Path, magic_args: List[str]) -> str:
+    """Check that a running node answers queries on its local socket.
+
+    Return empty string when the node is ready, otherwise the reason why it is not ready.
+    """
+    if not _is_socket_ready(socket_path):
+        return f"socket '{socket_path}' doesn't accept connections"
+    if not _is_tip_ready(socket_path=socket_path, magic_args=magic_args):
+        return "tip query failed"
+    return ""
+
+
+def wait_for_nodes_ready(
+    node_names: Optional[List[str]] = None,
+    instance_num: Optional[int] = None,
+    timeout: float = NODES_READY_TIMEOUT,
+) -> None:
+    """Wait until the nodes are running and answer queries on their local socket.
+
+    All nodes of the cluster instance are checked by default. The status of services is queried
+    once per poll, and the sockets of the running nodes are checked in parallel. The function
+    returns as soon as all the nodes are ready.
+    """
+    if instance_num is None:
+        instance_num = get_cluster_env().instance_num
+    node_names = node_names or sorted(get_cluster_type().NODES)
+    magic_args = get_cluster_type().get_cluster_obj().magic_args
+    supervisor_port = get_cluster_type().cluster_scripts.get_instance_ports(instance_num).supervisor
+    socket_paths = {
+        n: get_cardano_node_socket_path(instance_num=instance_num, socket_file_name=f"{n}.socket")
+        for n in node_names
+    }
+    deadline = time.time() + timeout
+
+    pending = dict.fromkeys(node_names, "not checked")
+    failed: Dict[str, str] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(node_names)) as executor:
+        while pending and time.time() < deadline:
+            # the supervisord connection is not shared with the threads
+            statuses = {
+                supervisor_rpc.get_full_name(i): i["statename"]
+                for i in supervisor_rpc.get_all_process_info(port=supervisor_port, use_cache=False)
+            }
+
+            futures = {}
+            for node_name in list(pending):
+                status = statuses.get(f"nodes:{node_name}")
+                if status in ("FATAL", "EXITED", "STOPPED"):
+                    del pending[node_name]
+                    failed[node_name] = f"service status is {status}"
+                elif status != "RUNNING":
+                    pending[node_name] = f"service status is {status}"
+                else:
+                    futures[node_name] = executor.submit(
+                        _check_node_ready,
+                        socket_path=socket_paths[node_name],
+                        magic_args=magic_args,
+                    )
+
+            for node_name, future in futures.items():
+                reason = future.result()
+                if reason:
+                    pending[node_name] = reason
+                else:
+                    del pending[node_name]
+
+            if pending:
+                time.sleep(NODES_READY_POLL_SEC)
+
+    not_ready = {**pending, **failed}
+    if not_ready:
+        raise AssertionError(f"Nodes are not ready: {not_ready}")
+
+
+def _get_service_status(info: Dict[str, Any]) -> ServiceStatus:
+    """Convert supervisord process info to `ServiceStatus`."""
+    description = info["description"]
+    # the description is e.g. "pid 1234, uptime 0:01:02" for running services
+    if description.startswith("pid "):
+        _pid, pid, _uptime, uptime, *other = description.split()
+        return ServiceStatus(
+            name=supervisor_rpc.get_full_name(info),
+            status=info["statename"],
+            pid=int(pid.rstrip(",")),
+            uptime=uptime,
+            message=" ".join(other),
+        )
+    return ServiceStatus(
+        name=supervisor_rpc.get_full_name(info),
+        status=info["statename"],
+        pid=None,
+        uptime=None,
+        message=description,
+    )
 
 
 def services_status(
     service_names: Optional[List[str]] = None, instance_num: Optional[int] = None
 ) -> List[ServiceStatus]:
-    """Return status info for list of services running on the running cluster (all by default)."""
+    """Return status info for list of services running on the running cluster (all by default).
+
+    The status is fetched from supervisord and it is cached for a short time. When supervisord
+    is not reachable, the services are reported as failed.
+    """
     if instance_num is None:
         instance_num = get_cluster_env().instance_num
 
     supervisor_port = get_cluster_type().cluster_scripts.get_instance_ports(instance_num).supervisor
-    service_names_arg = " ".join(service_names) if service_names else "all"
+    try:
+        infos = supervisor_rpc.get_all_process_info(port=supervisor_port)
+    except (OSError, http.client.HTTPException) as err:
+        # the services cannot be running when supervisord is not reachable
+        LOGGER.warning(f"Failed to get status of services: {err}")
+        return [
+            ServiceStatus(
+                name=n,
+                status="FATAL",
+                pid=None,
+                uptime=None,
+                message=f"(supervisord is not reachable: {err})",
+            )
+            for n in (service_names or ["supervisord"])
+        ]
 
-    status_out = (
-        helpers.run_command(
-            f"supervisorctl -s http://localhost:{supervisor_port} status {service_names_arg}",
-            ignore_fail=True,
-        )
-        .decode()
-        .strip()
-        .split("\n")
-    )
+    all_statuses = [_get_service_status(i) for i in infos]
+    if not service_names or "all" in service_names:
+        return all_statuses
 
     statuses = []
-    for status_line in status_out:
-        service_name, status, *running_status = status_line.split()
-        if running_status and running_status[0] == "pid":
-            _pid, pid, _uptime, uptime, *other = running_status
-            message = " ".join(other)
+    for service_name in service_names:
+        if service_name.endswith(":"):
+            # all services in the group
+            found = [s for s in all_statuses if s.name.startswith(service_name)]
         else:
-            pid, uptime = "", ""
-            message = " ".join(running_status)
-        statuses.append(
-            ServiceStatus(
-                name=service_name,
-                status=status,
-                pid=int(pid.rstrip(",")) if pid else None,
-                uptime=uptime or None,
-                message=message,
-            )
+            found = [s for s in all_statuses if s.name == service_name]
+        statuses.extend(
+            found
+            or [
+                ServiceStatus(
+                    name=service_name,
+                    status="ERROR",
+                    pid=None,
+                    uptime=None,
+                    message="(no such process)",
+                )
+            ]
         )
 
     return statuses
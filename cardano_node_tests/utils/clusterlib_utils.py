@@ -1,10 +1,14 @@
 """Utilities that extends the functionality of `cardano-clusterlib`."""
 # pylint: disable=abstract-class-instantiated
 import contextlib
+import hashlib
 import itertools
 import json
 import logging
 import math
+import os
+import subprocess
+import tempfile
 import time
 from pathlib import Path
 from typing import Any
@@ -18,7 +22,10 @@ from typing import Union
 import cbor2
 from cardano_clusterlib import clusterlib
 
+from cardano_node_tests.utils import configuration
+from cardano_node_tests.utils import faucet
 from cardano_node_tests.utils import helpers
+from cardano_node_tests.utils import json_stream
 from cardano_node_tests.utils import locking
 from cardano_node_tests.utils import temptools
 from cardano_node_tests.utils.types import FileType
@@ -208,18 +215,47 @@ def fund_from_faucet(
     if isinstance(amount, int):
         amount = [amount] * len(dst_addr_records)
 
+    # query balances of all destination addresses at once
+    balances = (
+        {}
+        if force
+        else faucet.get_balances(
+            cluster_obj=cluster_obj, addresses=[d.address for d in dst_addr_records]
+        )
+    )
     fund_dst = [
         clusterlib.TxOut(address=d.address, amount=a)
         for d, a in zip(dst_addr_records, amount)
-        if force or cluster_obj.g_query.get_address_balance(d.address) < a
+        if force or balances[d.address] < a
     ]
     if not fund_dst:
         return None
 
+    tx_name = tx_name or helpers.get_timestamped_rand_str()
+    tx_name = f"{tx_name}_funding"
+
+    # the faucet holds a pool of UTxOs, no need to lock the whole faucet address
+    if faucet_data.get(faucet.POOL_SIZE_KEY):
+        return faucet.send_from_pool(
+            cluster_obj=cluster_obj,
+            faucet_data=faucet_data,
+            destinations=fund_dst,
+            tx_name=tx_name,
+            destination_dir=destination_dir,
+        )
+
+    # share the funding transaction with other workers
+    if configuration.FAUCET_BATCHING and configuration.IS_XDIST and faucet.is_batching_enabled():
+        return faucet.send_batched(
+            cluster_obj=cluster_obj,
+            faucet_data=faucet_data,
+            destinations=fund_dst,
+            tx_name=tx_name,
+            destination_dir=destination_dir,
+        )
+
     src_address = faucet_data["payment"].address
     with locking.FileLockIfXdist(f"{temptools.get_basetemp()}/{src_address}.lock"):
-        tx_name = tx_name or helpers.get_timestamped_rand_str()
-        tx_name = f"{tx_name}_funding"
         fund_tx_files = clusterlib.TxFiles(signing_key_files=[faucet_data["payment"].skey_file])
 
         tx_raw_output = cluster_obj.g_transaction.send_funds(
@@ -814,10 +850,16 @@ def new_tokens(
     return tokens_to_mint
 
 
-def filtered_ledger_state(
-    cluster_obj: clusterlib.ClusterLib,
-) -> str:
-    """Get filtered output of `query ledger-state`."""
+# filtered ledger state for each node socket, together with hash of the tip block it belongs to
+_LEDGER_STATE_CACHE: Dict[str, Tuple[str, str]] = {}
+
+
+def _query_filtered_ledger_state(cluster_obj: clusterlib.ClusterLib) -> str:
+    """Query ledger state and filter out a huge amount of data we don't have any use for.
+
+    The output of `cardano-cli` is filtered while it is being read, so the whole ledger state
+    is never held in memory.
+    """
     cardano_cli_args = [
         "cardano-cli",
         "query",
@@ -825,49 +867,75 @@ def filtered_ledger_state(
         *cluster_obj.magic_args,
         f"--{cluster_obj.protocol}-mode",
     ]
-    cardano_cmd = " ".join(cardano_cli_args)
 
     # record cli coverage
     clusterlib.record_cli_coverage(
         cli_args=cardano_cli_args, coverage_dict=cluster_obj.cli_coverage
     )
 
-    # get rid of a huge amount of data we don't have any use for
-    cmd = (
-        f"{cardano_cmd} | jq -n --stream -c "
-        "'fromstream(inputs|select((length == 2 and .[0][1] == \"esLState\")|not))'"
-    )
+    # stderr goes to a file, so the process is not blocked on writing it while stdout is read
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as stderr_file, subprocess.Popen(
+        cardano_cli_args,
+        stdout=subprocess.PIPE,
+        stderr=stderr_file,
+        encoding="utf-8",
+    ) as proc:
+        assert proc.stdout
+        parse_err: Optional[ValueError] = None
+        out_str = ""
+        try:
+            out_str = json_stream.filter_json(
+                stream=proc.stdout, drop_paths=[("stateBefore", "esLState")]
+            )
+        except ValueError as err:
+            parse_err = err
+        # read the rest of output so the process is not blocked on writing
+        proc.stdout.read()
+        proc.wait()
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+
+    if proc.returncode != 0:
+        raise clusterlib.CLIError(
+            f"An error occurred running a CLI command `{' '.join(cardano_cli_args)}` on path "
+            f"`{Path.cwd()}`: {stderr}"
+        )
+    if parse_err:
+        raise parse_err
 
-    return helpers.run_in_bash(cmd).decode("utf-8").strip()
+    return out_str
 
 
-def get_blocks_before(
+def filtered_ledger_state(
     cluster_obj: clusterlib.ClusterLib,
-) -> Dict[str, int]:
-    """Get `blocksBefore` section of ledger state with bech32 encoded pool ids."""
-    cardano_cli_args = [
-        "cardano-cli",
-        "query",
-        "ledger-state",
-        *cluster_obj.magic_args,
-        f"--{cluster_obj.protocol}-mode",
-    ]
-    cardano_cmd = " ".join(cardano_cli_args)
+) -> str:
+    """Get filtered output of `query ledger-state`.
 
-    # record cli coverage
-    clusterlib.record_cli_coverage(
-        cli_args=cardano_cli_args, coverage_dict=cluster_obj.cli_coverage
-    )
+    The output is cached until a new block is added to the chain, so that multiple consumers
+    can share the same ledger state dump.
+    """
+    socket_path = os.environ.get("CARDANO_NODE_SOCKET_PATH", "")
+    tip_hash = cluster_obj.g_query.get_tip().get("hash", "")
 
-    # get rid of a huge amount of data we don't have any use for
-    cmd = (
-        f"{cardano_cmd} | jq -n --stream -c "
-        "'fromstream(1|truncate_stream(inputs|select(.[0][0] == \"blocksBefore\")))'"
-    )
+    cached = _LEDGER_STATE_CACHE.get(socket_path)
+    if tip_hash and cached and cached[0] == tip_hash:
+        return cached[1]
 
-    out_str = helpers.run_in_bash(cmd).decode("utf-8").strip()
-    out_json: dict = json.loads(out_str)
-    return {helpers.encode_bech32(prefix="pool", data=key): val for key, val in out_json.items()}
+    out_str = _query_filtered_ledger_state(cluster_obj)
+    _LEDGER_STATE_CACHE[socket_path] = (tip_hash, out_str)
+    return out_str
+
+
+def get_blocks_before(
+    cluster_obj: clusterlib.ClusterLib,
+) -> Dict[str, int]:
+    """Get `blocksBefore` section of ledger state with bech32 encoded pool ids."""
+    f_ledger_state = filtered_ledger_state(cluster_obj)
+    if not f_ledger_state:
+        return {}
+    blocks_before: Dict[str, int] = json.loads(f_ledger_state).get("blocksBefore") or {}
+    pool_ids = helpers.encode_bech32_bulk(prefix="pool", data=blocks_before)
+    return dict(zip(pool_ids, blocks_before.values()))
 
 
 def get_ledger_state(
@@ -905,7 +973,37 @@ def save_ledger_state(
     return json_file
 
 
-def wait_for_epoch_interval(
+class EpochClock:
+    """Local clock for time within epoch, synced to the tip of the chain.
+
+    The slot length is constant since Shelley era, so the current position within epoch can be
+    computed from the synced tip and the wall-clock time that elapsed since the sync.
+    """
+
+    def __init__(self, cluster_obj: clusterlib.ClusterLib) -> None:
+        self.cluster_obj = cluster_obj
+        self.tip: dict = {}
+        self.synced_at = 0.0
+        self.sync()
+
+    def sync(self) -> None:
+        """Sync the clock to the tip of the chain."""
+        # wait for new block so we start counting with an up-to-date slot number
+        self.cluster_obj.wait_for_new_block()
+        self.tip = self.cluster_obj.g_query.get_tip()
+        self.synced_at = time.time()
+
+    def now(self) -> Tuple[int, float]:
+        """Return current epoch and number of seconds from the epoch start."""
+        epoch_length_sec = self.cluster_obj.epoch_length_sec
+        s_from_tip_epoch_start = self.cluster_obj.time_from_epoch_start(tip=self.tip) + (
+            time.time() - self.synced_at
+        )
+        epoch = int(self.tip["epoch"]) + int(s_from_tip_epoch_start // epoch_length_sec)
+        return epoch, s_from_tip_epoch_start % epoch_length_sec
+
+
+def wait_for_epoch_interval(  # noqa: C901
     cluster_obj: clusterlib.ClusterLib,
     start: int,
     stop: int,
@@ -914,6 +1012,9 @@ def wait_for_epoch_interval(
 ) -> None:
     """Wait for time interval within an epoch.
 
+    The time is tracked by `EpochClock`, so the wait is a single sleep followed by a query
+    that confirms the clock agrees with the chain.
+
     Args:
         cluster_obj: An instance of `clusterlib.ClusterLib`.
         start: A start of the interval, in seconds. Negative number for counting from the
@@ -931,17 +1032,37 @@ def wait_for_epoch_interval(
     if start_abs > stop_abs:
         raise AssertionError(f"The 'start' ({start_abs}) needs to be <= 'stop' ({stop_abs}).")
 
-    start_epoch = cluster_obj.g_query.get_epoch()
-
-    # wait for new block so we start counting with an up-to-date slot number
-    cluster_obj.wait_for_new_block()
+    clock = EpochClock(cluster_obj=cluster_obj)
+    start_epoch = int(clock.tip["epoch"])
 
-    for __ in range(40):
-        s_from_epoch_start = cluster_obj.time_from_epoch_start()
+    for __ in range(10):
+        epoch, s_from_epoch_start = clock.now()
 
-        # return if we are in the required interval
         if start_abs <= s_from_epoch_start <= stop_abs:
-            break
+            tip = cluster_obj.g_query.get_tip()
+            tip_epoch = int(tip["epoch"])
+
+            if tip_epoch != epoch:
+                # the tip can be in previous epoch when no block was created in this epoch yet,
+                # keep waiting for next block (the sync waits for it)
+                if tip_epoch != epoch - 1:
+                    LOGGER.warning(
+                        f"Epoch clock is off (epoch {epoch} vs {tip_epoch}), re-syncing."
+                    )
+                clock.sync()
+                continue
+
+            # we can finish if slot number of last minted block doesn't need
+            # to match the time interval
+            if not check_slot:
+                break
+
+            if start_abs <= cluster_obj.time_from_epoch_start(tip=tip) <= stop_abs:
+                break
+
+            # the last block is older than the interval start, wait for next block
+            clock.sync()
+            continue
 
         # if we are already after the required interval, wait for next epoch
         if stop_abs < s_from_epoch_start:
@@ -949,24 +1070,16 @@ def wait_for_epoch_interval(
                 raise AssertionError(
                     f"Cannot reach the given interval ({start_abs}s to {stop_abs}s) in this epoch."
                 )
-            if cluster_obj.g_query.get_epoch() >= start_epoch + 2:
+            if epoch >= start_epoch + 2:
                 raise AssertionError(
                     f"Was unable to reach the given interval ({start_abs}s to {stop_abs}s) "
                     "in past 3 epochs."
                 )
-            cluster_obj.wait_for_new_epoch()
-            continue
-
-        # sleep until `start_abs`
-        to_sleep = start_abs - s_from_epoch_start
-        if to_sleep > 0:
-            # `to_sleep` is float, wait for at least 1 second
-            time.sleep(to_sleep if to_sleep > 1 else 1)
+            to_sleep = cluster_obj.epoch_length_sec - s_from_epoch_start + start_abs
+        else:
+            to_sleep = start_abs - s_from_epoch_start
 
-        # we can finish if slot number of last minted block doesn't need
-        # to match the time interval
-        if not check_slot:
-            break
+        time.sleep(to_sleep)
     else:
         raise AssertionError(f"Failed to wait for given interval from {start_abs}s to {stop_abs}s.")
 
@@ -1082,13 +1195,60 @@ def create_script_context(
     assert redeemer_file.exists()
 
 
+# results of `cli_has` probes that are already known to this process
+_CLI_CAPABILITIES: Dict[str, bool] = {}
+
+
+@helpers.callonce
+def _get_cli_capabilities_file() -> Path:
+    """Return path to the file with results of `cli_has` probes.
+
+    The file is shared by all pytest workers and test runs that use the same `cardano-cli` binary
+    and version.
+    """
+    cli_path = helpers.get_cmd_path("cardano-cli")
+    # version and git revision
+    cli_version = helpers.run_command("cardano-cli --version").decode().strip()
+    cli_id = f"{cli_path}:{cli_version}"
+    cli_id_hash = hashlib.sha1(cli_id.encode("utf-8")).hexdigest()[:16]
+    return temptools.get_basetemp() / f"cli_capabilities_{cli_id_hash}.json"
+
+
+def _read_cli_capabilities(caps_file: Path) -> Dict[str, bool]:
+    if not caps_file.exists():
+        return {}
+    try:
+        with open(caps_file, encoding="utf-8") as in_json:
+            caps: Dict[str, bool] = json.load(in_json)
+    except json.JSONDecodeError:
+        return {}
+    return caps
+
+
 def cli_has(command: str) -> bool:
     """Check if a cardano-cli subcommand or argument is available.
 
     E.g. `cli_has("query leadership-schedule --next")`
+
+    Each command is probed only once per `cardano-cli` version, the results are shared by all
+    pytest workers.
     """
-    full_command = f"cardano-cli {command}"
-    return helpers.tool_has(full_command)
+    if command in _CLI_CAPABILITIES:
+        return _CLI_CAPABILITIES[command]
+
+    caps_file = _get_cli_capabilities_file()
+    with locking.FileLockIfXdist(f"{caps_file}.lock"):
+        caps = _read_cli_capabilities(caps_file)
+        if command not in caps:
+            caps[command] = helpers.tool_has(f"cardano-cli {command}")
+            # write the file atomically, it can be read by other test runs without lock
+            tmp_file = caps_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as out_json:
+                json.dump(caps, out_json, indent=4)
+            tmp_file.replace(caps_file)
+
+    _CLI_CAPABILITIES.update(caps)
+    return caps[command]
 
 
 def check_txins_spent(
@@ -57,6 +57,11 @@ SCHEDULING_LOG: Union[str, Path] = os.environ.get("SCHEDULING_LOG") or ""
 if SCHEDULING_LOG:
     SCHEDULING_LOG = Path(SCHEDULING_LOG).expanduser().resolve()
 
+# resolve SCHEDULING_DURATIONS_DB
+SCHEDULING_DURATIONS_DB: Union[str, Path] = os.environ.get("SCHEDULING_DURATIONS_DB") or ""
+if SCHEDULING_DURATIONS_DB:
+    SCHEDULING_DURATIONS_DB = Path(SCHEDULING_DURATIONS_DB).expanduser().resolve()
+
 # resolve BLOCK_PRODUCTION_DB
 BLOCK_PRODUCTION_DB: Union[str, Path] = os.environ.get("BLOCK_PRODUCTION_DB") or ""
 if BLOCK_PRODUCTION_DB:
@@ -74,6 +79,26 @@ CLUSTERS_COUNT = int(os.environ.get("CLUSTERS_COUNT") or 0)
 WORKERS_COUNT = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT") or 1)
 CLUSTERS_COUNT = int(CLUSTERS_COUNT or (WORKERS_COUNT if WORKERS_COUNT <= 9 else 9))
 
+# number of spare cluster instances kept in standby, swapped in when an instance needs respin
+SPARE_CLUSTERS_COUNT = int(os.environ.get("SPARE_CLUSTERS_COUNT") or 0)
+
+# backend for storing scheduling status of cluster instances
+SCHEDULING_BACKEND = os.environ.get("SCHEDULING_BACKEND") or "files"
+if SCHEDULING_BACKEND not in ("files", "sqlite"):
+    raise RuntimeError(f"Invalid SCHEDULING_BACKEND: {SCHEDULING_BACKEND}")
+
+# make scheduling decisions in a single coordinator process instead of in each pytest worker
+SCHEDULING_COORDINATOR = bool(os.environ.get("SCHEDULING_COORDINATOR"))
+
+# number of UTxOs the test faucet addresses are funded with on local cluster
+FAUCET_UTXOS_COUNT = int(os.environ.get("FAUCET_UTXOS_COUNT") or 0)
+
+# fund requests of multiple workers from the same faucet in a single transaction
+FAUCET_BATCHING = bool(os.environ.get("FAUCET_BATCHING"))
+
+# save gzip-compressed copies of log files when collecting artifacts
+COMPRESS_ARTIFACTS_LOGS = bool(os.environ.get("COMPRESS_ARTIFACTS_LOGS"))
+
 DEV_CLUSTER_RUNNING = bool(os.environ.get("DEV_CLUSTER_RUNNING"))
 FORBID_RESTART = bool(os.environ.get("FORBID_RESTART"))
 
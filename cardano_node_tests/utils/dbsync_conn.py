@@ -1,7 +1,14 @@
 """Functionality for interacting with db-sync database in postgres."""
+import contextlib
 import logging
+import threading
+import time
+from typing import Any
 from typing import Dict
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Set
 
 import psycopg2
 
@@ -11,19 +18,130 @@ from cardano_node_tests.utils import helpers
 
 LOGGER = logging.getLogger(__name__)
 
+# max number of idle connections kept in the pool of each cluster instance
+POOL_SIZE = 4
+
+# check that idle connection is still alive when it was not used for this many seconds
+POOL_HEALTH_CHECK_SEC = 30
+
+# channel for notifications about blocks inserted by db-sync
+BLOCK_NOTIFY_CHANNEL = "cnt_block_inserted"
+
+# trigger that sends notification with block number for every block inserted by db-sync
+_BLOCK_NOTIFY_SQL = (
+    "CREATE OR REPLACE FUNCTION cnt_notify_block_inserted() RETURNS trigger AS $$ "
+    f"BEGIN PERFORM pg_notify('{BLOCK_NOTIFY_CHANNEL}', NEW.block_no::text); RETURN NULL; END; "
+    "$$ LANGUAGE plpgsql; "
+    "DO $$ BEGIN "
+    "IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'cnt_block_inserted') THEN "
+    "CREATE TRIGGER cnt_block_inserted AFTER INSERT ON block "
+    "FOR EACH ROW EXECUTE PROCEDURE cnt_notify_block_inserted(); "
+    "END IF; END $$;"
+)
+
+
+class PooledConnection(psycopg2.extensions.connection):
+    """Connection that keeps track of statements prepared on it and of its last use."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.prepared: Set[str] = set()
+        self.last_used = time.monotonic()
+
+
+class _ConnPool:
+    """Pool of connections to db-sync database of a single cluster instance.
+
+    A new connection is opened when there is no idle connection, so getting a connection never
+    waits for other queries to finish. At most `POOL_SIZE` idle connections are kept open.
+    """
+
+    def __init__(self, instance_num: int) -> None:
+        self.instance_num = instance_num
+        self.idle: List[PooledConnection] = []
+        self.lock = threading.Lock()
+
+    def _get_idle(self) -> Optional[PooledConnection]:
+        with self.lock:
+            return self.idle.pop() if self.idle else None
+
+    def get(self) -> PooledConnection:
+        while (conn := self._get_idle()) is not None:
+            if conn.closed == 0 and (
+                time.monotonic() - conn.last_used < POOL_HEALTH_CHECK_SEC or _is_alive(conn)
+            ):
+                return conn
+            _close(instance_num=self.instance_num, conn=conn)
+
+        conn = _connect(instance_num=self.instance_num, connection_factory=PooledConnection)
+        # no transaction is left open between queries, and failed query doesn't affect
+        # following queries
+        conn.autocommit = True
+        return conn  # type: ignore
+
+    def put(self, conn: PooledConnection) -> None:
+        # connection with unfinished transaction is not reused
+        if conn.closed == 0 and conn.autocommit:
+            conn.last_used = time.monotonic()
+            with self.lock:
+                if len(self.idle) < POOL_SIZE:
+                    self.idle.append(conn)
+                    return
+        _close(instance_num=self.instance_num, conn=conn)
+
+    def close_all(self) -> None:
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for conn in idle:
+            _close(instance_num=self.instance_num, conn=conn)
+
 
 class DBSyncCache:
-    """Cache connection to db-sync database for each cluster instance."""
+    """Cache connections to db-sync database for each cluster instance."""
 
-    conns: Dict[int, Optional[psycopg2.extensions.connection]] = {0: None}
+    pools: Dict[int, _ConnPool] = {}
+    # connections listening for notifications about inserted blocks; `None` when
+    # the notifications are not available
+    block_listeners: Dict[int, Optional[psycopg2.extensions.connection]] = {}
 
 
-def _conn(instance_num: int) -> psycopg2.extensions.connection:
+def _connect(instance_num: int, **kwargs: Any) -> psycopg2.extensions.connection:
     # Call `psycopg2.connect` with an empty string so it uses PG* env variables.
     # Temporarily set PGDATABASE env var to the database corresponding to `instance_num`.
     with helpers.environ({"PGDATABASE": f"{configuration.DBSYNC_DB}{instance_num}"}):
-        conn = psycopg2.connect("")
-    DBSyncCache.conns[instance_num] = conn
+        return psycopg2.connect("", **kwargs)
+
+
+def _is_alive(conn: psycopg2.extensions.connection) -> bool:
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1;")
+    except psycopg2.Error:
+        return False
+    return True
+
+
+def _block_listener(instance_num: int) -> Optional[psycopg2.extensions.connection]:
+    conn = None
+    try:
+        conn = _connect(instance_num=instance_num)
+        # notifications are delivered only outside of transactions
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            try:
+                cur.execute(_BLOCK_NOTIFY_SQL)
+            except psycopg2.Error:
+                # the trigger might have been created concurrently by other worker
+                cur.execute("SELECT 1 FROM pg_trigger WHERE tgname = 'cnt_block_inserted';")
+                if not cur.fetchone():
+                    raise
+            cur.execute(f"LISTEN {BLOCK_NOTIFY_CHANNEL};")
+    except psycopg2.Error as err:
+        LOGGER.warning(f"Notifications about blocks inserted by db-sync are not available: {err}")
+        _close(instance_num=instance_num, conn=conn)
+        conn = None
+
+    DBSyncCache.block_listeners[instance_num] = conn
     return conn
 
 
@@ -31,7 +149,7 @@ def _close(instance_num: int, conn: Optional[psycopg2.extensions.connection]) ->
     if conn is None or conn.closed == 1:
         return
 
-    LOGGER.info(f"Closing connection to db-sync database {configuration.DBSYNC_DB}{instance_num}.")
+    LOGGER.debug(f"Closing connection to db-sync database {configuration.DBSYNC_DB}{instance_num}.")
     try:
         conn.close()
     except psycopg2.Error as err:
@@ -41,24 +159,55 @@ def _close(instance_num: int, conn: Optional[psycopg2.extensions.connection]) ->
         )
 
 
-def conn() -> psycopg2.extensions.connection:
+def _get_pool() -> _ConnPool:
     instance_num = cluster_nodes.get_instance_num()
-    conn = DBSyncCache.conns.get(instance_num)
+    pool = DBSyncCache.pools.get(instance_num)
+    if pool is None:
+        pool = DBSyncCache.pools[instance_num] = _ConnPool(instance_num=instance_num)
+    return pool
 
-    if conn is None or conn.closed == 1:
-        return _conn(instance_num=instance_num)
 
-    return conn
+def close_idle() -> None:
+    """Close idle pooled connections, e.g. when connections were lost after database restart."""
+    _get_pool().close_all()
+
+
+@contextlib.contextmanager
+def pooled_conn() -> Iterator[PooledConnection]:
+    """Get connection from the pool of the current cluster instance, return it back when done."""
+    pool = _get_pool()
+    conn = pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put(conn)
+
 
+def block_listener() -> Optional[psycopg2.extensions.connection]:
+    """Return connection that receives notifications about blocks inserted by db-sync.
 
-def reconn() -> psycopg2.extensions.connection:
+    The trigger that sends the notifications is installed to the db-sync database on first use.
+    Return `None` when the notifications are not available.
+    """
     instance_num = cluster_nodes.get_instance_num()
-    conn = DBSyncCache.conns.get(instance_num)
-    _close(instance_num=instance_num, conn=conn)
-    conn = _conn(instance_num=instance_num)
+    if instance_num not in DBSyncCache.block_listeners:
+        return _block_listener(instance_num=instance_num)
+
+    conn = DBSyncCache.block_listeners[instance_num]
+    if conn is not None and conn.closed != 0:
+        return _block_listener(instance_num=instance_num)
+
     return conn
 
 
+def close_block_listener() -> None:
+    """Close the connection that receives notifications, it is re-created on next use."""
+    instance_num = cluster_nodes.get_instance_num()
+    _close(instance_num=instance_num, conn=DBSyncCache.block_listeners.pop(instance_num, None))
+
+
 def close_all() -> None:
-    for instance_num, conn in DBSyncCache.conns.items():
+    for instance_num, conn in DBSyncCache.block_listeners.items():
         _close(instance_num=instance_num, conn=conn)
+    for pool in DBSyncCache.pools.values():
+        pool.close_all()
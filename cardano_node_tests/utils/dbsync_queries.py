@@ -1,6 +1,11 @@
 """SQL queries to db-sync database."""
 import contextlib
 import decimal
+import itertools
+import logging
+import re
+import threading
+import time
 from typing import Any
 from typing import Dict
 from typing import Generator
@@ -15,6 +20,13 @@ import psycopg2
 
 from cardano_node_tests.utils import dbsync_conn
 
+LOGGER = logging.getLogger(__name__)
+
+# number of records fetched at a time when streaming query results using server-side cursor
+STREAM_ITERSIZE = 2000
+
+_CURSOR_IDS = itertools.count()
+
 
 class PoolDataDBRow(NamedTuple):
     id: int
@@ -310,27 +322,161 @@ class EpochDBRow(NamedTuple):
     epoch_number: int
 
 
-@contextlib.contextmanager
-def execute(query: str, vars: Sequence = ()) -> Iterator[psycopg2.extensions.cursor]:
+class LastBlockDBRow(NamedTuple):
+    block_no: int
+    slot_no: Optional[int]
+
+
+class TxFullDBRow(NamedTuple):
+    tx_id: int
+    tx_hash: memoryview
+    block_id: int
+    block_index: int
+    out_sum: decimal.Decimal
+    fee: decimal.Decimal
+    deposit: int
+    size: int
+    invalid_before: Optional[decimal.Decimal]
+    invalid_hereafter: Optional[decimal.Decimal]
+    txouts: Optional[List[Dict[str, Any]]]
+    txins: Optional[List[Dict[str, Any]]]
+    mint: Optional[List[Dict[str, Any]]]
+    collaterals: Optional[List[Dict[str, Any]]]
+    collateral_outputs: Optional[List[Dict[str, Any]]]
+    reference_inputs: Optional[List[Dict[str, Any]]]
+    scripts: Optional[List[Dict[str, Any]]]
+    redeemers: Optional[List[Dict[str, Any]]]
+    metadata: Optional[List[Dict[str, Any]]]
+    reserve: Optional[List[Dict[str, Any]]]
+    treasury: Optional[List[Dict[str, Any]]]
+    pot_transfers: Optional[List[Dict[str, Any]]]
+    stake_registration: Optional[List[str]]
+    stake_deregistration: Optional[List[str]]
+    stake_delegation: Optional[List[Dict[str, Any]]]
+    withdrawals: Optional[List[Dict[str, Any]]]
+    extra_key_witness: Optional[List[Dict[str, Any]]]
+
+
+class QueryStats:
+    """Collect timing statistics of executed SQL statements."""
+
+    # statement name -> (count, total time, max time)
+    stats: Dict[str, Tuple[int, float, float]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(cls, name: str, elapsed: float) -> None:
+        with cls._lock:
+            count, total, max_time = cls.stats.get(name, (0, 0.0, 0.0))
+            cls.stats[name] = (count + 1, total + elapsed, max(max_time, elapsed))
+
+    @classmethod
+    def get_report(cls) -> str:
+        """Return statistics of statements, sorted by the total time spent executing them."""
+        with cls._lock:
+            stats = sorted(cls.stats.items(), key=lambda s: s[1][1], reverse=True)
+        return "\n".join(
+            f"{total:9.3f}s total, {count:6d} calls, {total / count:.4f}s avg, "
+            f"{max_time:.4f}s max: {' '.join(name.split())[:100]}"
+            for name, (count, total, max_time) in stats
+        )
+
+
+def _to_positional_params(query: str) -> str:
+    """Replace `%s` placeholders with positional parameters (`$1`, `$2`, ...) of `PREPARE`."""
+    counter = itertools.count(1)
+    return re.sub("%s", lambda __: f"${next(counter)}", query).replace("%%", "%")
+
+
+def _execute(
+    conn: dbsync_conn.PooledConnection,
+    query: str,
+    vars: Sequence,
+    prepared_name: str,
+    itersize: int,
+) -> psycopg2.extensions.cursor:
     # pylint: disable=redefined-builtin
-    cur = None
-    try:
-        cur = dbsync_conn.conn().cursor()
+    if itersize:
+        # server-side cursor exists only inside of a transaction
+        conn.autocommit = False
+        cur = conn.cursor(name=f"cnt_cursor_{next(_CURSOR_IDS)}")
+        cur.itersize = itersize
+    else:
+        cur = conn.cursor()
 
-        try:
+    try:
+        start = time.perf_counter()
+        # statement prepared with `PREPARE` cannot be used for declaring server-side cursor
+        if prepared_name and not itersize:
+            if prepared_name not in conn.prepared:
+                cur.execute(f"PREPARE {prepared_name} AS {_to_positional_params(query)}")
+                conn.prepared.add(prepared_name)
+            params = f" ({', '.join(['%s'] * len(vars))})" if vars else ""
+            cur.execute(f"EXECUTE {prepared_name}{params};", vars)
+        else:
             cur.execute(query, vars)
-            conn_alive = True
-        except psycopg2.Error:
-            conn_alive = False
+        QueryStats.record(name=prepared_name or query, elapsed=time.perf_counter() - start)
+    except Exception:
+        _close_cursor(conn=conn, cur=cur)
+        raise
+    return cur
 
-        if not conn_alive:
-            cur = dbsync_conn.reconn().cursor()
-            cur.execute(query, vars)
 
-        yield cur
-    finally:
-        if cur is not None:
-            cur.close()
+def _close_cursor(conn: dbsync_conn.PooledConnection, cur: psycopg2.extensions.cursor) -> None:
+    if conn.closed != 0:
+        return
+    cur.close()
+    # end the transaction started for server-side cursor
+    if not conn.autocommit:
+        conn.rollback()
+        conn.autocommit = True
+
+
+@contextlib.contextmanager
+def execute(
+    query: str, vars: Sequence = (), prepared_name: str = "", itersize: int = 0
+) -> Iterator[psycopg2.extensions.cursor]:
+    """Execute the query on a pooled connection and yield the cursor.
+
+    When `prepared_name` is set, the query is prepared as a named statement the first time it is
+    executed on the connection, so it is not parsed and planned again on subsequent executions.
+
+    When `itersize` is set, the query is executed using server-side cursor. Iterating over
+    the cursor fetches `itersize` records at a time, instead of fetching the whole result at once.
+    """
+    # pylint: disable=redefined-builtin
+    with dbsync_conn.pooled_conn() as conn:
+        try:
+            cur = _execute(
+                conn=conn,
+                query=query,
+                vars=vars,
+                prepared_name=prepared_name,
+                itersize=itersize,
+            )
+        except psycopg2.Error:
+            # the error is not caused by broken connection
+            if conn.closed == 0:
+                raise
+            LOGGER.warning("Connection to db-sync database was lost, reconnecting.")
+            # other idle connections were most likely lost as well
+            dbsync_conn.close_idle()
+        else:
+            try:
+                yield cur
+            finally:
+                _close_cursor(conn=conn, cur=cur)
+            return
+
+    # repeat the query on a new connection
+    with dbsync_conn.pooled_conn() as conn:
+        cur = _execute(
+            conn=conn, query=query, vars=vars, prepared_name=prepared_name, itersize=itersize
+        )
+        try:
+            yield cur
+        finally:
+            _close_cursor(conn=conn, cur=cur)
 
 
 class SchemaVersion:
@@ -389,11 +535,178 @@ def query_tx(txhash: str) -> Generator[TxDBRow, None, None]:
         "WHERE tx.hash = %s;"
     )
 
-    with execute(query=query, vars=(rf"\x{txhash}",)) as cur:
+    with execute(query=query, vars=(rf"\x{txhash}",), prepared_name="query_tx") as cur:
         while (result := cur.fetchone()) is not None:
             yield TxDBRow(*result)
 
 
+def _ma_json_query(tx_out_table: str) -> str:
+    """Return subquery that aggregates multi-assets of `tx_out_table` record into JSON."""
+    return (
+        "(SELECT json_agg(json_build_object("
+        "'id', ma_tx_out.id, 'policy', encode(multi_asset.policy, 'hex'),"
+        " 'name', encode(multi_asset.name, 'hex'), 'quantity', ma_tx_out.quantity)"
+        " ORDER BY ma_tx_out.id) "
+        "FROM ma_tx_out "
+        "LEFT JOIN multi_asset ON ma_tx_out.ident = multi_asset.id "
+        f"WHERE ma_tx_out.tx_out_id = {tx_out_table}.id)"
+    )
+
+
+def _spent_txouts_json_query(tx_in_table: str, with_ma: bool) -> str:
+    """Return subquery that aggregates txouts spent by `tx_in_table` records into JSON."""
+    ma_query = f", 'assets', {_ma_json_query('tx_out')}" if with_ma else ""
+    return (
+        "(SELECT json_agg(json_build_object("
+        "'id', tx_out.id, 'index', tx_out.index, 'address', tx_out.address,"
+        " 'value', tx_out.value, 'tx_hash', encode(src_tx.hash, 'hex')"
+        f"{ma_query}) ORDER BY {tx_in_table}.id) "
+        f"FROM {tx_in_table} "
+        "INNER JOIN tx_out "
+        f"ON (tx_out.tx_id = {tx_in_table}.tx_out_id AND"
+        f"    tx_out.index = {tx_in_table}.tx_out_index) "
+        "INNER JOIN tx src_tx ON src_tx.id = tx_out.tx_id "
+        f"WHERE {tx_in_table}.tx_in_id = tx.id)"
+    )
+
+
+# select of a transaction together with all its related records aggregated into JSON lists
+_TX_FULL_SELECT = (
+    "SELECT"
+    " tx.id, tx.hash, tx.block_id, tx.block_index, tx.out_sum, tx.fee, tx.deposit, tx.size,"
+    " tx.invalid_before, tx.invalid_hereafter,"
+    # txouts
+    " (SELECT json_agg(json_build_object("
+    "'id', tx_out.id, 'index', tx_out.index, 'address', tx_out.address,"
+    " 'value', tx_out.value, 'data_hash', encode(tx_out.data_hash, 'hex'),"
+    " 'inline_datum_hash', encode(datum.hash, 'hex'),"
+    " 'reference_script_hash', encode(script.hash, 'hex'),"
+    f" 'assets', {_ma_json_query('tx_out')}) ORDER BY tx_out.id) "
+    "FROM tx_out "
+    "LEFT JOIN datum ON tx_out.inline_datum_id = datum.id "
+    "LEFT JOIN script ON tx_out.reference_script_id = script.id "
+    "WHERE tx_out.tx_id = tx.id),"
+    # txins
+    f" {_spent_txouts_json_query(tx_in_table='tx_in', with_ma=True)},"
+    # mint
+    " (SELECT json_agg(json_build_object("
+    "'id', ma_tx_mint.id, 'policy', encode(multi_asset.policy, 'hex'),"
+    " 'name', encode(multi_asset.name, 'hex'), 'quantity', ma_tx_mint.quantity)"
+    " ORDER BY ma_tx_mint.id) "
+    "FROM ma_tx_mint "
+    "LEFT JOIN multi_asset ON ma_tx_mint.ident = multi_asset.id "
+    "WHERE ma_tx_mint.tx_id = tx.id),"
+    # collaterals
+    f" {_spent_txouts_json_query(tx_in_table='collateral_tx_in', with_ma=False)},"
+    # collateral outputs
+    " (SELECT json_agg(json_build_object("
+    "'id', collateral_tx_out.id, 'index', collateral_tx_out.index,"
+    " 'address', collateral_tx_out.address, 'value', collateral_tx_out.value)"
+    " ORDER BY collateral_tx_out.id) "
+    "FROM collateral_tx_out WHERE collateral_tx_out.tx_id = tx.id),"
+    # reference inputs
+    f" {_spent_txouts_json_query(tx_in_table='reference_tx_in', with_ma=False)},"
+    # scripts
+    " (SELECT json_agg(json_build_object("
+    "'hash', encode(script.hash, 'hex'), 'type', script.type,"
+    " 'serialised_size', script.serialised_size) ORDER BY script.id) "
+    "FROM script WHERE script.tx_id = tx.id),"
+    # redeemers
+    " (SELECT json_agg(json_build_object("
+    "'unit_mem', redeemer.unit_mem, 'unit_steps', redeemer.unit_steps,"
+    " 'fee', redeemer.fee, 'purpose', redeemer.purpose,"
+    " 'script_hash', encode(redeemer.script_hash, 'hex'), 'value', redeemer_data.value)"
+    " ORDER BY redeemer.id) "
+    "FROM redeemer "
+    "LEFT JOIN redeemer_data ON redeemer_data.id = redeemer.redeemer_data_id "
+    "WHERE redeemer.tx_id = tx.id),"
+    # metadata
+    " (SELECT json_agg(json_build_object("
+    "'key', tx_metadata.key, 'json', tx_metadata.json,"
+    " 'bytes', encode(tx_metadata.bytes, 'hex')) ORDER BY tx_metadata.id) "
+    "FROM tx_metadata WHERE tx_metadata.tx_id = tx.id),"
+    # reserve
+    " (SELECT json_agg(json_build_object("
+    "'address', stake_address.view, 'cert_index', reserve.cert_index,"
+    " 'amount', reserve.amount) ORDER BY reserve.id) "
+    "FROM reserve "
+    "INNER JOIN stake_address ON reserve.addr_id = stake_address.id "
+    "WHERE reserve.tx_id = tx.id),"
+    # treasury
+    " (SELECT json_agg(json_build_object("
+    "'address', stake_address.view, 'cert_index', treasury.cert_index,"
+    " 'amount', treasury.amount) ORDER BY treasury.id) "
+    "FROM treasury "
+    "INNER JOIN stake_address ON treasury.addr_id = stake_address.id "
+    "WHERE treasury.tx_id = tx.id),"
+    # pot transfers
+    " (SELECT json_agg(json_build_object("
+    "'treasury', pot_transfer.treasury, 'reserves', pot_transfer.reserves)"
+    " ORDER BY pot_transfer.id) "
+    "FROM pot_transfer WHERE pot_transfer.tx_id = tx.id),"
+    # stake registration
+    " (SELECT json_agg(stake_address.view ORDER BY stake_registration.id) "
+    "FROM stake_registration "
+    "INNER JOIN stake_address ON stake_registration.addr_id = stake_address.id "
+    "WHERE stake_registration.tx_id = tx.id),"
+    # stake deregistration
+    " (SELECT json_agg(stake_address.view ORDER BY stake_deregistration.id) "
+    "FROM stake_deregistration "
+    "INNER JOIN stake_address ON stake_deregistration.addr_id = stake_address.id "
+    "WHERE stake_deregistration.tx_id = tx.id),"
+    # stake delegation
+    " (SELECT json_agg(json_build_object("
+    "'address', stake_address.view, 'pool_id', pool_hash.view,"
+    " 'active_epoch_no', delegation.active_epoch_no) ORDER BY delegation.id) "
+    "FROM delegation "
+    "INNER JOIN stake_address ON delegation.addr_id = stake_address.id "
+    "INNER JOIN pool_hash ON pool_hash.id = delegation.pool_hash_id "
+    "WHERE delegation.tx_id = tx.id),"
+    # withdrawals
+    " (SELECT json_agg(json_build_object("
+    "'address', stake_address.view, 'amount', withdrawal.amount) ORDER BY withdrawal.id) "
+    "FROM withdrawal "
+    "INNER JOIN stake_address ON withdrawal.addr_id = stake_address.id "
+    "WHERE withdrawal.tx_id = tx.id),"
+    # extra key witnesses
+    " (SELECT json_agg(json_build_object("
+    "'tx_hash', encode(tx.hash, 'hex'), 'witness_hash', encode(extra_key_witness.hash, 'hex'))"
+    " ORDER BY extra_key_witness.id) "
+    "FROM extra_key_witness WHERE extra_key_witness.tx_id = tx.id) "
+    "FROM tx "
+)
+
+
+def query_tx_full(txhash: str) -> Optional[TxFullDBRow]:
+    """Query a transaction together with all its related records in db-sync.
+
+    All the records are retrieved in a single round trip. Records of each kind are aggregated
+    into a JSON list, so the result is a single row.
+    """
+    query = f"{_TX_FULL_SELECT}WHERE tx.hash = %s;"
+
+    with execute(query=query, vars=(rf"\x{txhash}",), prepared_name="query_tx_full") as cur:
+        result = cur.fetchone()
+        return TxFullDBRow(*result) if result else None
+
+
+def query_txs_full(txhashes: List[str]) -> Generator[TxFullDBRow, None, None]:
+    """Query multiple transactions together with all their related records in db-sync.
+
+    All the transactions are retrieved in a single round trip, a row for each transaction
+    that is present in db-sync.
+    """
+    query = f"{_TX_FULL_SELECT}WHERE tx.hash = ANY(%s) ORDER BY tx.id;"
+
+    with execute(
+        query=query,
+        vars=([bytes.fromhex(h) for h in txhashes],),
+        prepared_name="query_txs_full",
+    ) as cur:
+        while (result := cur.fetchone()) is not None:
+            yield TxFullDBRow(*result)
+
+
 def query_tx_ins(txhash: str) -> Generator[TxInDBRow, None, None]:
     """Query transaction txins in db-sync."""
     query = (
@@ -410,7 +723,7 @@ def query_tx_ins(txhash: str) -> Generator[TxInDBRow, None, None]:
         "WHERE tx.hash = %s;"
     )
 
-    with execute(query=query, vars=(rf"\x{txhash}",)) as cur:
+    with execute(query=query, vars=(rf"\x{txhash}",), prepared_name="query_tx_ins") as cur:
         while (result := cur.fetchone()) is not None:
             yield TxInDBRow(*result)
 
@@ -651,9 +964,12 @@ def query_ada_pots(
 
 
 def query_address_reward(
-    address: str, epoch_from: int = 0, epoch_to: int = 99999999
+    address: str, epoch_from: int = 0, epoch_to: int = 99999999, stream: bool = False
 ) -> Generator[RewardDBRow, None, None]:
-    """Query reward records for stake address in db-sync."""
+    """Query reward records for stake address in db-sync.
+
+    When `stream` is set, the records are fetched from the server in batches.
+    """
     query = (
         "SELECT"
         " stake_address.view, reward.type, reward.amount, reward.earned_epoch,"
@@ -665,13 +981,21 @@ def query_address_reward(
         "ORDER BY reward.id;"
     )
 
-    with execute(query=query, vars=(address, epoch_from, epoch_to)) as cur:
-        while (result := cur.fetchone()) is not None:
+    with execute(
+        query=query,
+        vars=(address, epoch_from, epoch_to),
+        prepared_name="query_address_reward",
+        itersize=STREAM_ITERSIZE if stream else 0,
+    ) as cur:
+        for result in cur:
             yield RewardDBRow(*result)
 
 
-def query_utxo(address: str) -> Generator[UTxODBRow, None, None]:
-    """Query UTxOs for payment address in db-sync."""
+def query_utxo(address: str, stream: bool = False) -> Generator[UTxODBRow, None, None]:
+    """Query UTxOs for payment address in db-sync.
+
+    When `stream` is set, the records are fetched from the server in batches.
+    """
     query = (
         "SELECT"
         " tx.hash, utxo_view.index, utxo_view.address, stake_address.view,"
@@ -683,8 +1007,13 @@ def query_utxo(address: str) -> Generator[UTxODBRow, None, None]:
         "ORDER BY utxo_view.id;"
     )
 
-    with execute(query=query, vars=(address,)) as cur:
-        while (result := cur.fetchone()) is not None:
+    with execute(
+        query=query,
+        vars=(address,),
+        prepared_name="query_utxo",
+        itersize=STREAM_ITERSIZE if stream else 0,
+    ) as cur:
+        for result in cur:
             yield UTxODBRow(*result)
 
 
@@ -755,9 +1084,12 @@ def query_pool_offline_fetch_error(
 
 
 def query_epoch_stake(
-    pool_id_bech32: str, epoch_number: int
+    pool_id_bech32: str, epoch_number: int, stream: bool = False
 ) -> Generator[EpochStakeDBRow, None, None]:
-    """Query epoch stake record for a pool in db-sync."""
+    """Query epoch stake record for a pool in db-sync.
+
+    When `stream` is set, the records are fetched from the server in batches.
+    """
     query = (
         "SELECT "
         " epoch_stake.id, pool_hash.hash_raw, pool_hash.view, epoch_stake.amount,"
@@ -768,15 +1100,22 @@ def query_epoch_stake(
         "ORDER BY epoch_stake.epoch_no DESC;"
     )
 
-    with execute(query=query, vars=(pool_id_bech32, epoch_number)) as cur:
-        while (result := cur.fetchone()) is not None:
+    with execute(
+        query=query,
+        vars=(pool_id_bech32, epoch_number),
+        itersize=STREAM_ITERSIZE if stream else 0,
+    ) as cur:
+        for result in cur:
             yield EpochStakeDBRow(*result)
 
 
 def query_blocks(
-    pool_id_bech32: str = "", epoch_from: int = 0, epoch_to: int = 99999999
+    pool_id_bech32: str = "", epoch_from: int = 0, epoch_to: int = 99999999, stream: bool = False
 ) -> Generator[BlockDBRow, None, None]:
-    """Query block records in db-sync."""
+    """Query block records in db-sync.
+
+    When `stream` is set, the records are fetched from the server in batches.
+    """
     if pool_id_bech32:
         pool_query = "(pool_hash.view = %s) AND"
         query_vars: tuple = (pool_id_bech32, epoch_from, epoch_to)
@@ -796,11 +1135,28 @@ def query_blocks(
         "ORDER BY block.id;"
     )
 
-    with execute(query=query, vars=query_vars) as cur:
-        while (result := cur.fetchone()) is not None:
+    prepared_name = "query_blocks_pool" if pool_id_bech32 else "query_blocks"
+    with execute(
+        query=query,
+        vars=query_vars,
+        prepared_name=prepared_name,
+        itersize=STREAM_ITERSIZE if stream else 0,
+    ) as cur:
+        for result in cur:
             yield BlockDBRow(*result)
 
 
+def query_last_block() -> Optional[LastBlockDBRow]:
+    """Query number and slot of the last block recorded in db-sync."""
+    query = (
+        "SELECT block_no, slot_no FROM block WHERE block_no IS NOT NULL ORDER BY id DESC LIMIT 1;"
+    )
+
+    with execute(query=query, prepared_name="query_last_block") as cur:
+        result = cur.fetchone()
+        return LastBlockDBRow(*result) if result else None
+
+
 def query_table_names() -> List[str]:
     """Query table names in db-sync."""
     query = (
@@ -816,6 +1172,15 @@ def query_table_names() -> List[str]:
         return table_names
 
 
+def query_latest_tx_hashes(limit: int = 100) -> List[str]:
+    """Query hashes of the latest transactions in db-sync."""
+    query = "SELECT encode(hash, 'hex') FROM tx ORDER BY id DESC LIMIT %s;"
+
+    with execute(query=query, vars=(limit,)) as cur:
+        results: List[Tuple[str]] = cur.fetchall()
+        return [r[0] for r in results]
+
+
 def query_datum(datum_hash: str) -> Generator[DatumDBRow, None, None]:
     """Query datum record in db-sync."""
     query = "SELECT id, hash, tx_id, value, bytes FROM datum WHERE hash = %s;"
@@ -3,6 +3,7 @@ import functools
 import itertools
 import json
 import logging
+import select
 import time
 from typing import Any
 from typing import Callable
@@ -12,16 +13,29 @@ from typing import NamedTuple
 from typing import Optional
 from typing import Union
 
+import psycopg2
 from cardano_clusterlib import clusterlib
 
 from cardano_node_tests.utils import clusterlib_utils
 from cardano_node_tests.utils import configuration
+from cardano_node_tests.utils import dbsync_conn
 from cardano_node_tests.utils import dbsync_queries
 
 LOGGER = logging.getLogger(__name__)
 
 NO_REPONSE_STR = "No response returned from db-sync:"
 
+# how long to wait for db-sync to record a block
+NEW_BLOCK_TIMEOUT = 60
+
+# how long to wait for notification before checking the last block again, in case
+# the notification was missed
+NOTIFY_WAIT_MAX = 5.0
+
+# bounds of the interval for polling db-sync when notifications are not available
+POLL_INTERVAL_MIN = 0.1
+POLL_INTERVAL_MAX = 2.0
+
 
 class MetadataRecord(NamedTuple):
     key: int
@@ -170,6 +184,12 @@ class TxRecord(NamedTuple):
         return metadata
 
 
+class TxCheckResult(NamedTuple):
+    txhash: str
+    record: Optional[TxRecord]
+    error: str = ""
+
+
 class TxPrelimRecord(NamedTuple):
     utxo_out: List[UTxORecord]
     ma_utxo_out: List[UTxORecord]
@@ -187,14 +207,17 @@ def utxodata2txout(utxodata: Union[UTxORecord, clusterlib.UTXOData]) -> clusterl
     )
 
 
-def get_address_reward(address: str, epoch_from: int = 0, epoch_to: int = 99999999) -> RewardRecord:
+def get_address_reward(
+    address: str, epoch_from: int = 0, epoch_to: int = 99999999, stream: bool = False
+) -> RewardRecord:
     """Get reward data for stake address from db-sync.
 
     The `epoch_from` and `epoch_to` are epochs where the reward can be spent.
+    When `stream` is set, the DB records are fetched in batches using server-side cursor.
     """
     rewards = []
     for db_row in dbsync_queries.query_address_reward(
-        address=address, epoch_from=epoch_from, epoch_to=epoch_to
+        address=address, epoch_from=epoch_from, epoch_to=epoch_to, stream=stream
     ):
         rewards.append(
             RewardEpochRecord(
@@ -240,10 +263,13 @@ def check_address_reward(
     return reward
 
 
-def get_utxo(address: str) -> PaymentAddrRecord:
-    """Return UTxO info for payment address from db-sync."""
+def get_utxo(address: str, stream: bool = False) -> PaymentAddrRecord:
+    """Return UTxO info for payment address from db-sync.
+
+    When `stream` is set, the DB records are fetched in batches using server-side cursor.
+    """
     utxos = []
-    for db_row in dbsync_queries.query_utxo(address=address):
+    for db_row in dbsync_queries.query_utxo(address=address, stream=stream):
         utxos.append(
             GetUTxORecord(
                 utxo_hash=db_row.tx_hash.hex(),
@@ -442,10 +468,11 @@ def get_txins(txhash: str) -> List[clusterlib.UTXOData]:
     return txins
 
 
-def get_tx_record(txhash: str) -> TxRecord:  # noqa: C901
-    """Get transaction data from db-sync.
+def get_tx_record_multi_query(txhash: str) -> TxRecord:  # noqa: C901
+    """Get transaction data from db-sync, using separate SQL query for each kind of records.
 
     Compile data from multiple SQL queries to get as much information about the TX as possible.
+    The same data are returned by `get_tx_record`, that needs just a single SQL query.
     """
     # pylint: disable=too-many-branches
     txdata = get_prelim_tx_record(txhash)
@@ -613,8 +640,266 @@ def get_tx_record(txhash: str) -> TxRecord:  # noqa: C901
     return record
 
 
+def _get_coin(asset: Dict[str, Any]) -> str:
+    policyid = asset["policy"] or ""
+    return f"{policyid}.{asset['name']}" if asset["name"] else policyid
+
+
+def _get_spent_utxos(spent_txouts: Optional[List[Dict[str, Any]]]) -> List[clusterlib.UTXOData]:
+    """Get records of spent txouts, with multi-asset records following the Lovelace record."""
+    utxos = []
+    for txout in spent_txouts or ():
+        utxos.append(
+            clusterlib.UTXOData(
+                utxo_hash=txout["tx_hash"],
+                utxo_ix=int(txout["index"]),
+                amount=int(txout["value"]),
+                address=str(txout["address"]),
+            )
+        )
+        utxos.extend(
+            clusterlib.UTXOData(
+                utxo_hash=txout["tx_hash"],
+                utxo_ix=int(txout["index"]),
+                amount=int(asset["quantity"] or 0),
+                address=str(txout["address"]),
+                coin=_get_coin(asset),
+            )
+            for asset in txout.get("assets") or ()
+        )
+    return utxos
+
+
+def _get_txouts(txhash: str, txouts: List[Dict[str, Any]]) -> List[UTxORecord]:
+    """Get records of txouts, Lovelace records first, multi-asset records after them."""
+    utxo_out = [
+        UTxORecord(
+            utxo_hash=txhash,
+            utxo_ix=int(r["index"]),
+            amount=int(r["value"]),
+            address=str(r["address"]),
+            datum_hash=r["data_hash"] or "",
+            inline_datum_hash=r["inline_datum_hash"] or "",
+            reference_script_hash=r["reference_script_hash"] or "",
+        )
+        for r in txouts
+    ]
+    ma_utxo_out = [
+        UTxORecord(
+            utxo_hash=txhash,
+            utxo_ix=int(r["index"]),
+            amount=int(asset["quantity"] or 0),
+            address=str(r["address"]),
+            coin=_get_coin(asset),
+            datum_hash=r["data_hash"] or "",
+        )
+        for r in txouts
+        for asset in r["assets"] or ()
+    ]
+    return [*utxo_out, *ma_utxo_out]
+
+
+def _get_tx_record_from_row(row: dbsync_queries.TxFullDBRow) -> TxRecord:
+    """Get transaction data from the result of a full TX SQL query."""
+    txhash = row.tx_hash.hex()
+    txouts = row.txouts or []
+    # txout index is not meaningful for minted tokens, use index of the first txout
+    mint_utxo_ix = int(txouts[0]["index"]) if txouts else 0
+
+    record = TxRecord(
+        tx_id=int(row.tx_id),
+        tx_hash=txhash,
+        block_id=int(row.block_id),
+        block_index=int(row.block_index),
+        out_sum=int(row.out_sum),
+        fee=int(row.fee),
+        deposit=int(row.deposit),
+        size=int(row.size),
+        invalid_before=int(row.invalid_before) if row.invalid_before else None,
+        invalid_hereafter=int(row.invalid_hereafter) if row.invalid_hereafter else None,
+        txins=_get_spent_utxos(row.txins),
+        txouts=_get_txouts(txhash=txhash, txouts=txouts),
+        mint=[
+            UTxORecord(
+                utxo_hash=txhash,
+                utxo_ix=mint_utxo_ix,
+                amount=int(r["quantity"] or 0),
+                address="",
+                coin=_get_coin(r),
+            )
+            for r in row.mint or ()
+        ],
+        collaterals=_get_spent_utxos(row.collaterals),
+        collateral_outputs=[
+            clusterlib.UTXOData(
+                utxo_hash=txhash,
+                utxo_ix=int(r["index"]),
+                amount=int(r["value"]),
+                address=str(r["address"]),
+            )
+            for r in row.collateral_outputs or ()
+        ],
+        reference_inputs=_get_spent_utxos(row.reference_inputs),
+        scripts=[
+            ScriptRecord(
+                hash=r["hash"],
+                type=str(r["type"]),
+                serialised_size=int(r["serialised_size"]) if r["serialised_size"] else 0,
+            )
+            for r in row.scripts or ()
+        ],
+        redeemers=[
+            RedeemerRecord(
+                unit_mem=int(r["unit_mem"]),
+                unit_steps=int(r["unit_steps"]),
+                fee=int(r["fee"]),
+                purpose=str(r["purpose"]),
+                script_hash=r["script_hash"],
+                value=r["value"],
+            )
+            for r in row.redeemers or ()
+        ],
+        metadata=[
+            MetadataRecord(
+                key=int(r["key"]),
+                json=r["json"],
+                bytes=memoryview(bytes.fromhex(r["bytes"])),
+            )
+            for r in row.metadata or ()
+        ],
+        reserve=[
+            ADAStashRecord(
+                address=str(r["address"]), cert_index=int(r["cert_index"]), amount=int(r["amount"])
+            )
+            for r in row.reserve or ()
+        ],
+        treasury=[
+            ADAStashRecord(
+                address=str(r["address"]), cert_index=int(r["cert_index"]), amount=int(r["amount"])
+            )
+            for r in row.treasury or ()
+        ],
+        pot_transfers=[
+            PotTransferRecord(treasury=int(r["treasury"]), reserves=int(r["reserves"]))
+            for r in row.pot_transfers or ()
+        ],
+        stake_registration=list(row.stake_registration or ()),
+        stake_deregistration=list(row.stake_deregistration or ()),
+        stake_delegation=[
+            DelegationRecord(
+                address=r["address"], pool_id=r["pool_id"], active_epoch_no=r["active_epoch_no"]
+            )
+            for r in row.stake_delegation or ()
+            if (r["address"] and r["pool_id"] and r["active_epoch_no"])
+        ],
+        withdrawals=[
+            clusterlib.TxOut(address=r["address"], amount=int(r["amount"]))
+            for r in row.withdrawals or ()
+        ],
+        extra_key_witness=[
+            ExtraKeyWitnessRecord(tx_hash=r["tx_hash"], witness_hash=r["witness_hash"])
+            for r in row.extra_key_witness or ()
+        ],
+    )
+
+    return record
+
+
+def get_tx_record(txhash: str) -> TxRecord:
+    """Get transaction data from db-sync.
+
+    All the data are retrieved using a single SQL query.
+    """
+    row = dbsync_queries.query_tx_full(txhash=txhash)
+    if row is None:
+        raise RuntimeError("No results were returned by the TX SQL query.")
+
+    return _get_tx_record_from_row(row)
+
+
+def get_tx_records(txhashes: List[str]) -> Dict[str, TxRecord]:
+    """Get data of multiple transactions from db-sync, using a single SQL query.
+
+    Transactions that are not present in db-sync are missing in the returned dict.
+    """
+    if not txhashes:
+        return {}
+
+    records = (_get_tx_record_from_row(r) for r in dbsync_queries.query_txs_full(txhashes=txhashes))
+    return {r.tx_hash: r for r in records}
+
+
+def _wait_for_notification(conn: psycopg2.extensions.connection, timeout: float) -> bool:
+    """Wait for notification about inserted block.
+
+    Return `False` if the notifications are no longer available.
+    """
+    try:
+        if select.select([conn], [], [], timeout)[0]:
+            conn.poll()
+            conn.notifies.clear()
+    except (OSError, psycopg2.Error) as err:
+        LOGGER.warning(f"Failed to receive notification from db-sync: {err}")
+        dbsync_conn.close_block_listener()
+        return False
+    return True
+
+
+def wait_for_block(block_no: int, timeout: float = NEW_BLOCK_TIMEOUT) -> bool:
+    """Wait until db-sync records the block with given number.
+
+    Wake up when db-sync notifies about inserted block. When the notifications are not
+    available, poll db-sync with increasing interval.
+    Return `False` if the block was not recorded before the timeout.
+    """
+    listener = dbsync_conn.block_listener()
+    end_time = time.time() + timeout
+    poll_interval = POLL_INTERVAL_MIN
+
+    while True:
+        last_block = dbsync_queries.query_last_block()
+        if last_block and last_block.block_no >= block_no:
+            return True
+
+        remaining = end_time - time.time()
+        if remaining <= 0:
+            LOGGER.warning(
+                f"Block {block_no} was not recorded in db-sync in {timeout}s, "
+                f"last recorded block: {last_block}."
+            )
+            return False
+
+        if listener is None:
+            time.sleep(min(poll_interval, remaining))
+            poll_interval = min(poll_interval * 2, POLL_INTERVAL_MAX)
+        elif not _wait_for_notification(conn=listener, timeout=min(NOTIFY_WAIT_MAX, remaining)):
+            listener = None
+
+
+def wait_for_next_block(timeout: float = NEW_BLOCK_TIMEOUT) -> bool:
+    """Wait until db-sync records a block newer than the last recorded block."""
+    last_block = dbsync_queries.query_last_block()
+    block_no = last_block.block_no + 1 if last_block else 0
+    return wait_for_block(block_no=block_no, timeout=timeout)
+
+
+def wait_for_sync(cluster_obj: clusterlib.ClusterLib, timeout: float = NEW_BLOCK_TIMEOUT) -> bool:
+    """Wait until db-sync records the block that is the current tip of the node."""
+    tip = cluster_obj.g_query.get_tip()
+    LOGGER.debug(f"Waiting for db-sync to record block {tip.get('block')}, slot {tip.get('slot')}.")
+    return wait_for_block(block_no=int(tip.get("block") or 0), timeout=timeout)
+
+
+def _wait_before_retry(repeat: int, cluster_obj: Optional[clusterlib.ClusterLib]) -> None:
+    """Wait for db-sync to catch up with the node on the first repeat, for new block otherwise."""
+    if repeat == 1 and cluster_obj is not None:
+        wait_for_sync(cluster_obj=cluster_obj)
+    else:
+        wait_for_next_block()
+
+
 def retry_query(query_func: Callable, timeout: int = 20) -> Any:
-    """Wait a bit and retry a query until response is returned.
+    """Retry a query until response is returned, each time db-sync records a new block.
 
     A generic function that can be used by any query/check that raises `AssertionError` with
     `NO_REPONSE_STR` until the expected data is returned.
@@ -624,9 +909,8 @@ def retry_query(query_func: Callable, timeout: int = 20) -> Any:
 
     while True:
         if repeat:
-            sleep_time = 2 + repeat * repeat
-            LOGGER.warning(f"Sleeping {sleep_time}s before repeating query for the {repeat} time.")
-            time.sleep(sleep_time)
+            LOGGER.warning(f"Waiting for new block before repeating query for the {repeat} time.")
+            wait_for_next_block(timeout=max(end_time - time.time(), 1))
         try:
             response = query_func()
             break
@@ -639,10 +923,13 @@ def retry_query(query_func: Callable, timeout: int = 20) -> Any:
     return response
 
 
-def get_tx_record_retry(txhash: str, retry_num: int = 3) -> TxRecord:
+def get_tx_record_retry(
+    txhash: str, retry_num: int = 3, cluster_obj: Optional[clusterlib.ClusterLib] = None
+) -> TxRecord:
     """Retry `get_tx_record` when data is anticipated and are not available yet.
 
-    Under load it might be necessary to wait a bit and retry the query.
+    The query is repeated when db-sync caught up with the node (if `cluster_obj` is passed),
+    and then each time db-sync records a new block.
     """
     retry_num = retry_num if retry_num >= 0 else 0
     response = None
@@ -650,12 +937,11 @@ def get_tx_record_retry(txhash: str, retry_num: int = 3) -> TxRecord:
     # first try + number of retries
     for r in range(1 + retry_num):
         if r > 0:
-            sleep_time = 2 + r * r
             LOGGER.warning(
-                f"Sleeping {sleep_time}s before repeating TX SQL query for '{txhash}' "
+                f"Waiting for db-sync before repeating TX SQL query for '{txhash}' "
                 f"for the {r} time."
             )
-            time.sleep(sleep_time)
+            _wait_before_retry(repeat=r, cluster_obj=cluster_obj)
         try:
             response = get_tx_record(txhash=txhash)
             break
@@ -667,6 +953,35 @@ def get_tx_record_retry(txhash: str, retry_num: int = 3) -> TxRecord:
     return response
 
 
+def get_tx_records_retry(
+    txhashes: List[str], retry_num: int = 3, cluster_obj: Optional[clusterlib.ClusterLib] = None
+) -> Dict[str, TxRecord]:
+    """Retry `get_tx_records` for transactions whose data are not available yet.
+
+    Only the missing transactions are queried again, the same way as in `get_tx_record_retry`.
+    Transactions that are still not present in db-sync after the last retry are missing
+    in the returned dict.
+    """
+    retry_num = retry_num if retry_num >= 0 else 0
+    records: Dict[str, TxRecord] = {}
+    missing = list(dict.fromkeys(txhashes))
+
+    # first try + number of retries
+    for r in range(1 + retry_num):
+        if r > 0:
+            LOGGER.warning(
+                f"Waiting for db-sync before repeating TX SQL query for {len(missing)} TX(s) "
+                f"for the {r} time."
+            )
+            _wait_before_retry(repeat=r, cluster_obj=cluster_obj)
+        records.update(get_tx_records(txhashes=missing))
+        missing = [h for h in missing if h not in records]
+        if not missing:
+            break
+
+    return records
+
+
 def _sum_mint_txouts(txouts: clusterlib.OptionalTxOuts) -> List[clusterlib.TxOut]:
     """Calculate minting amount sum for records with the same token.
 
@@ -829,17 +1144,11 @@ def _txout_has_inline_datum(txout: clusterlib.TxOut) -> bool:
     return False
 
 
-def check_tx(
-    cluster_obj: clusterlib.ClusterLib, tx_raw_output: clusterlib.TxRawOutput, retry_num: int = 3
-) -> Optional[TxRecord]:
-    """Check a transaction in db-sync."""
+def _check_tx_record(
+    cluster_obj: clusterlib.ClusterLib, tx_raw_output: clusterlib.TxRawOutput, response: TxRecord
+) -> None:
+    """Check that transaction data from db-sync match the transaction."""
     # pylint: disable=too-many-statements,too-many-locals
-    if not configuration.HAS_DBSYNC:
-        return None
-
-    txhash = cluster_obj.g_transaction.get_txid(tx_body_file=tx_raw_output.out_file)
-    response = get_tx_record_retry(txhash=txhash, retry_num=retry_num)
-
     tx_txouts = {_sanitize_txout(cluster_obj=cluster_obj, txout=r) for r in tx_raw_output.txouts}
     db_txouts = {utxodata2txout(r) for r in response.txouts}
 
@@ -1060,9 +1369,61 @@ def check_tx(
             f"({tx_raw_output.required_signer_hashes} != {db_required_signer_hashes})"
         )
 
+
+def check_tx(
+    cluster_obj: clusterlib.ClusterLib, tx_raw_output: clusterlib.TxRawOutput, retry_num: int = 3
+) -> Optional[TxRecord]:
+    """Check a transaction in db-sync."""
+    if not configuration.HAS_DBSYNC:
+        return None
+
+    txhash = cluster_obj.g_transaction.get_txid(tx_body_file=tx_raw_output.out_file)
+    response = get_tx_record_retry(txhash=txhash, retry_num=retry_num, cluster_obj=cluster_obj)
+    _check_tx_record(cluster_obj=cluster_obj, tx_raw_output=tx_raw_output, response=response)
     return response
 
 
+def check_txs(
+    cluster_obj: clusterlib.ClusterLib,
+    tx_raw_outputs: List[clusterlib.TxRawOutput],
+    retry_num: int = 3,
+) -> List[TxCheckResult]:
+    """Check multiple transactions in db-sync.
+
+    Data of all the transactions are retrieved using a single SQL query, after db-sync caught up
+    with the current block. The check doesn't stop on the first failure, the result is returned
+    for each transaction.
+    """
+    if not configuration.HAS_DBSYNC:
+        return []
+
+    txhashes = [cluster_obj.g_transaction.get_txid(tx_body_file=t.out_file) for t in tx_raw_outputs]
+    wait_for_sync(cluster_obj=cluster_obj)
+    records = get_tx_records_retry(txhashes=txhashes, retry_num=retry_num)
+
+    results = []
+    for txhash, tx_raw_output in zip(txhashes, tx_raw_outputs):
+        record = records.get(txhash)
+        if record is None:
+            results.append(
+                TxCheckResult(
+                    txhash=txhash,
+                    record=None,
+                    error="No results were returned by the TX SQL query.",
+                )
+            )
+            continue
+
+        error = ""
+        try:
+            _check_tx_record(cluster_obj=cluster_obj, tx_raw_output=tx_raw_output, response=record)
+        except AssertionError as err:
+            error = str(err)
+        results.append(TxCheckResult(txhash=txhash, record=record, error=error))
+
+    return results
+
+
 def check_tx_phase_2_failure(
     cluster_obj: clusterlib.ClusterLib,
     tx_raw_output: clusterlib.TxRawOutput,
@@ -1074,7 +1435,7 @@ def check_tx_phase_2_failure(
         return None
 
     txhash = cluster_obj.g_transaction.get_txid(tx_body_file=tx_raw_output.out_file)
-    response = get_tx_record_retry(txhash=txhash, retry_num=retry_num)
+    response = get_tx_record_retry(txhash=txhash, retry_num=retry_num, cluster_obj=cluster_obj)
 
     # In case of a phase 2 failure, the collateral output becomes the output of the tx.
 
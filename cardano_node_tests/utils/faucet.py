@@ -0,0 +1,285 @@
+"""Funding from faucet addresses that hold a pool of independent UTxOs.
+
+When `FAUCET_UTXOS_COUNT` is set, each test faucet address (`user*` in `addrs_data`) is funded
+with that many UTxOs during cluster setup. A funding transaction spends just one UTxO of
+the pool and returns the change back to the faucet, so the pool size stays the same.
+Each UTxO is locked separately, so several workers can fund from the same faucet address
+at the same time, without waiting for the lock on the whole faucet address.
+
+When `FAUCET_BATCHING` is set, funding requests from faucet addresses without UTxO pool are
+batched. Each worker writes its request to a dir in the pytest root tmp dir, shared by all
+workers of the run, and waits for the lock on the faucet address. The worker that gets the lock
+sends a single transaction that funds all the pending requests, and leaves the result for
+the other workers. A worker that gets the lock after its request was already processed just
+picks up the result.
+"""
+import logging
+import pickle
+import random
+import shutil
+import time
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from cardano_clusterlib import clusterlib
+
+from cardano_node_tests.utils import helpers
+from cardano_node_tests.utils import locking
+from cardano_node_tests.utils import temptools
+from cardano_node_tests.utils.types import FileType
+
+LOGGER = logging.getLogger(__name__)
+
+# key in `addrs_data` records of faucet addresses that hold a pool of UTxOs
+POOL_SIZE_KEY = "pool_size"
+
+# the claimed UTxO needs to cover also the tx fee and the change output
+FEE_RESERVE = 10_000_000
+
+# how long to wait for a UTxO that is not used by other worker
+CLAIM_TIMEOUT_SEC = 600
+
+FUNDING_BATCHES_DIR = ".funding_batches"
+
+# how long to wait for more funding requests before sending the batch transaction, when other
+# requests are already pending
+BATCH_WINDOW_SEC = 1.0
+
+# pytest root tmp dir of the current run, see `set_batches_root`
+_BATCHES_ROOT: List[Path] = []
+
+
+def fund_utxo_pool(
+    *dst_addrs: clusterlib.AddressRecord,
+    cluster_obj: clusterlib.ClusterLib,
+    faucet_data: dict,
+    amount: int,
+    num_utxos: int,
+    tx_name: Optional[str] = None,
+    destination_dir: FileType = ".",
+) -> clusterlib.TxRawOutput:
+    """Send `amount` from faucet addr to all `dst_addrs`, split into `num_utxos` UTxOs each."""
+    utxo_amount = amount // num_utxos
+    txouts = [
+        clusterlib.TxOut(address=d.address, amount=utxo_amount)
+        for d in dst_addrs
+        for __ in range(num_utxos)
+    ]
+    tx_files = clusterlib.TxFiles(signing_key_files=[faucet_data["payment"].skey_file])
+
+    tx_raw_output = cluster_obj.g_transaction.send_tx(
+        src_address=faucet_data["payment"].address,
+        tx_name=f"{tx_name or 'faucet_pool'}_funding",
+        txouts=txouts,
+        tx_files=tx_files,
+        join_txouts=False,
+        destination_dir=destination_dir,
+    )
+    return tx_raw_output
+
+
+def _get_lock_file(utxo: clusterlib.UTXOData) -> str:
+    return f"{temptools.get_basetemp()}/{utxo.address}_{utxo.utxo_hash}_{utxo.utxo_ix}.lock"
+
+
+def send_from_pool(
+    cluster_obj: clusterlib.ClusterLib,
+    faucet_data: dict,
+    destinations: List[clusterlib.TxOut],
+    tx_name: str,
+    destination_dir: FileType = ".",
+) -> clusterlib.TxRawOutput:
+    """Send funds from a single UTxO of the faucet's UTxO pool.
+
+    Wait until there is a UTxO that is big enough and is not used by other worker.
+    """
+    src_address = faucet_data["payment"].address
+    tx_files = clusterlib.TxFiles(signing_key_files=[faucet_data["payment"].skey_file])
+    min_amount = sum(d.amount for d in destinations) + FEE_RESERVE
+
+    end_time = time.time() + CLAIM_TIMEOUT_SEC
+    while time.time() < end_time:
+        utxos = [
+            u
+            for u in cluster_obj.g_query.get_utxo(address=src_address)
+            if u.coin == clusterlib.DEFAULT_COIN and u.amount >= min_amount
+        ]
+        if not utxos:
+            raise RuntimeError(f"No faucet UTxO with at least {min_amount} Lovelace available.")
+
+        random.shuffle(utxos)
+        for utxo in utxos:
+            with locking.try_lock_if_xdist(_get_lock_file(utxo)) as locked:
+                if not locked:
+                    continue
+                # the UTxO might have been spent after it was queried
+                if not cluster_obj.g_query.get_utxo(utxo=utxo):
+                    continue
+                return cluster_obj.g_transaction.send_tx(
+                    src_address=src_address,
+                    tx_name=tx_name,
+                    txins=[utxo],
+                    txouts=destinations,
+                    tx_files=tx_files,
+                    destination_dir=destination_dir,
+                )
+
+        # all suitable UTxOs are used by other workers
+        time.sleep(1)
+
+    raise RuntimeError(f"Failed to claim faucet UTxO in {CLAIM_TIMEOUT_SEC} sec.")
+
+
+def get_balances(cluster_obj: clusterlib.ClusterLib, addresses: List[str]) -> Dict[str, int]:
+    """Return Lovelace balances of `addresses`, using a single query."""
+    balances = dict.fromkeys(addresses, 0)
+    for utxo in cluster_obj.g_query.get_utxo(address=list(set(addresses))):
+        if utxo.coin == clusterlib.DEFAULT_COIN:
+            balances[utxo.address] += utxo.amount
+    return balances
+
+
+def set_batches_root(pytest_root_tmp: Path) -> None:
+    """Set the dir shared by all workers of the current pytest run for funding batches.
+
+    Must be called at the start of the session, before any batched funding.
+    """
+    _BATCHES_ROOT[:] = [pytest_root_tmp]
+
+
+def is_batching_enabled() -> bool:
+    """Check if funding requests can be batched in the current process.
+
+    Batching needs the dir shared by all workers of the pytest run. It is not available e.g. in
+    the standby respin process, which then funds its requests one by one.
+    """
+    return bool(_BATCHES_ROOT)
+
+
+def _get_batches_root() -> Path:
+    if not _BATCHES_ROOT:
+        raise RuntimeError("The dir for funding batches was not set.")
+    return _BATCHES_ROOT[0]
+
+
+def _get_batch_dir(src_address: str) -> Path:
+    batch_dir = _get_batches_root() / FUNDING_BATCHES_DIR / src_address
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    return batch_dir
+
+
+def _write_pickle(obj: object, out_file: Path) -> None:
+    """Write the file atomically, so other workers never see partial content."""
+    tmp_file = out_file.with_suffix(".tmp")
+    with open(tmp_file, "wb") as out_data:
+        pickle.dump(obj, out_data)
+    tmp_file.rename(out_file)
+
+
+def _read_pickle(in_file: Path) -> Any:
+    with open(in_file, "rb") as in_data:
+        return pickle.load(in_data)
+
+
+def _process_batch(
+    cluster_obj: clusterlib.ClusterLib,
+    faucet_data: dict,
+    batch_dir: Path,
+    tx_name: str,
+    destination_dir: FileType,
+) -> None:
+    """Fund all pending requests with a single transaction and store the results.
+
+    Must be called under the lock on the faucet address.
+    """
+    req_files = sorted(batch_dir.glob("*.request"))
+
+    # Other workers are funding from the same faucet address. Wait a moment, so more requests
+    # can join the batch. Not needed when this is the only request.
+    if len(req_files) > 1:
+        time.sleep(BATCH_WINDOW_SEC)
+        req_files = sorted(batch_dir.glob("*.request"))
+
+    requests: Dict[Path, List[clusterlib.TxOut]] = {f: _read_pickle(f) for f in req_files}
+    if not requests:
+        return
+
+    tx_files = clusterlib.TxFiles(signing_key_files=[faucet_data["payment"].skey_file])
+
+    def _send(destinations: List[clusterlib.TxOut], name: str) -> clusterlib.TxRawOutput:
+        return cluster_obj.g_transaction.send_funds(
+            src_address=faucet_data["payment"].address,
+            destinations=destinations,
+            tx_name=name,
+            tx_files=tx_files,
+            destination_dir=destination_dir,
+        )
+
+    results: Dict[Path, object] = {}
+    try:
+        all_destinations = [d for dst in requests.values() for d in dst]
+        tx_raw_output = _send(destinations=all_destinations, name=f"{tx_name}_batch")
+        # other workers can have different CWD
+        tx_raw_output = tx_raw_output._replace(out_file=Path(tx_raw_output.out_file).resolve())
+        results = dict.fromkeys(requests, tx_raw_output)
+        LOGGER.info(f"Funded {len(requests)} request(s) with a single transaction.")
+    except Exception as err:
+        # don't let single invalid request fail the whole batch
+        LOGGER.warning(f"Failed to fund the batch, funding requests one by one: {err}")
+        for idx, (req_file, destinations) in enumerate(requests.items()):
+            try:
+                req_output = _send(destinations=destinations, name=f"{tx_name}_single{idx}")
+                results[req_file] = req_output._replace(
+                    out_file=Path(req_output.out_file).resolve()
+                )
+            except Exception as req_err:
+                results[req_file] = req_err
+
+    for req_file, result in results.items():
+        _write_pickle(obj=result, out_file=req_file.with_suffix(".result"))
+        req_file.unlink()
+
+
+def send_batched(
+    cluster_obj: clusterlib.ClusterLib,
+    faucet_data: dict,
+    destinations: List[clusterlib.TxOut],
+    tx_name: str,
+    destination_dir: FileType = ".",
+) -> clusterlib.TxRawOutput:
+    """Send funds in a transaction that can be shared with funding requests of other workers.
+
+    The returned transaction output is a view of the shared transaction for this request. It
+    contains just the `destinations` of this request, and refers to a copy of the tx body file
+    in `destination_dir`. The `txouts_count` and `fee` still describe the whole transaction,
+    so the output can be used e.g. for querying UTxOs of the transaction.
+    """
+    src_address = faucet_data["payment"].address
+    batch_dir = _get_batch_dir(src_address)
+    req_file = batch_dir / f"{helpers.get_rand_str(8)}.request"
+    result_file = req_file.with_suffix(".result")
+    _write_pickle(obj=destinations, out_file=req_file)
+
+    with locking.FileLockIfXdist(f"{_get_batches_root()}/{src_address}.lock"):
+        # the request was not processed by other worker yet
+        if not result_file.exists():
+            _process_batch(
+                cluster_obj=cluster_obj,
+                faucet_data=faucet_data,
+                batch_dir=batch_dir,
+                tx_name=tx_name,
+                destination_dir=destination_dir,
+            )
+
+    result = _read_pickle(result_file)
+    result_file.unlink()
+    if isinstance(result, Exception):
+        raise result
+    assert isinstance(result, clusterlib.TxRawOutput)
+
+    out_file = Path(destination_dir) / f"{tx_name}_tx.body"
+    shutil.copyfile(result.out_file, out_file)
+    return result._replace(txouts=destinations, out_file=out_file)
@@ -27,6 +27,7 @@ from typing import Optional
 from typing import TypeVar
 from typing import Union
 
+from cardano_node_tests.utils import bech32 as bech32_codec
 from cardano_node_tests.utils.types import FileType
 
 
@@ -228,12 +229,22 @@ def write_json(location: FileType, content: dict) -> FileType:
 
 def decode_bech32(bech32: str) -> str:
     """Convert from bech32 string."""
-    return run_command(f"echo '{bech32}' | bech32", shell=True).decode().strip()
+    return bech32_codec.decode(bech32)
 
 
 def encode_bech32(prefix: str, data: str) -> str:
     """Convert to bech32 string."""
-    return run_command(f"echo '{data}' | bech32 {prefix}", shell=True).decode().strip()
+    return bech32_codec.encode(prefix, data)
+
+
+def decode_bech32_bulk(bech32_strings: Iterable[str]) -> List[str]:
+    """Convert multiple bech32 strings at once."""
+    return [bech32_codec.decode(b) for b in bech32_strings]
+
+
+def encode_bech32_bulk(prefix: str, data: Iterable[str]) -> List[str]:
+    """Convert multiple values to bech32 strings with the same prefix at once."""
+    return [bech32_codec.encode(prefix, d) for d in data]
 
 
 def check_dir_arg(dir_path: str) -> Optional[Path]:
@@ -0,0 +1,179 @@
+"""Filtering of large JSON documents without loading them whole into memory.
+
+The document is read from a stream in chunks. Members of objects that are not needed are skipped
+without being parsed, and the rest is copied to the output as-is.
+"""
+import json
+import re
+from typing import IO
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+CHUNK_SIZE = 1024 * 1024
+
+_STRUCT_RE = re.compile(r'["\\{}\[\]]')
+_SCALAR_END_RE = re.compile(r"[,}\]\s]")
+_WHITESPACE = " \t\n\r"
+
+
+class _Reader:
+    """Read JSON text from a stream."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        self.stream = stream
+        self.buf = ""
+        self.pos = 0
+
+    def _fill(self) -> bool:
+        """Read next chunk into the buffer, dropping the part of buffer that was already read."""
+        chunk = self.stream.read(CHUNK_SIZE)
+        if not chunk:
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return next non-whitespace character, or empty string at the end of the stream."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self.pos} of the current chunk.")
+        self.pos += 1
+
+    def read_value(self, out: Optional[List[str]]) -> None:
+        """Read next JSON value and append its text to `out` (skip the value if `out` is None)."""
+        char = self.peek()
+        if not char:
+            raise ValueError("Unexpected end of JSON document.")
+
+        if char in '"{[':
+            self._read_structured(out=out)
+        else:
+            self._read_scalar(out=out)
+
+    def _read_more(self, seg_start: int, end: int, out: Optional[List[str]]) -> None:
+        """Save the part of value that was read so far and read next chunk of data."""
+        if out is not None:
+            out.append(self.buf[seg_start:end])
+        self.pos = end
+        if not self._fill():
+            raise ValueError("Unexpected end of JSON document.")
+
+    def _read_structured(self, out: Optional[List[str]]) -> None:
+        """Read string, object or array."""
+        depth = 0
+        in_string = False
+        seg_start = search_pos = self.pos
+        while True:
+            match = _STRUCT_RE.search(self.buf, search_pos)
+            # need more data; the character after backslash must be in the buffer as well
+            if not match or (match.group() == "\\" and match.end() == len(self.buf)):
+                self._read_more(
+                    seg_start=seg_start, end=match.start() if match else len(self.buf), out=out
+                )
+                seg_start = search_pos = 0
+                continue
+
+            struct_char = match.group()
+            search_pos = match.end()
+            if in_string:
+                if struct_char == "\\":
+                    # skip the escaped character
+                    search_pos += 1
+                elif struct_char == '"':
+                    in_string = False
+            elif struct_char == '"':
+                in_string = True
+            else:
+                depth += 1 if struct_char in "{[" else -1
+
+            if not in_string and depth == 0:
+                break
+
+        if out is not None:
+            out.append(self.buf[seg_start:search_pos])
+        self.pos = search_pos
+
+    def _read_scalar(self, out: Optional[List[str]]) -> None:
+        pieces = []
+        while True:
+            match = _SCALAR_END_RE.search(self.buf, self.pos)
+            if match:
+                pieces.append(self.buf[self.pos : match.start()])
+                self.pos = match.start()
+                break
+            pieces.append(self.buf[self.pos :])
+            self.pos = len(self.buf)
+            if not self._fill():
+                break
+        if out is not None:
+            out.append("".join(pieces))
+
+    def read_key(self) -> str:
+        pieces: List[str] = []
+        self.read_value(out=pieces)
+        key: str = json.loads("".join(pieces))
+        self.expect(":")
+        return key
+
+
+def _filter_value(
+    reader: _Reader,
+    path: Tuple[str, ...],
+    drop_paths: Set[Tuple[str, ...]],
+    out: List[str],
+) -> None:
+    # copy the value as-is if nothing needs to be dropped from it
+    if not any(p[: len(path)] == path for p in drop_paths) or reader.peek() != "{":
+        reader.read_value(out=out)
+        return
+
+    reader.expect("{")
+    out.append("{")
+    first_in = first_out = True
+    while reader.peek() != "}":
+        if not first_in:
+            reader.expect(",")
+        first_in = False
+        key = reader.read_key()
+        child_path = (*path, key)
+
+        if child_path in drop_paths:
+            reader.read_value(out=None)
+            continue
+
+        if not first_out:
+            out.append(",")
+        first_out = False
+        out.append(f"{json.dumps(key)}:")
+        _filter_value(reader=reader, path=child_path, drop_paths=drop_paths, out=out)
+    reader.expect("}")
+    out.append("}")
+
+
+def filter_json(stream: IO[str], drop_paths: Iterable[Tuple[str, ...]]) -> str:
+    """Return JSON text read from the stream, without object members on `drop_paths`.
+
+    Args:
+        stream: A text stream with JSON document.
+        drop_paths: Paths (tuples of keys) of object members that will be dropped,
+            e.g. `[("stateBefore", "esLState")]`.
+    """
+    reader = _Reader(stream)
+    if not reader.peek():
+        return ""
+
+    out: List[str] = []
+    _filter_value(reader=reader, path=(), drop_paths=set(drop_paths), out=out)
+    return "".join(out)
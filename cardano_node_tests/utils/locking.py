@@ -1,6 +1,7 @@
 import contextlib
 import logging
 from typing import Any
+from typing import Iterator
 
 from cardano_node_tests.utils import configuration
 
@@ -10,6 +11,7 @@ from cardano_node_tests.utils import configuration
 # need to be locked to single worker (otherwise e.g. balances would not check).
 if configuration.IS_XDIST:
     from filelock import FileLock
+    from filelock import Timeout
 
     # suppress messages from filelock
     logging.getLogger("filelock").setLevel(logging.WARNING)
@@ -17,3 +19,26 @@ if configuration.IS_XDIST:
     FileLockIfXdist: Any = FileLock
 else:
     FileLockIfXdist = contextlib.nullcontext
+
+
+@contextlib.contextmanager
+def try_lock_if_xdist(lock_file: str) -> Iterator[bool]:
+    """Try to acquire the lock without waiting.
+
+    Yield True when the lock was acquired, False when it is held by other worker.
+    """
+    if not configuration.IS_XDIST:
+        yield True
+        return
+
+    lock = FileLockIfXdist(lock_file, timeout=0)
+    try:
+        lock.acquire()
+    except Timeout:
+        yield False
+        return
+
+    try:
+        yield True
+    finally:
+        lock.release()
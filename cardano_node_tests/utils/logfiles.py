@@ -1,15 +1,19 @@
 # pylint: disable=abstract-class-instantiated
 import contextlib
 import fnmatch
+import functools
 import itertools
 import logging
 import os
 import re
 import time
 from pathlib import Path
+from typing import BinaryIO
 from typing import Iterator
 from typing import List
 from typing import NamedTuple
+from typing import Optional
+from typing import Pattern
 from typing import Tuple
 
 from cardano_node_tests.utils import cluster_nodes
@@ -21,6 +25,8 @@ LOGGER = logging.getLogger(__name__)
 
 ROTATED_RE = re.compile(r".+\.[0-9]+")  # detect rotated log file
 ERRORS_RE = re.compile(":error:|failed|failure", re.IGNORECASE)
+# lowercase substrings, one of them is present in every match of `ERRORS_RE`
+ERRORS_KEYWORDS = (b":error:", b"fail")
 ERRORS_IGNORED = [
     "Connection Attempt Exception",
     "EKGServerStartupError",
@@ -60,6 +66,9 @@ ERRORS_LOOK_BACK_MAP = {
 }
 ERRORS_LOOK_BACK_RE = re.compile("|".join(ERRORS_LOOK_BACK_MAP.keys()))
 
+# size of log file chunks that are searched for errors at once
+SEARCH_CHUNK_SIZE = 16 * 1024 * 1024
+
 
 class RotableLog(NamedTuple):
     logfile: Path
@@ -123,16 +132,36 @@ def _get_ignore_rules(cluster_env: cluster_nodes.ClusterEnv) -> List[Tuple[str,
 
     with locking.FileLockIfXdist(lock_file):
         for rules_file in cluster_env.state_dir.glob(f"{ERRORS_IGNORE_FILE_NAME}_*"):
-            with open(rules_file, encoding="utf-8") as infile:
-                for line in infile:
-                    if ";;" not in line:
-                        continue
-                    files_glob, regex = line.split(";;")
-                    rules.append((files_glob, regex.rstrip("\n")))
+            stat = rules_file.stat()
+            rules.extend(
+                _read_rules_file(
+                    rules_file=rules_file, mtime_ns=stat.st_mtime_ns, size=stat.st_size
+                )
+            )
 
     return rules
 
 
+@functools.lru_cache(maxsize=256)
+def _read_rules_file(
+    rules_file: Path, mtime_ns: int, size: int  # noqa: ARG001
+) -> Tuple[Tuple[str, str], ...]:
+    """Read ignore rules from the file.
+
+    The file modification time and size are part of the cache key, so the rules are read again
+    only when the file changes.
+    """
+    # pylint: disable=unused-argument
+    rules = []
+    with open(rules_file, encoding="utf-8") as infile:
+        for line in infile:
+            if ";;" not in line:
+                continue
+            files_glob, regex = line.split(";;")
+            rules.append((files_glob, regex.rstrip("\n")))
+    return tuple(rules)
+
+
 def _get_seek(fpath: Path) -> int:
     with open(fpath, encoding="utf-8") as infile:
         return int(infile.readline().strip())
@@ -147,7 +176,79 @@ def _get_ignore_regex(
         files_glob, regex = record
         if fnmatch.filter([logfile.name], files_glob):
             regex_set.add(regex)
-    return "|".join(regex_set)
+    # sorted, so the same set of rules results in the same (cached) compiled regex
+    return "|".join(sorted(regex_set))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_regex(regex: str) -> Pattern[str]:
+    return re.compile(regex)
+
+
+def _get_look_back_start(data: bytes, line_start: int) -> int:
+    """Return offset of the lines that precede the line starting at `line_start`."""
+    look_back_start = line_start
+    for __ in range(ERRORS_LOOK_BACK_LINES - 1):
+        if look_back_start == 0:
+            break
+        look_back_start = data.rfind(b"\n", 0, look_back_start - 1) + 1
+    return look_back_start
+
+
+def _iter_candidate_lines(data: bytes, start: int) -> Iterator[Tuple[int, int]]:
+    """Return start and end offsets of lines that can contain an error.
+
+    Searching for literal substrings in lowercased data is much faster than searching
+    for case-insensitive regex, so the regex is used only on the candidate lines.
+    """
+    data_lower = data.lower()
+    next_pos = {kw: data_lower.find(kw, start) for kw in ERRORS_KEYWORDS}
+    while True:
+        found = [p for p in next_pos.values() if p != -1]
+        if not found:
+            return
+
+        match_pos = min(found)
+        line_start = data_lower.rfind(b"\n", 0, match_pos) + 1
+        line_end = data_lower.find(b"\n", match_pos)
+        line_end = len(data_lower) if line_end == -1 else line_end + 1
+        yield line_start, line_end
+
+        for kw, pos in next_pos.items():
+            if pos != -1 and pos < line_end:
+                next_pos[kw] = data_lower.find(kw, line_end)
+
+
+def _search_data(data: bytes, start: int, errors_ignored_re: Optional[Pattern[str]]) -> List[str]:
+    """Return lines with errors, searching the data from `start`.
+
+    Lines before `start` serve only as a context for looking back.
+    """
+    errors = []
+    for line_start, line_end in _iter_candidate_lines(data=data, start=start):
+        line = data[line_start:line_end].decode("utf-8", errors="replace")
+        if not ERRORS_RE.search(line) or (errors_ignored_re and errors_ignored_re.search(line)):
+            continue
+        # skip if expected message is in the look back buffer
+        if ERRORS_LOOK_BACK_RE.search(line):
+            look_back_start = _get_look_back_start(data=data, line_start=line_start)
+            look_back_lines = data[look_back_start:line_start].decode("utf-8", errors="replace")
+            if _look_back_found([*look_back_lines.splitlines(keepends=True), line]):
+                continue
+        errors.append(line)
+
+    return errors
+
+
+def _iter_chunks(infile: BinaryIO) -> Iterator[bytes]:
+    """Read the file in chunks that end on line boundary."""
+    while True:
+        chunk = infile.read(SEARCH_CHUNK_SIZE)
+        if not chunk:
+            return
+        if not chunk.endswith(b"\n"):
+            chunk += infile.readline()
+        yield chunk
 
 
 def add_ignore_rule(files_glob: str, regex: str, ignore_file_id: str) -> None:
@@ -228,7 +329,7 @@ def search_cluster_logs() -> List[Tuple[Path, str]]:
     with locking.FileLockIfXdist(lock_file):
         ignore_rules = _get_ignore_rules(cluster_env=cluster_env)
 
-        errors = []
+        errors: List[Tuple[Path, str]] = []
         for logfile in cluster_env.state_dir.glob("*.std*"):
             # skip if the log file is status file or rotated log
             if logfile.name.endswith(".offset") or ROTATED_RE.match(logfile.name):
@@ -246,33 +347,34 @@ def search_cluster_logs() -> List[Tuple[Path, str]]:
             errors_ignored = _get_ignore_regex(
                 ignore_rules=ignore_rules, regexes=ERRORS_IGNORED, logfile=logfile
             )
-            errors_ignored_re = re.compile(errors_ignored)
+            errors_ignored_re = _compile_regex(errors_ignored) if errors_ignored else None
 
             # record offset for the "live" log file
             with open(offset_file, "w", encoding="utf-8") as outfile:
                 outfile.write(str(helpers.get_eof_offset(logfile)))
 
             for logfile_rec in _get_rotated_logs(logfile=logfile, seek=seek, timestamp=timestamp):
-                look_back_buf = [""] * ERRORS_LOOK_BACK_LINES
-                with open(logfile_rec.logfile, encoding="utf-8") as infile:
+                with open(logfile_rec.logfile, "rb") as infile:
                     if seek > 0:
                         # seek to the byte that comes right before the recorded offset
                         infile.seek(seek - 1)
                         # check if the byte is a newline, which means that the offset starts at
                         # the beginning of a line
-                        if infile.read(1) != "\n":
+                        if infile.read(1) != b"\n":
                             # skip the first line if the line is not complete
                             infile.readline()
-                    for line in infile:
-                        look_back_buf.append(line)
-                        look_back_buf.pop(0)
-                        if ERRORS_RE.search(line) and not (
-                            errors_ignored and errors_ignored_re.search(line)
-                        ):
-                            # skip if expected message is in the look back buffer
-                            if ERRORS_LOOK_BACK_RE.search(line) and _look_back_found(look_back_buf):
-                                continue
-                            errors.append((logfile, line))
+
+                    # lines from the end of previous chunk, for looking back
+                    context = b""
+                    for chunk in _iter_chunks(infile):
+                        data = context + chunk
+                        errors.extend(
+                            (logfile, line)
+                            for line in _search_data(
+                                data=data, start=len(context), errors_ignored_re=errors_ignored_re
+                            )
+                        )
+                        context = data[_get_look_back_start(data=data, line_start=len(data)) :]
 
     return errors
 
@@ -0,0 +1,144 @@
+"""Client for the XML-RPC interface of supervisord that manages cluster services.
+
+Talking to supervisord directly is much cheaper than running `supervisorctl` in a subprocess.
+"""
+import http.client
+import logging
+import threading
+import time
+import xmlrpc.client
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+# timeout for a single RPC call
+RPC_TIMEOUT = 30
+
+# how long the status of services is reused
+STATUS_CACHE_TTL = 1.0
+
+# supervisord fault codes, see `supervisor.xmlrpc.Faults`
+FAULT_ALREADY_STARTED = 60
+FAULT_NOT_RUNNING = 70
+FAULT_SUCCESS = 80
+
+
+class _TimeoutTransport(xmlrpc.client.Transport):
+    """Transport with timeout. The HTTP connection is kept open and reused between calls."""
+
+    def make_connection(self, host: Any) -> http.client.HTTPConnection:
+        conn = super().make_connection(host)
+        conn.timeout = RPC_TIMEOUT
+        return conn
+
+
+_PROXIES: Dict[int, xmlrpc.client.ServerProxy] = {}
+# the kept-alive HTTP connection of a proxy cannot be used by multiple threads at once
+_PROXIES_LOCK = threading.Lock()
+_STATUS_CACHE: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}
+
+
+def _get_proxy(port: int) -> xmlrpc.client.ServerProxy:
+    proxy = _PROXIES.get(port)
+    if proxy is None:
+        proxy = xmlrpc.client.ServerProxy(
+            f"http://127.0.0.1:{port}/RPC2", transport=_TimeoutTransport()
+        )
+        _PROXIES[port] = proxy
+    return proxy
+
+
+def _call(port: int, method: str, *args: Any) -> Any:
+    """Call supervisord RPC method.
+
+    The call is retried once on a new connection, as the kept-alive connection might have been
+    closed, e.g. when supervisord was restarted. Calls from multiple threads are serialized.
+    """
+    with _PROXIES_LOCK:
+        for i in range(2):
+            try:
+                return getattr(_get_proxy(port).supervisor, method)(*args)
+            except (OSError, http.client.HTTPException):
+                _PROXIES.pop(port, None)
+                if i > 0:
+                    raise
+    raise AssertionError("Unreachable")
+
+
+def invalidate_cache(port: int) -> None:
+    _STATUS_CACHE.pop(port, None)
+
+
+def get_all_process_info(port: int, use_cache: bool = True) -> List[Dict[str, Any]]:
+    """Return info about all processes managed by supervisord.
+
+    The result is cached for `STATUS_CACHE_TTL` seconds.
+    """
+    now = time.monotonic()
+    cached = _STATUS_CACHE.get(port)
+    if use_cache and cached and now - cached[0] < STATUS_CACHE_TTL:
+        return cached[1]
+
+    infos: List[Dict[str, Any]] = _call(port, "getAllProcessInfo")
+    _STATUS_CACHE[port] = (now, infos)
+    return infos
+
+
+def get_full_name(info: Dict[str, Any]) -> str:
+    """Return name of the process in the same format as `supervisorctl status`."""
+    if info["group"] == info["name"]:
+        return str(info["name"])
+    return f"{info['group']}:{info['name']}"
+
+
+def _run_action(port: int, method: str, args: Tuple[str, ...], ignored_fault: int) -> None:
+    """Run start or stop action, ignoring the fault when nothing needs to be done."""
+    try:
+        result = _call(port, method, *args)
+    except xmlrpc.client.Fault as err:
+        if err.faultCode != ignored_fault:
+            raise
+        return
+
+    # group actions return result for each process
+    if isinstance(result, list):
+        failed = [r for r in result if r["status"] not in (FAULT_SUCCESS, ignored_fault)]
+        if failed:
+            raise xmlrpc.client.Fault(failed[0]["status"], str(failed))
+
+
+def service_action(port: int, service_name: str, action: str) -> None:
+    """Start, stop or restart service, the same way as `supervisorctl <action> <service_name>`.
+
+    Service name can be process name, group name followed by colon (e.g. "nodes:"),
+    or "all".
+    """
+    if action not in ("start", "stop", "restart"):
+        raise ValueError(f"Unsupported action `{action}`.")
+
+    args: Tuple[str, ...]
+    if service_name == "all":
+        method_suffix, args = "AllProcesses", ()
+    elif service_name.endswith(":"):
+        method_suffix, args = "ProcessGroup", (service_name[:-1],)
+    else:
+        method_suffix, args = "Process", (service_name,)
+
+    invalidate_cache(port)
+    try:
+        if action in ("stop", "restart"):
+            _run_action(
+                port=port, method=f"stop{method_suffix}", args=args, ignored_fault=FAULT_NOT_RUNNING
+            )
+        if action in ("start", "restart"):
+            _run_action(
+                port=port,
+                method=f"start{method_suffix}",
+                args=args,
+                ignored_fault=FAULT_ALREADY_STARTED,
+            )
+    finally:
+        invalidate_cache(port)
@@ -0,0 +1,117 @@
+import pytest
+
+from cardano_node_tests.utils import bech32
+from cardano_node_tests.utils import helpers
+
+# valid bech32 strings from BIP-173, with decoded data
+BIP173_VALID = (
+    ("A12UEL5L", ""),
+    ("a12uel5l", ""),
+    (
+        "an83characterlonghumanreadablepartthatcontainsthenumber1andtheexcludedcharactersbio1tt5tgs",
+        "",
+    ),
+    ("abcdef1qpzry9x8gf2tvdw0s3jn54khce6mua7lmqqqxw", "00443214c74254b635cf84653a56d7c675be77df"),
+    (f"11{'q' * 82}c8247j", "00" * 51),
+    (
+        "split1checkupstagehandshakeupstreamerranterredcaperred2y9e3w",
+        "c5f38b70305f519bf66d85fb6cf03058f3dde463ecd7918f2dc743918f2d",
+    ),
+    ("?1ezyfcl", ""),
+)
+
+# invalid bech32 strings from BIP-173 (the one exceeding the overall length limit of 90 characters
+# is not included, as the limit is not applied to Cardano addresses)
+BIP173_INVALID = (
+    "\x7f1axkwrx",
+    "\x801eym55h",
+    "pzry9x0s0muk",
+    "1pzry9x0s0muk",
+    "x1b4n0q5v",
+    "li1dgmt3",
+    "de1lg7wt\xff",
+    "A1G7SGD8",
+    "10a06t8",
+    "1qzzfhee",
+)
+
+PAYMENT_KEY_HASH = "9493315cd92eb5d8c4304e67b7e16ae36d61d34502694657811a2c8e"
+STAKE_KEY_HASH = "337b62cfff6403a06a3acbc34f8c46003c69fe79a3628cefa9c47251"
+
+# Cardano bech32 strings with CIP-5 prefixes, from CIP-19 and Cardano documentation
+CIP5_VECTORS = (
+    (
+        "addr",
+        f"01{PAYMENT_KEY_HASH}{STAKE_KEY_HASH}",
+        "addr1qx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3n0d3vllmyqwsx5wktcd8cc3sq835lu7drv2x"
+        "wl2wywfgse35a3x",
+    ),
+    (
+        "addr_test",
+        f"00{PAYMENT_KEY_HASH}{STAKE_KEY_HASH}",
+        "addr_test1qz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzer3n0d3vllmyqwsx5wktcd8cc3sq835lu7d"
+        "rv2xwl2wywfgs68faae",
+    ),
+    ("addr", f"61{PAYMENT_KEY_HASH}", "addr1vx2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzers66hrl8"),
+    (
+        "addr_test",
+        f"60{PAYMENT_KEY_HASH}",
+        "addr_test1vz2fxv2umyhttkxyxp8x0dlpdt3k6cwng5pxj3jhsydzerspjrlsz",
+    ),
+    ("stake", f"e1{STAKE_KEY_HASH}", "stake1uyehkck0lajq8gr28t9uxnuvgcqrc6070x3k9r8048z8y5gh6ffgw"),
+    (
+        "stake_test",
+        f"e0{STAKE_KEY_HASH}",
+        "stake_test1uqehkck0lajq8gr28t9uxnuvgcqrc6070x3k9r8048z8y5gssrtvn",
+    ),
+    (
+        "pool",
+        "0f292fcaa02b8b2f9b3c8f9fd8e0bb21abedb692a6d5058df3ef2735",
+        "pool1pu5jlj4q9w9jlxeu370a3c9myx47md5j5m2str0naunn2q3lkdy",
+    ),
+)
+
+
+@pytest.mark.parametrize(("bech32_str", "data"), BIP173_VALID)
+def test_bip173_valid(bech32_str: str, data: str):
+    assert bech32.decode(bech32_str) == data
+
+    prefix = bech32_str[: bech32_str.rfind("1")]
+    assert bech32.encode(prefix, data) == bech32_str.lower()
+
+
+@pytest.mark.parametrize("bech32_str", BIP173_INVALID)
+def test_bip173_invalid(bech32_str: str):
+    with pytest.raises(ValueError, match="Invalid|Mixed case"):
+        bech32.decode(bech32_str)
+
+
+@pytest.mark.parametrize(("prefix", "data", "bech32_str"), CIP5_VECTORS)
+def test_cip5(prefix: str, data: str, bech32_str: str):
+    assert helpers.encode_bech32(prefix=prefix, data=data) == bech32_str
+    assert helpers.decode_bech32(bech32=bech32_str) == data
+
+
+def test_cip5_bulk():
+    assert helpers.encode_bech32_bulk(
+        prefix="pool", data=[v[1] for v in CIP5_VECTORS if v[0] == "pool"]
+    ) == [v[2] for v in CIP5_VECTORS if v[0] == "pool"]
+    assert helpers.decode_bech32_bulk(bech32_strings=[v[2] for v in CIP5_VECTORS]) == [
+        v[1] for v in CIP5_VECTORS
+    ]
+
+
+def test_change_prefix():
+    stake_test = CIP5_VECTORS[5][2]
+    assert helpers.encode_bech32(prefix="stake", data=stake_test) == bech32.encode(
+        "stake", f"e0{STAKE_KEY_HASH}"
+    )
+
+
+@pytest.mark.parametrize("words", ([31], [0]))
+def test_invalid_padding(words: list):
+    # non-zero padding bits, or too many padding bits
+    checksum = bech32._create_checksum("a", words)
+    bech32_str = f"a1{''.join(bech32.CHARSET[w] for w in words + checksum)}"
+    with pytest.raises(ValueError, match="padding"):
+        bech32.decode(bech32_str)
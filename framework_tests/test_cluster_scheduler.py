@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+
+from cardano_node_tests.cluster_management import cluster_getter
+from cardano_node_tests.cluster_management import common
+from cardano_node_tests.cluster_management import resources_management
+
+NUM_OF_INSTANCES = 3
+
+
+@pytest.fixture
+def scheduler(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> cluster_getter.ClusterScheduler:
+    monkeypatch.setattr(cluster_getter.cluster_nodes, "set_cluster_env", lambda __: None)
+    _scheduler = cluster_getter.ClusterScheduler(
+        pytest_tmp_dir=tmp_path,
+        worker_id="gw0",
+        num_of_instances=NUM_OF_INSTANCES,
+        log_func=lambda __: None,
+    )
+    monkeypatch.setattr(_scheduler, "_is_healthy", lambda __: True)
+    for instance_num in range(NUM_OF_INSTANCES):
+        (tmp_path / f"{common.CLUSTER_DIR_TEMPLATE}{instance_num}").mkdir()
+        _scheduler.store.touch(instance_num=instance_num, name=common.CLUSTER_RUNNING_FILE)
+    return _scheduler
+
+
+def _get_instance(
+    scheduler: cluster_getter.ClusterScheduler,
+    lock_resources: resources_management.ResourcesType = (),
+) -> int:
+    """Run one scheduling step and return the selected cluster instance."""
+    cget_status = cluster_getter._ClusterGetStatus(
+        mark="",
+        lock_resources=lock_resources,
+        use_resources=(),
+        prio=False,
+        cleanup=False,
+        start_cmd="",
+        current_test="test_dummy",
+    )
+    assert scheduler._get_step(
+        cget_status=cget_status,
+        marked_tests_cache={},
+        available_instances=list(range(NUM_OF_INSTANCES)),
+    )
+    instance_num = scheduler.cluster_instance_num
+
+    # cleanup status records of this worker, so the step can be repeated
+    scheduler.store.unlink_glob(instance_num=instance_num, pattern="*_gw0")
+    scheduler._cluster_instance_num = -1
+
+    return instance_num
+
+
+def test_pick_least_loaded(scheduler: cluster_getter.ClusterScheduler):
+    for instance_num, worker_id in ((0, "gw1"), (1, "gw2"), (1, "gw3")):
+        scheduler.store.touch(
+            instance_num=instance_num, name=f"{common.TEST_RUNNING_GLOB}_{worker_id}"
+        )
+
+    selected = {_get_instance(scheduler) for __ in range(20)}
+    assert selected == {2}
+
+
+def test_pick_unblocked(scheduler: cluster_getter.ClusterScheduler):
+    scheduler.store.touch(instance_num=0, name=f"{common.TEST_RUNNING_GLOB}_gw1")
+    scheduler.store.touch(instance_num=1, name=f"{common.RESPIN_NEEDED_GLOB}_gw2")
+    scheduler.store.touch(instance_num=2, name=f"{common.RESOURCE_LOCKED_GLOB}_@@pool1@@_gw3")
+
+    selected = {_get_instance(scheduler, lock_resources=["pool1"]) for __ in range(20)}
+    assert selected == {0}
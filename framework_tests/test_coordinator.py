@@ -0,0 +1,92 @@
+import multiprocessing
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from cardano_node_tests.cluster_management import cluster_getter
+from cardano_node_tests.cluster_management import common
+from cardano_node_tests.cluster_management import coordinator_server
+
+MARK_RECORD = f"{common.TEST_CURR_MARK_GLOB}_@@mark1@@_gw1"
+MARKED_TEST_RECORD = f"{common.TEST_RUNNING_GLOB}_@@mark1@@_gw1"
+
+
+@pytest.fixture
+def health_checks(monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    checked: List[int] = []
+
+    def _is_healthy(_self: cluster_getter.ClusterScheduler, instance_num: int) -> bool:
+        checked.append(instance_num)
+        return True
+
+    monkeypatch.setattr(cluster_getter.ClusterScheduler, "_is_healthy", _is_healthy)
+    return checked
+
+
+@pytest.fixture
+def coord(tmp_path: Path, health_checks: List[int]) -> coordinator_server.Coordinator:
+    _coord = coordinator_server.Coordinator(pytest_tmp_dir=tmp_path, num_of_instances=1)
+    _coord.store.touch(instance_num=0, name=common.CLUSTER_RUNNING_FILE)
+    _coord.store.touch(instance_num=0, name=MARK_RECORD)
+    _coord.store.touch(instance_num=0, name=MARKED_TEST_RECORD)
+    # the resource needed by the waiting test is locked by other worker
+    _coord.store.touch(instance_num=0, name=f"{common.RESOURCE_LOCKED_GLOB}_@@pool1@@_gw3")
+
+    cget_status = cluster_getter._ClusterGetStatus(
+        mark="",
+        lock_resources=["pool1"],
+        use_resources=(),
+        prio=False,
+        cleanup=False,
+        start_cmd="",
+        current_test="test_dummy",
+    )
+    _coord.schedule(
+        conn=multiprocessing.Pipe()[0],
+        worker_id="gw2",
+        cget_status=cget_status,
+        marked_tests_cache={},
+        available_instances=[0],
+        cluster_instance_num=-1,
+    )
+    _coord._check_pending()
+    assert health_checks == [0]
+
+    # the marked test finished, the mark is kept for the next marked test for a while
+    _coord.store.unlink(instance_num=0, name=MARKED_TEST_RECORD)
+
+    return _coord
+
+
+def _change_records(coord: coordinator_server.Coordinator, count: int) -> None:
+    for i in range(count):
+        coord.store_op(
+            operation="touch",
+            kwargs={"instance_num": 0, "name": f"{common.RESOURCES_WAIT_GLOB}_{i}_gw4"},
+        )
+        coord._check_pending()
+
+
+def test_mark_survives_record_changes(coord: coordinator_server.Coordinator):
+    _change_records(coord=coord, count=50)
+    assert coord.store.exists(instance_num=0, name=MARK_RECORD)
+    assert len(coord._pending) == 1
+
+    # regular checks clear the mark when no marked test runs for a while
+    for __ in range(20):
+        coord._pending[0].check_at = time.time() - 1
+        coord._check_pending()
+    assert not coord.store.exists(instance_num=0, name=MARK_RECORD)
+
+
+def test_health_cache_kept(coord: coordinator_server.Coordinator, health_checks: List[int]):
+    _change_records(coord=coord, count=50)
+    assert health_checks == [0]
+
+    # the cluster instance was respun
+    coord.store.touch(instance_num=0, name=f"{common.RESPIN_IN_PROGRESS_GLOB}_gw1")
+    coord.store.unlink(instance_num=0, name=f"{common.RESPIN_IN_PROGRESS_GLOB}_gw1")
+    _change_records(coord=coord, count=1)
+    assert health_checks == [0, 0]
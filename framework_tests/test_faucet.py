@@ -0,0 +1,108 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+from typing import Tuple
+
+import pytest
+from cardano_clusterlib import clusterlib
+
+from cardano_node_tests.utils import clusterlib_utils
+from cardano_node_tests.utils import configuration
+from cardano_node_tests.utils import faucet
+
+DESTINATIONS = [clusterlib.TxOut(address="addr_test1dst", amount=1_000_000)]
+
+
+class _FakeTransaction:
+    def __init__(self) -> None:
+        self.sent: List[Tuple[str, List[clusterlib.TxOut]]] = []
+
+    def send_funds(
+        self,
+        src_address: str,
+        destinations: List[clusterlib.TxOut],
+        tx_name: str,
+        tx_files: clusterlib.TxFiles,
+        destination_dir: Path,
+    ) -> clusterlib.TxRawOutput:
+        self.sent.append((src_address, destinations))
+        out_file = Path(destination_dir) / f"{tx_name}_tx.body"
+        out_file.write_text(tx_name, encoding="utf-8")
+        return clusterlib.TxRawOutput(
+            txins=[],
+            txouts=destinations,
+            txouts_count=len(destinations),
+            tx_files=tx_files,
+            out_file=out_file,
+            fee=200_000,
+            build_args=[],
+        )
+
+
+@pytest.fixture
+def cluster_obj() -> SimpleNamespace:
+    return SimpleNamespace(g_transaction=_FakeTransaction())
+
+
+@pytest.fixture
+def faucet_data(tmp_path: Path) -> dict:
+    payment = clusterlib.AddressRecord(
+        address="addr_test1faucet",
+        vkey_file=tmp_path / "faucet.vkey",
+        skey_file=tmp_path / "faucet.skey",
+    )
+    return {"payment": payment}
+
+
+@pytest.fixture
+def batching(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(configuration, "FAUCET_BATCHING", True)
+    monkeypatch.setattr(configuration, "IS_XDIST", True)
+    monkeypatch.setattr(faucet, "_BATCHES_ROOT", [])
+
+
+def _fund(cluster_obj: SimpleNamespace, faucet_data: dict, dst_dir: Path) -> clusterlib.TxRawOutput:
+    dst_addr = clusterlib.AddressRecord(
+        address="addr_test1dst", vkey_file=Path("dst.vkey"), skey_file=Path("dst.skey")
+    )
+    tx_raw_output = clusterlib_utils.fund_from_faucet(
+        dst_addr,
+        cluster_obj=cluster_obj,  # type: ignore
+        faucet_data=faucet_data,
+        amount=1_000_000,
+        tx_name="test_fund",
+        destination_dir=dst_dir,
+        force=True,
+    )
+    assert tx_raw_output
+    return tx_raw_output
+
+
+@pytest.mark.usefixtures("batching")
+def test_batching_without_session(cluster_obj: SimpleNamespace, faucet_data: dict, tmp_path: Path):
+    # e.g. in the standby respin process, where the pytest session fixture doesn't run
+    tx_raw_output = _fund(cluster_obj=cluster_obj, faucet_data=faucet_data, dst_dir=tmp_path)
+
+    assert cluster_obj.g_transaction.sent == [("addr_test1faucet", DESTINATIONS)]
+    assert tx_raw_output.txouts == DESTINATIONS
+    assert not list(tmp_path.rglob(faucet.FUNDING_BATCHES_DIR))
+
+
+@pytest.mark.usefixtures("batching")
+def test_batching(
+    cluster_obj: SimpleNamespace,
+    faucet_data: dict,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    root_tmp = tmp_path / "root"
+    root_tmp.mkdir()
+    monkeypatch.setattr(faucet, "_BATCHES_ROOT", [root_tmp])
+
+    tx_raw_output = _fund(cluster_obj=cluster_obj, faucet_data=faucet_data, dst_dir=tmp_path)
+
+    assert cluster_obj.g_transaction.sent == [("addr_test1faucet", DESTINATIONS)]
+    assert tx_raw_output.txouts == DESTINATIONS
+    assert tx_raw_output.out_file == tmp_path / "test_fund_funding_tx.body"
+    assert tx_raw_output.out_file.exists()
+    assert (root_tmp / faucet.FUNDING_BATCHES_DIR / "addr_test1faucet").is_dir()
@@ -0,0 +1,74 @@
+import copy
+import io
+import json
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import pytest
+
+from cardano_node_tests.utils import json_stream
+
+LEDGER_STATE_FILE = Path(__file__).parent / "data" / "ledger_state.json"
+
+DROP_PATHS: List[List[Tuple[str, ...]]] = [
+    [],
+    [("stateBefore", "esLState")],
+    [("stateBefore", "esLState"), ("stateBefore", "esNonMyopic"), ("blocksBefore",)],
+    [("stateBefore", "esSnapshots", "pstakeMark")],
+    [
+        ("unicode", "klíč", "\u0437\u043d\u0430\u0447\u0435\u043d\u0438\u0435"),
+        ("unicode", "žluťoučký 🐎"),
+    ],
+    [("unicode", 'key with "quotes"', "drop\tme"), ("unicode", "🚀")],
+    [("lastEpoch", "nonexistent"), ("nonexistent",)],
+]
+
+
+def _drop(doc: Dict[str, Any], drop_paths: List[Tuple[str, ...]]) -> Dict[str, Any]:
+    """Return copy of the decoded document without object members on `drop_paths`."""
+    filtered = copy.deepcopy(doc)
+    for path in drop_paths:
+        parent: Any = filtered
+        for key in path[:-1]:
+            parent = parent.get(key) if isinstance(parent, dict) else None
+        if isinstance(parent, dict):
+            parent.pop(path[-1], None)
+    return filtered
+
+
+@pytest.fixture(scope="module")
+def ledger_state_text() -> str:
+    return LEDGER_STATE_FILE.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("drop_paths", DROP_PATHS)
+@pytest.mark.parametrize("chunk_size", (1, 2, 7, 64, 1024 * 1024))
+@pytest.mark.parametrize("compact", (False, True))
+def test_filter_json(
+    ledger_state_text: str,
+    drop_paths: List[Tuple[str, ...]],
+    chunk_size: int,
+    compact: bool,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(json_stream, "CHUNK_SIZE", chunk_size)
+
+    doc = json.loads(ledger_state_text)
+    text = json.dumps(doc, separators=(",", ":")) if compact else ledger_state_text
+
+    out = json_stream.filter_json(stream=io.StringIO(text), drop_paths=drop_paths)
+    assert json.loads(out) == _drop(doc=doc, drop_paths=drop_paths)
+
+
+def test_filter_json_empty():
+    assert not json_stream.filter_json(stream=io.StringIO(" \n"), drop_paths=[("a",)])
+
+
+@pytest.mark.parametrize("text", ('{"a": {"b": 1}', '{"a": "b', '{"a" 1}'))
+def test_filter_json_invalid(text: str, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(json_stream, "CHUNK_SIZE", 2)
+    with pytest.raises(ValueError, match="Unexpected end|Expected"):
+        json_stream.filter_json(stream=io.StringIO(text), drop_paths=[("a", "b")])
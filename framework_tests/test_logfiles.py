@@ -0,0 +1,150 @@
+import os
+import random
+import re
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Pattern
+
+import pytest
+
+from cardano_node_tests.utils import cluster_nodes
+from cardano_node_tests.utils import logfiles
+
+NUM_LINES = 300_000
+
+INFO_LINE = (
+    "[pool1:cardano.node.ChainDB:Info:5] [2023-01-01 00:00:00.00 UTC] Chain extended, "
+    "new tip: {hash} at slot {slot}\n"
+)
+ERROR_LINES = (
+    "[pool1:cardano.node.Forge:Error:5] [2023-01-01 00:00:00.00 UTC] :error: forge {slot}\n",
+    "[pool1:cardano.node.Mempool:Notice:5] [2023-01-01 00:00:00.00 UTC] FAILED tx {slot}\n",
+    "[pool1:cardano.node.ChainDB:Error:5] [2023-01-01 00:00:00.00 UTC] Failure {slot}\n",
+    # ignored errors
+    "[pool1:cardano.node.IpSubscription:Error:5] Connection Attempt Exception, failed {slot}\n",
+    "[pool1:cardano.node.ChainDB:Error:5] custom ignored failure {slot}\n",
+    # ignored only when preceded by "Switched to a fork"
+    "[pool1:cardano.node.LeadershipCheck:Error:5] TraceNoLedgerState failed {slot}\n",
+)
+FORK_LINE = "[pool1:cardano.node.ChainDB:Notice:5] Switched to a fork, new tip: {hash}\n"
+
+
+def _gen_log(logfile: Path, num_lines: int, seed: int) -> None:
+    """Write a node log with sparse errors."""
+    rnd = random.Random(seed)
+    lines = []
+    for slot in range(num_lines):
+        if rnd.random() < 0.0005:
+            if rnd.random() < 0.3:
+                lines.append(FORK_LINE.format(hash=f"{rnd.getrandbits(256):064x}"))
+            lines.append(rnd.choice(ERROR_LINES).format(slot=slot))
+        else:
+            lines.append(INFO_LINE.format(hash=f"{rnd.getrandbits(256):064x}", slot=slot))
+
+    with open(logfile, "a", encoding="utf-8") as outfile:
+        outfile.write("".join(lines))
+
+
+def _search_line_by_line(logfile: Path, seek: int, ignore_re: Pattern[str]) -> List[str]:
+    """Search the log file line by line, the same way as the original implementation."""
+    errors = []
+    look_back_buf = [""] * logfiles.ERRORS_LOOK_BACK_LINES
+    with open(logfile, encoding="utf-8") as infile:
+        infile.seek(seek)
+        for line in infile:
+            look_back_buf.append(line)
+            look_back_buf.pop(0)
+            if logfiles.ERRORS_RE.search(line) and not ignore_re.search(line):
+                if logfiles.ERRORS_LOOK_BACK_RE.search(line) and logfiles._look_back_found(
+                    look_back_buf
+                ):
+                    continue
+                errors.append(line)
+    return errors
+
+
+@pytest.fixture
+def state_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cluster_env = cluster_nodes.ClusterEnv(
+        socket_path=tmp_path / "bft1.socket",
+        state_dir=tmp_path,
+        work_dir=tmp_path,
+        instance_num=0,
+        cluster_era="",
+        tx_era="",
+    )
+    monkeypatch.setattr(cluster_nodes, "get_cluster_env", lambda: cluster_env)
+
+    (tmp_path / f"{logfiles.ERRORS_IGNORE_FILE_NAME}_test").write_text(
+        "pool1.std*;;custom ignored\n", encoding="utf-8"
+    )
+    _gen_log(logfile=tmp_path / "pool1.stdout", num_lines=NUM_LINES, seed=1)
+    return tmp_path
+
+
+def _get_ignore_re(state_dir: Path) -> Pattern[str]:
+    regex = logfiles._get_ignore_regex(
+        ignore_rules=logfiles._get_ignore_rules(cluster_env=cluster_nodes.get_cluster_env()),
+        regexes=logfiles.ERRORS_IGNORED,
+        logfile=state_dir / "pool1.stdout",
+    )
+    return re.compile(regex)
+
+
+def _search() -> List[str]:
+    return [e[1] for e in logfiles.search_cluster_logs()]
+
+
+def _timed(func: Callable[..., Any], **kwargs: Any) -> float:
+    start = time.perf_counter()
+    func(**kwargs)
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("chunk_size", (None, 64 * 1024))
+def test_search_cluster_logs(
+    state_dir: Path, chunk_size: Optional[int], monkeypatch: pytest.MonkeyPatch
+):
+    if chunk_size:
+        monkeypatch.setattr(logfiles, "SEARCH_CHUNK_SIZE", chunk_size)
+    logfile = state_dir / "pool1.stdout"
+    ignore_re = _get_ignore_re(state_dir)
+
+    expected = _search_line_by_line(logfile=logfile, seek=0, ignore_re=ignore_re)
+    assert expected
+    assert _search() == expected
+
+    # only the new lines are searched next time
+    seek = logfile.stat().st_size
+    _gen_log(logfile=logfile, num_lines=20_000, seed=2)
+    offset_mtime = (state_dir / ".pool1.stdout.offset").stat().st_mtime
+    os.utime(logfile, (offset_mtime + 1, offset_mtime + 1))
+
+    expected_new = _search_line_by_line(logfile=logfile, seek=seek, ignore_re=ignore_re)
+    assert expected_new
+    assert _search() == expected_new
+
+
+def test_search_cluster_logs_speed(state_dir: Path):
+    logfile = state_dir / "pool1.stdout"
+    ignore_re = _get_ignore_re(state_dir)
+
+    # the log is in page cache for both searches
+    line_by_line_sec = _timed(_search_line_by_line, logfile=logfile, seek=0, ignore_re=ignore_re)
+    search_sec = _timed(_search)
+    assert search_sec < line_by_line_sec / 3, (
+        f"Searching {logfile.stat().st_size} bytes took {search_sec:.3f} s, "
+        f"line by line {line_by_line_sec:.3f} s."
+    )
+
+    # the per-test cost doesn't depend on the size of the already searched log
+    with open(logfile, "a", encoding="utf-8") as outfile:
+        outfile.write(ERROR_LINES[0].format(slot=NUM_LINES))
+    offset_mtime = (state_dir / ".pool1.stdout.offset").stat().st_mtime
+    os.utime(logfile, (offset_mtime + 1, offset_mtime + 1))
+    incremental_sec = _timed(_search)
+    assert incremental_sec < search_sec / 10
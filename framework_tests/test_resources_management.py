@@ -54,3 +54,27 @@ def test_oneof_empty():
         resources=resources_to_use, unavailable=resources_locked
     )
     assert len(selected) == 0
+
+
+def test_get_unavailable_named():
+    unavailable = resources_management.get_unavailable(
+        resources=["pool1", "pool2", resources_management.OneOf(ALL_POOLS)],
+        unavailable=["pool2", "pool3"],
+    )
+    assert unavailable == ["pool2"]
+
+
+def test_get_unavailable_oneof():
+    unavailable = resources_management.get_unavailable(
+        resources=[resources_management.OneOf(["pool1", "pool2"])],
+        unavailable=["pool1", "pool2", "pool3"],
+    )
+    assert unavailable == ["pool1", "pool2"]
+
+
+def test_get_unavailable_none():
+    unavailable = resources_management.get_unavailable(
+        resources=["pool1", resources_management.OneOf(ALL_POOLS)],
+        unavailable=["pool2", "pool3"],
+    )
+    assert not unavailable